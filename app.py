@@ -1,8 +1,8 @@
 # app.py
 # 학술 논문 검색 대시보드 (Semantic Scholar + OpenAlex)
 
+import numpy as np
 import streamlit as st
-import pandas as pd
 import plotly.express as px
 from datetime import datetime
 
@@ -14,8 +14,14 @@ from config.keywords import (
     KEYWORD_EXPANSIONS, RESEARCH_PRESETS,
     expand_keywords
 )
-from utils.search import search_and_filter
-from utils.export import to_csv, to_bibtex, get_summary_stats
+from utils.search import stream_search, clear_search_cache, get_search_cache_stats
+from utils.export import EXPORT_FORMATS, fingerprint_papers, get_export, peek_export, load_results, aggregate_results
+from utils.cache import get_response_cache, get_cache_stats
+from utils.corpus import get_corpus
+from utils.enrich import get_enrichment_store
+from utils.watch import run_watch
+from utils.resultset import ResultSet
+from utils.metrics import Trace, finish_trace, span, start_trace
 
 st.set_page_config(page_title="📚 Research Paper Tracker", page_icon="📚", layout="wide", initial_sidebar_state="expanded")
 
@@ -29,13 +35,127 @@ st.markdown("""
 """, unsafe_allow_html=True)
 
 if "search_results" not in st.session_state:
-    st.session_state.search_results = []
+    st.session_state.search_results = ResultSet.from_dicts([])
 if "search_executed" not in st.session_state:
     st.session_state.search_executed = False
+if "result_index" not in st.session_state:
+    st.session_state.result_index = None
+if "search_trace" not in st.session_state:
+    st.session_state.search_trace = None
+if "result_charts" not in st.session_state:
+    st.session_state.result_charts = None
+
+# 논문 목록 정렬 옵션 (None = 검색 결과 기본 순서: 우선순위 > 인용수)
+SORT_OPTIONS = ["우선순위 (기본)", "인용수 (높은 순)", "연도 (최신 순)", "연도 (오래된 순)"]
+PAGE_SIZES = [10, 20, 50, 100]
+
+# 검색 중 미리 보여 줄 High Priority 논문 수
+STREAM_PREVIEW_COUNT = 10
+
+def build_result_index(results):
+    """정렬 기준별 위치 순서와 우선순위 배열을 한 번만 계산 (rerun마다 결과를 다시 정렬하지 않음)"""
+    return {
+        "key": st.session_state.get("results_key") or fingerprint_papers(results),
+        "orders": {
+            "우선순위 (기본)": np.arange(len(results)),
+            "인용수 (높은 순)": results.argsort("citations", descending=True),
+            "연도 (최신 순)": results.argsort("year", descending=True, missing=0),
+            "연도 (오래된 순)": results.argsort("year", missing=9999),
+        },
+    }
+
+def get_result_index(results):
+    """결과가 바뀐 경우(검색 시 계산해 둔 해시가 다를 때)에만 인덱스를 다시 만듦"""
+    results_key = st.session_state.get("results_key") or fingerprint_papers(results)
+    index = st.session_state.result_index
+    if index is None or index["key"] != results_key:
+        index = build_result_index(results)
+        st.session_state.result_index = index
+    return index
+
+def build_charts(results):
+    """집계 결과(aggregate_results)로 시각화 탭 Plotly 그림을 만듦"""
+    charts = aggregate_results(results)["charts"]
+    figures = {}
+    if charts["year"]["x"]:
+        figures["year"] = px.bar(x=charts["year"]["x"], y=charts["year"]["y"], labels={"x": "연도", "y": "논문 수"})
+        figures["year"].update_layout(showlegend=False, height=300)
+    
+    priority = charts["priority"]
+    figures["priority"] = px.pie(values=priority["values"], names=priority["names"], color=priority["names"], color_discrete_map={"High": "#2ca02c", "Medium": "#ff7f0e", "Low": "#1f77b4"})
+    figures["priority"].update_layout(height=300)
+    
+    figures["source"] = px.pie(values=charts["source"]["values"], names=charts["source"]["names"])
+    figures["source"].update_layout(height=300)
+    
+    if charts["top_cited"]["x"]:
+        figures["top_cited"] = px.bar(x=charts["top_cited"]["x"], y=charts["top_cited"]["y"], orientation="h", labels={"x": "인용수", "y": ""})
+        figures["top_cited"].update_layout(height=350, yaxis={"categoryorder": "total ascending"})
+    
+    if charts["venue"]["x"]:
+        figures["venue"] = px.bar(x=charts["venue"]["x"], y=charts["venue"]["y"], orientation="h", labels={"x": "논문 수", "y": ""})
+        figures["venue"].update_layout(height=450, yaxis={"categoryorder": "total ascending"})
+    return figures
+
+def get_charts(results):
+    """결과가 바뀐 경우에만 그림을 다시 만듦 (탭을 오가도 집계/직렬화를 반복하지 않음)"""
+    results_key = st.session_state.get("results_key") or fingerprint_papers(results)
+    cached = st.session_state.result_charts
+    if cached is None or cached["key"] != results_key:
+        cached = {"key": results_key, "figures": build_charts(results)}
+        st.session_state.result_charts = cached
+    return cached["figures"]
+
+SOURCE_LABELS = {"semantic": "Semantic Scholar", "openalex": "OpenAlex"}
+
+def describe_missing(missing):
+    """meta["missing"] 목록을 "Semantic Scholar 2페이지 (HTTP 503), OpenAlex 전체 (deadline)" 형태로 요약"""
+    parts = []
+    for entry in missing:
+        where = "전체" if entry["page"] is None else f"{entry['page'] + 1}페이지"
+        part = f"{SOURCE_LABELS.get(entry['source'], entry['source'])} {where} ({entry['reason']})"
+        if part not in parts:
+            parts.append(part)
+    return ", ".join(parts)
+
+def render_stream_preview(update, high_papers):
+    """검색 중간 상태: 지금까지 받은/관련 논문 수와 인용수 상위 High Priority 논문"""
+    counts = update["counts"]
+    st.caption(
+        f"⏳ 받은 논문 {counts['fetched']}개 · 관련 논문 {counts['relevant']}개 "
+        f"(High {counts['High']} · Medium {counts['Medium']} · Low {counts['Low']}) — 나머지 페이지를 받는 중..."
+    )
+    for paper in high_papers:
+        st.markdown(f"🟢 **{paper['title'][:80]}{'...' if len(paper['title']) > 80 else ''}** | {paper['year']} | {paper['venue']} | Cited: {paper['citations']}")
+
+def _span_rows(summary):
+    return [
+        {"단계": name, "횟수": s["count"], "합계 (ms)": s["ms"], "최대 (ms)": s["max_ms"]}
+        for name, s in sorted(summary["spans"].items(), key=lambda item: -item[1]["ms"])
+    ]
+
+def render_performance(search_summary, render_summary):
+    """마지막 검색과 이번 화면 그리기의 단계별 시간/요청 카운터 표시"""
+    if search_summary:
+        counters = search_summary["counters"]
+        col1, col2, col3, col4, col5 = st.columns(5)
+        col1.metric("검색 시간", f"{search_summary['ms'] / 1000:.2f}s")
+        col2.metric("API 요청", int(counters.get("http.requests", 0)))
+        col3.metric("재시도", int(counters.get("http.retries", 0)))
+        col4.metric("받은 데이터", f"{counters.get('http.bytes', 0) / 1024:.0f} KB")
+        col5.metric("캐시 적중", f"{int(counters.get('cache.hits', 0))}/{int(counters.get('cache.hits', 0) + counters.get('cache.misses', 0))}")
+        st.markdown("**검색 단계** (병렬 단계는 합계가 전체 시간보다 클 수 있음)")
+        st.dataframe(_span_rows(search_summary), use_container_width=True, hide_index=True)
+    else:
+        st.caption("이번 세션에서 실행한 검색이 없습니다 (불러온 결과 등).")
+    st.markdown(f"**화면 그리기** ({render_summary['ms']:.0f} ms)")
+    st.dataframe(_span_rows(render_summary), use_container_width=True, hide_index=True)
 
 keywords = []
 selected_expansions = {}
 search_keywords = []
+use_fanout = False
+use_watch = False
 
 with st.sidebar:
     st.markdown("## 🔍 검색 설정")
@@ -73,6 +193,11 @@ with st.sidebar:
         st.info(f"📝 {preset_data['description']}")
         keywords = preset_data["keywords"]
         st.write("**포함 키워드:**", ", ".join(keywords))
+        use_watch = st.checkbox(
+            "🔔 지난 검색 이후 새 논문만 가져오기",
+            value=False,
+            help="이 주제의 지난 결과를 저장해 두고, 다음부터는 새로 출판된 논문만 받아 합친 뒤 인용수를 일괄 갱신합니다"
+        )
     
     if search_mode == "스마트 확장" and keywords:
         st.markdown("### 🔄 확장된 키워드")
@@ -86,6 +211,11 @@ with st.sidebar:
                 selected_expansions[original] = selected
         for terms in selected_expansions.values():
             search_keywords.extend(terms)
+        use_fanout = st.checkbox(
+            "🔀 키워드 그룹별 병렬 검색",
+            value=True,
+            help="확장 키워드를 그룹별 하위 쿼리로 나눠 동시에 검색한 뒤 순위를 합칩니다 (요청 예산보다 그룹이 많으면 일부 그룹을 하나의 쿼리로 묶음)"
+        )
     else:
         search_keywords = keywords.copy()
     
@@ -102,6 +232,11 @@ with st.sidebar:
     
     st.markdown("**[Track B] 확장 저널**")
     include_extended = st.checkbox("리스트 외 Q1 저널 포함", value=False)
+    journals_only = st.checkbox(
+        "🎯 선택한 저널 논문만 검색",
+        value=False,
+        help="저널 조건을 API 필터로 전달해 관련 없는 논문을 내려받지 않습니다 (핵심 저널 매칭 논문만 표시)"
+    )
     
     st.markdown("---")
     st.markdown("### ⚙️ 필터 옵션")
@@ -113,9 +248,57 @@ with st.sidebar:
     
     min_citations = st.slider("최소 인용수", 0, 100, 0)
     max_results = st.slider("최대 결과 수", 10, 300, 100)  # 기본값 100으로 증가
+    max_pages = st.slider(
+        "소스당 최대 페이지 수", 0, 10, 0,
+        help="결과 수에 맞춘 페이지(2~3쪽)보다 깊이 받습니다. 관련 논문 비율이 떨어지면 일찍 멈춥니다 (0 = 결과 수에 맞춤)"
+    )
+    search_deadline = st.slider(
+        "응답 시간 제한 (초)", 0, 60, 15,
+        help="이 시간 안에 도착한 결과만 먼저 보여줍니다 (0 = 제한 없음). 빠진 소스/페이지는 결과 위에 표시됩니다"
+    )
     
     st.markdown("---")
     search_button = st.button("🔍 검색 시작", type="primary", use_container_width=True)
+    
+    if "parquet" in EXPORT_FORMATS:
+        st.markdown("---")
+        st.markdown("### 📂 저장된 결과 불러오기")
+        uploaded = st.file_uploader("Parquet/Arrow 파일", type=["parquet", "arrow", "feather"], help="내보내기 탭에서 저장한 결과를 API 호출 없이 다시 엽니다")
+        if uploaded is not None and st.session_state.get("loaded_file") != uploaded.file_id:
+            loaded = ResultSet.from_dicts(load_results(uploaded.getvalue()))
+            st.session_state.loaded_file = uploaded.file_id
+            st.session_state.search_results = loaded
+            st.session_state.results_key = fingerprint_papers(loaded)
+            st.session_state.search_executed = True
+    
+    st.markdown("---")
+    st.markdown("### 💾 응답 캐시")
+    cache_status = st.empty()
+    if st.button("캐시 비우기", use_container_width=True):
+        response_cache = get_response_cache()
+        if response_cache is not None:
+            response_cache.clear()
+        clear_search_cache()
+        enrichment_store = get_enrichment_store()
+        if enrichment_store is not None:
+            enrichment_store.clear()
+    
+    st.markdown("### 🗄️ 로컬 코퍼스")
+    use_corpus = st.checkbox(
+        "받아 둔 논문에서 먼저 검색",
+        value=True,
+        help="같은 키워드로 이미 받은 연도 범위는 로컬 색인에서 바로 찾고, 새 범위만 API로 요청합니다"
+    )
+    use_enrich = st.checkbox(
+        "빈 초록/PDF 링크 채우기",
+        value=True,
+        help="한 소스에서 초록이나 PDF 링크가 빠진 논문을 다른 소스에서 DOI로 한 번에 조회해 채웁니다 (논문마다 한 번만 조회)"
+    )
+    corpus_status = st.empty()
+    if st.button("코퍼스 비우기", use_container_width=True):
+        corpus = get_corpus()
+        if corpus is not None:
+            corpus.clear()
 
 # 메인 영역
 st.markdown('<p class="main-header">📚 Research Paper Tracker</p>', unsafe_allow_html=True)
@@ -137,19 +320,54 @@ if search_button:
                 source_name = {"both": "통합", "semantic": "Semantic Scholar", "openalex": "OpenAlex"}[search_source]
                 st.info(f"🔍 검색: {', '.join(search_keywords[:3])}{'...' if len(search_keywords) > 3 else ''} | 📡 {source_name} | 📅 {year_start}-{year_end}")
                 
-                results = search_and_filter(
-                    keywords=search_keywords,
-                    target_journals=target_journals,
+                search_options = dict(
                     extended_journals=extended_journals,
                     year_start=int(year_start),
-                    year_end=int(year_end),
                     min_citations=int(min_citations),
                     include_extended=include_extended,
                     limit=int(max_results),
-                    search_source=search_source
+                    max_pages=int(max_pages) or None,
+                    search_source=search_source,
+                    journals_only=journals_only,
+                    query_groups=list(selected_expansions.values()) if use_fanout else None,
+                    enrich=use_enrich
                 )
+                # API 요청/파싱/중복 제거/관련성 판정 등 단계별 시간은 search_trace에 모임
+                with start_trace("app.search", source=search_source, watch=use_watch) as search_trace:
+                    if use_watch:
+                        watch = run_watch(preset_option, search_keywords, target_journals, **search_options)
+                        results = ResultSet.from_dicts(watch["results"])
+                        run_info = watch["run"]
+                        if run_info["mode"] == "incremental":
+                            st.info(
+                                f"🔔 증분 업데이트: 새 논문 {run_info['new']}개, 인용수 갱신 {run_info['citations_updated']}개 "
+                                f"(API 요청 {run_info['requests']}회)"
+                            )
+                    else:
+                        # 페이지가 도착하는 대로 High Priority 논문과 진행 수를 먼저 보여 주고, 끝나면 최종 결과로 교체
+                        preview = st.empty()
+                        high_papers = []
+                        for update in stream_search(
+                            keywords=search_keywords,
+                            target_journals=target_journals,
+                            year_end=int(year_end),
+                            use_corpus=use_corpus,
+                            deadline=float(search_deadline) or None,
+                            **search_options
+                        ):
+                            if update["done"]:
+                                results = update["results"]
+                                break
+                            new_high = [p for p in update["papers"] if p["priority"] == "High"]
+                            if new_high:
+                                high_papers = sorted(high_papers + new_high, key=lambda p: -(p["citations"] or 0))[:STREAM_PREVIEW_COUNT]
+                            with preview.container():
+                                render_stream_preview(update, high_papers)
+                        preview.empty()
+                st.session_state.search_trace = search_trace.to_dict()
                 
                 st.session_state.search_results = results
+                st.session_state.results_key = fingerprint_papers(results)
                 st.session_state.search_executed = True
                 
                 if results:
@@ -157,46 +375,95 @@ if search_button:
                     ss_count = len([r for r in results if r.get("source") == "Semantic Scholar"])
                     oa_count = len([r for r in results if r.get("source") == "OpenAlex"])
                     st.success(f"✅ {len(results)}개 논문 발견! (Semantic Scholar: {ss_count}개, OpenAlex: {oa_count}개)")
+                elif results.meta.get("partial"):
+                    st.warning(f"⏱️ 제한 시간 안에 받은 결과가 없습니다 ({describe_missing(results.meta['missing'])}). 잠시 후 다시 시도하거나 응답 시간 제한을 늘려보세요.")
                 else:
                     st.warning("⚠️ 검색 결과가 없습니다. 다른 키워드나 연도 범위를 시도해보세요.")
             except Exception as e:
                 st.error(f"❌ 오류 발생: {str(e)}")
-                st.session_state.search_results = []
+                st.session_state.search_results = ResultSet.from_dicts([])
+                st.session_state.results_key = None
+
+cache_stats = get_cache_stats()
+search_cache_stats = get_search_cache_stats()
+cache_status.caption(
+    f"적중 {cache_stats['hits']} · 미스 {cache_stats['misses']} ({cache_stats['hit_rate']:.0%}) | "
+    f"{cache_stats['entries']}개 항목, {cache_stats['bytes'] / 1024 / 1024:.1f} MB  \n"
+    f"공유 검색 결과 {search_cache_stats['entries']}개 | 재사용 {search_cache_stats['hits']}회 · "
+    f"동시 요청 합침 {search_cache_stats['coalesced']}회"
+)
+corpus_lines = []
+corpus = get_corpus()
+if corpus is not None:
+    corpus_stats = corpus.stats()
+    corpus_lines.append(f"논문 {corpus_stats['papers']:,}편 | 저장된 검색 {corpus_stats['queries']}개")
+enrichment_store = get_enrichment_store()
+if enrichment_store is not None:
+    enrichment_stats = enrichment_store.stats()
+    corpus_lines.append(f"초록/PDF 보강 조회 {enrichment_stats['entries']:,}건 (채움 {enrichment_stats['filled']:,}건)")
+if corpus_lines:
+    corpus_status.caption("  \n".join(corpus_lines))
 
 results = st.session_state.search_results
+if not isinstance(results, ResultSet):
+    results = st.session_state.search_results = ResultSet.from_dicts(results)
 
 if results:
-    stats = get_summary_stats(results)
-    st.markdown("### 📊 검색 결과 요약")
-    col1, col2, col3, col4, col5 = st.columns(5)
-    col1.metric("총 논문 수", stats["total"])
-    col2.metric("High Priority", stats["high_priority"])
-    col3.metric("Medium Priority", stats["medium_priority"])
-    col4.metric("Low Priority", stats.get("low_priority", 0))
-    col5.metric("평균 인용수", stats["avg_citations"])
+    # 이번 rerun의 화면 그리기 시간 (탭별)
+    render_trace = Trace("app.render", papers=len(results))
+    with span("render.summary", render_trace):
+        stats = aggregate_results(results)["stats"]
+        st.markdown("### 📊 검색 결과 요약")
+        if results.meta.get("partial"):
+            st.warning(
+                f"⏱️ 일부 결과만 표시 중입니다. 받지 못한 부분: {describe_missing(results.meta['missing'])} "
+                "— 잠시 후 다시 검색하면 나머지를 받아옵니다."
+            )
+        col1, col2, col3, col4, col5 = st.columns(5)
+        col1.metric("총 논문 수", stats["total"])
+        col2.metric("High Priority", stats["high_priority"])
+        col3.metric("Medium Priority", stats["medium_priority"])
+        col4.metric("Low Priority", stats.get("low_priority", 0))
+        col5.metric("평균 인용수", stats["avg_citations"])
     
     st.markdown("---")
     tab1, tab2, tab3 = st.tabs(["📄 논문 목록", "📈 시각화", "💾 내보내기"])
     
-    with tab1:
+    with tab1, span("render.list", render_trace):
         col1, col2 = st.columns([1, 1])
         with col1:
-            sort_option = st.selectbox("정렬 기준", ["우선순위 (기본)", "인용수 (높은 순)", "연도 (최신 순)", "연도 (오래된 순)"])
+            sort_option = st.selectbox("정렬 기준", SORT_OPTIONS)
         with col2:
             filter_priority = st.multiselect("Priority 필터", ["High", "Medium", "Low"], default=["High", "Medium", "Low"])
         
-        sorted_results = [r for r in results if r["priority"] in filter_priority]
+        # 정렬/필터는 미리 계산한 위치 순서로 처리하고, 현재 페이지 논문만 위젯으로 그림
+        result_index = get_result_index(results)
+        order = result_index["orders"][sort_option]
+        visible_positions = order[results.isin("priority", filter_priority)[order]]
         
-        if sort_option == "인용수 (높은 순)":
-            sorted_results.sort(key=lambda x: x["citations"], reverse=True)
-        elif sort_option == "연도 (최신 순)":
-            sorted_results.sort(key=lambda x: x["year"] or 0, reverse=True)
-        elif sort_option == "연도 (오래된 순)":
-            sorted_results.sort(key=lambda x: x["year"] or 9999)
+        col1, col2, col3 = st.columns([1, 1, 2])
+        with col1:
+            page_size = st.selectbox("페이지당 논문 수", PAGE_SIZES, index=1)
+        total_pages = max(1, -(-len(visible_positions) // page_size))
         
-        st.markdown(f"**표시 중: {len(sorted_results)}개 논문**")
+        # 결과/정렬/필터/페이지 크기가 바뀌면 첫 페이지로
+        view_signature = (result_index["key"], sort_option, tuple(filter_priority), page_size)
+        if st.session_state.get("result_view") != view_signature:
+            st.session_state.result_view = view_signature
+            st.session_state.result_page = 1
+        st.session_state.result_page = min(st.session_state.get("result_page", 1), total_pages)
+        with col2:
+            page = st.number_input("페이지 이동", min_value=1, max_value=total_pages, step=1, key="result_page")
         
-        for paper in sorted_results:
+        page_positions = visible_positions[(page - 1) * page_size:page * page_size]
+        with col3:
+            st.markdown(
+                f"**표시 중: {len(visible_positions)}개 논문** "
+                f"({(page - 1) * page_size + 1 if len(page_positions) else 0}-{(page - 1) * page_size + len(page_positions)}번째, "
+                f"{page}/{total_pages} 페이지)"
+            )
+        
+        for paper in results.take(page_positions):
             priority_color = {"High": "🟢", "Medium": "🟡", "Low": "🔵"}.get(paper["priority"], "⚪")
             
             with st.expander(f"{priority_color} **{paper['title'][:80]}{'...' if len(paper['title']) > 80 else ''}** | {paper['year']} | Cited: {paper['citations']}", expanded=False):
@@ -210,6 +477,8 @@ if results:
                 with col2:
                     st.markdown(f"**Priority:** {paper['priority']}")
                     st.markdown(f"**Track:** {paper['track']}")
+                    if paper.get("matched_keywords"):
+                        st.markdown(f"**매칭 키워드:** {', '.join(paper['matched_keywords'])}")
                     st.markdown(f"<span class='source-badge'>{paper.get('source', 'N/A')}</span>", unsafe_allow_html=True)
                 
                 st.markdown("**초록:**")
@@ -222,61 +491,55 @@ if results:
                 if paper['pdf_url']:
                     col2.markdown(f"[📥 PDF 다운로드]({paper['pdf_url']})")
     
-    with tab2:
+    with tab2, span("render.charts", render_trace):
+        charts = get_charts(results)
         col1, col2 = st.columns(2)
         with col1:
             st.markdown("#### 📅 연도별 논문 수")
-            year_data = [r["year"] for r in results if r["year"] and r["year"] != "N/A"]
-            if year_data:
-                year_counts = pd.Series(year_data).value_counts().sort_index()
-                fig_year = px.bar(x=year_counts.index, y=year_counts.values, labels={"x": "연도", "y": "논문 수"})
-                fig_year.update_layout(showlegend=False, height=300)
-                st.plotly_chart(fig_year, use_container_width=True)
+            if "year" in charts:
+                st.plotly_chart(charts["year"], use_container_width=True)
         
         with col2:
             st.markdown("#### 🎯 Priority 분포")
-            priority_counts = pd.Series([r["priority"] for r in results]).value_counts()
-            fig_priority = px.pie(values=priority_counts.values, names=priority_counts.index, color=priority_counts.index, color_discrete_map={"High": "#2ca02c", "Medium": "#ff7f0e", "Low": "#1f77b4"})
-            fig_priority.update_layout(height=300)
-            st.plotly_chart(fig_priority, use_container_width=True)
+            st.plotly_chart(charts["priority"], use_container_width=True)
         
         col1, col2 = st.columns(2)
         with col1:
             st.markdown("#### 📡 검색 소스 분포")
-            source_counts = pd.Series([r.get("source", "Unknown") for r in results]).value_counts()
-            fig_source = px.pie(values=source_counts.values, names=source_counts.index)
-            fig_source.update_layout(height=300)
-            st.plotly_chart(fig_source, use_container_width=True)
+            st.plotly_chart(charts["source"], use_container_width=True)
         
         with col2:
             st.markdown("#### 🏆 상위 인용 논문 Top 10")
-            top_papers = sorted(results, key=lambda x: x["citations"], reverse=True)[:10]
-            if top_papers:
-                fig_top = px.bar(
-                    x=[p["citations"] for p in top_papers],
-                    y=[p["title"][:35] + "..." if len(p["title"]) > 35 else p["title"] for p in top_papers],
-                    orientation="h", labels={"x": "인용수", "y": ""}
-                )
-                fig_top.update_layout(height=350, yaxis={"categoryorder": "total ascending"})
-                st.plotly_chart(fig_top, use_container_width=True)
+            if "top_cited" in charts:
+                st.plotly_chart(charts["top_cited"], use_container_width=True)
         
         st.markdown("#### 📚 상위 저널 분포")
-        venue_data = [r["venue"] for r in results if r["venue"] and r["venue"] not in ["Unknown", "", "N/A"]]
-        if venue_data:
-            venue_counts = pd.Series(venue_data).value_counts().head(15)
-            fig_venue = px.bar(x=venue_counts.values, y=venue_counts.index, orientation="h", labels={"x": "논문 수", "y": ""})
-            fig_venue.update_layout(height=450, yaxis={"categoryorder": "total ascending"})
-            st.plotly_chart(fig_venue, use_container_width=True)
+        if "venue" in charts:
+            st.plotly_chart(charts["venue"], use_container_width=True)
     
-    with tab3:
+    with tab3, span("render.export", render_trace):
         st.markdown("#### 💾 검색 결과 내보내기")
-        col1, col2 = st.columns(2)
-        with col1:
-            csv_data = to_csv(results)
-            st.download_button(label="📥 CSV 다운로드", data=csv_data, file_name=f"papers_{datetime.now().strftime('%Y%m%d')}.csv", mime="text/csv", use_container_width=True)
-        with col2:
-            bibtex_data = to_bibtex(results)
-            st.download_button(label="📥 BibTeX 다운로드", data=bibtex_data, file_name=f"papers_{datetime.now().strftime('%Y%m%d')}.bib", mime="text/plain", use_container_width=True)
+        # 파일 내용은 버튼을 누를 때 만들고, 같은 결과 집합이면 rerun 사이에 재사용
+        results_key = st.session_state.get("results_key") or fingerprint_papers(results)
+        st.session_state.results_key = results_key
+        columns = st.columns(len(EXPORT_FORMATS))
+        for column, (fmt, spec) in zip(columns, EXPORT_FORMATS.items()):
+            with column:
+                payload = peek_export(results_key, fmt)
+                if payload is None and st.button(f"📦 {spec['label']} 파일 만들기", key=f"export_{fmt}", use_container_width=True):
+                    payload = get_export(results, fmt, fingerprint=results_key)
+                if payload is not None:
+                    st.download_button(
+                        label=f"📥 {spec['label']} 다운로드",
+                        data=payload,
+                        file_name=f"papers_{datetime.now().strftime('%Y%m%d')}.{spec['extension']}",
+                        mime=spec["mime"],
+                        use_container_width=True
+                    )
+    
+    render_summary = finish_trace(render_trace)
+    with st.expander("⏱️ 성능", expanded=False):
+        render_performance(st.session_state.search_trace, render_summary)
 
 else:
     if not st.session_state.search_executed:
@@ -0,0 +1,238 @@
+# batch.py
+# Streamlit 없이 여러 연구 주제를 한 번에 검색해 파일로 내보내는 배치 실행기
+#
+# 사용 예:
+#   python batch.py --presets all --out results/
+#   python batch.py --keywords-file topics.txt --formats csv,bibtex --smart
+
+import argparse
+import json
+import os
+import re
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime
+from typing import Dict, List
+
+from config.journals import TARGET_JOURNALS, get_all_extended_journals
+from config.keywords import RESEARCH_PRESETS, expand_keywords
+from utils.search import search_and_filter
+from utils.export import EXPORT_FORMATS, get_export, write_arrow, write_bibtex, write_csv, write_parquet
+from utils.corpus import get_corpus
+from utils.http import get_http_stats
+from utils.cache import get_cache_stats
+
+def _slugify(name: str) -> str:
+    return re.sub(r"[^\w]+", "_", name.strip().lower()).strip("_") or "topic"
+
+def load_keyword_file(path: str) -> List[Dict]:
+    """
+    키워드 파일 읽기: 한 줄에 주제 하나
+    
+    "이름: 키워드1, 키워드2" 또는 "키워드1, 키워드2" (이름은 키워드로 대신), #으로 시작하면 주석
+    """
+    topics = []
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            line = line.strip()
+            if not line or line.startswith("#"):
+                continue
+            name, _, rest = line.rpartition(":")
+            keywords = [k.strip() for k in rest.split(",") if k.strip()]
+            if keywords:
+                topics.append({"name": name.strip() or ", ".join(keywords), "keywords": keywords})
+    return topics
+
+def build_topics(args) -> List[Dict]:
+    topics = []
+    if args.presets:
+        names = list(RESEARCH_PRESETS) if args.presets == ["all"] else args.presets
+        for name in names:
+            if name not in RESEARCH_PRESETS:
+                raise SystemExit(f"알 수 없는 프리셋: {name} (가능: {', '.join(RESEARCH_PRESETS)})")
+            topics.append({"name": name, "keywords": list(RESEARCH_PRESETS[name]["keywords"])})
+    for path in args.keywords_file or []:
+        topics.extend(load_keyword_file(path))
+    return topics
+
+def build_search_kwargs(topic: Dict, args, target_journals: List[str], extended_journals: List[str]) -> Dict:
+    """주제 하나를 search_and_filter 인자로 변환 (--smart면 유의어 확장 + 그룹별 하위 쿼리)"""
+    keywords = topic["keywords"]
+    query_groups = None
+    if args.smart:
+        query_groups = [terms for terms in expand_keywords(keywords).values() if terms]
+        keywords = [term for terms in query_groups for term in terms]
+    return {
+        "keywords": keywords,
+        "target_journals": target_journals,
+        "extended_journals": extended_journals,
+        "year_start": args.year_start,
+        "year_end": args.year_end,
+        "min_citations": args.min_citations,
+        "include_extended": args.include_extended,
+        "limit": args.limit,
+        "max_pages": args.max_pages,
+        "search_source": args.source,
+        "journals_only": args.journals_only,
+        "query_groups": query_groups,
+    }
+
+def _search_key(search_kwargs: Dict) -> str:
+    """같은 API 요청이 되는 검색은 같은 키 (키워드 순서/중복 무시)"""
+    canonical = dict(search_kwargs)
+    canonical["keywords"] = sorted(set(k.lower() for k in search_kwargs["keywords"]))
+    return json.dumps(canonical, sort_keys=True, ensure_ascii=False)
+
+def _run_search(search_kwargs: Dict) -> Dict:
+    started = time.perf_counter()
+    results = search_and_filter(**search_kwargs)
+    return {"results": results, "seconds": time.perf_counter() - started}
+
+def run_batch(topics: List[Dict], args) -> Dict:
+    target_journals = [j for data in TARGET_JOURNALS.values() for j in data["journals"]]
+    extended_journals = get_all_extended_journals() if args.include_extended else []
+    os.makedirs(args.out, exist_ok=True)
+    formats = [f.strip() for f in args.formats.split(",") if f.strip()]
+    for fmt in formats:
+        if fmt not in EXPORT_FORMATS:
+            raise SystemExit(f"알 수 없는 형식: {fmt} (가능: {', '.join(EXPORT_FORMATS)})")
+    
+    # 같은 검색이 되는 주제는 한 번만 실행
+    jobs: Dict[str, Dict] = {}
+    topic_keys = []
+    for topic in topics:
+        search_kwargs = build_search_kwargs(topic, args, target_journals, extended_journals)
+        key = _search_key(search_kwargs)
+        jobs.setdefault(key, search_kwargs)
+        topic_keys.append(key)
+    
+    started = time.perf_counter()
+    outcomes: Dict[str, Dict] = {}
+    # 모든 작업이 http 모듈의 호스트별 속도 제한과 응답 캐시를 공유
+    with ThreadPoolExecutor(max_workers=args.workers) as executor:
+        futures = {executor.submit(_run_search, search_kwargs): key for key, search_kwargs in jobs.items()}
+        for future in as_completed(futures):
+            key = futures[future]
+            try:
+                outcomes[key] = future.result()
+            except Exception as e:
+                outcomes[key] = {"results": [], "seconds": 0.0, "error": str(e)}
+    search_seconds = time.perf_counter() - started
+    
+    summary_topics = []
+    used_slugs = set()
+    for topic, key in zip(topics, topic_keys):
+        outcome = outcomes[key]
+        slug = _slugify(topic["name"])
+        while slug in used_slugs:
+            slug += "_"
+        used_slugs.add(slug)
+        
+        export_started = time.perf_counter()
+        files = []
+        for fmt in formats:
+            # 같은 검색을 공유하는 주제는 내보내기 결과도 재사용
+            path = os.path.join(args.out, f"{slug}.{EXPORT_FORMATS[fmt]['extension']}")
+            payload = get_export(outcome["results"], fmt, fingerprint=key)
+            if isinstance(payload, bytes):
+                with open(path, "wb") as f:
+                    f.write(payload)
+            else:
+                with open(path, "w", encoding="utf-8", newline="") as f:
+                    f.write(payload)
+            files.append(path)
+        
+        entry = {
+            "name": topic["name"],
+            "keywords": topic["keywords"],
+            "results": len(outcome["results"]),
+            "search_seconds": round(outcome["seconds"], 3),
+            "export_seconds": round(time.perf_counter() - export_started, 3),
+            "shared_search": sum(1 for k in topic_keys if k == key) > 1,
+            "files": files,
+        }
+        if "error" in outcome:
+            entry["error"] = outcome["error"]
+        summary_topics.append(entry)
+    
+    summary = {
+        "started_at": datetime.now().isoformat(timespec="seconds"),
+        "topics": len(topics),
+        "searches": len(jobs),
+        "search_seconds": round(search_seconds, 3),
+        "total_seconds": round(time.perf_counter() - started, 3),
+        "http": get_http_stats()["total"],
+        "cache": get_cache_stats(),
+        "results": summary_topics,
+    }
+    with open(os.path.join(args.out, "summary.json"), "w", encoding="utf-8") as f:
+        json.dump(summary, f, ensure_ascii=False, indent=2)
+    return summary
+
+def dump_corpus(path: str) -> Dict:
+    """로컬 코퍼스 전체를 파일로 스트리밍 저장 (.csv/.bib, 뒤에 .gz를 붙이면 압축 / .parquet/.arrow)"""
+    corpus = get_corpus()
+    if corpus is None:
+        raise SystemExit("로컬 코퍼스가 비활성화되어 있습니다 (PAPER_TRACKER_CORPUS=0)")
+    base = path[:-3] if path.endswith(".gz") else path
+    # parquet/arrow는 파일 안에서 열 단위로 압축되므로 .gz로 한 번 더 감싸지 않음
+    if base != path and base.endswith((".parquet", ".arrow", ".feather")):
+        raise SystemExit(f"{path}: .parquet/.arrow 파일은 자체 압축(zstd)을 쓰므로 .gz를 붙이지 마세요")
+    if base.endswith(".parquet"):
+        writer = write_parquet
+    elif base.endswith((".arrow", ".feather")):
+        writer = write_arrow
+    elif base.endswith(".bib"):
+        writer = write_bibtex
+    else:
+        writer = write_csv
+    started = time.perf_counter()
+    count = writer(corpus.iter_papers(), path)
+    return {"path": path, "papers": count, "seconds": round(time.perf_counter() - started, 3)}
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="연구 주제 프리셋/키워드 파일을 일괄 검색해 CSV/BibTeX로 저장")
+    parser.add_argument("--presets", nargs="*", help="실행할 프리셋 이름 (all = 전체)")
+    parser.add_argument("--keywords-file", action="append", help="주제 목록 파일 (여러 번 지정 가능)")
+    parser.add_argument("--out", default="results", help="출력 폴더 (기본: results)")
+    parser.add_argument("--formats", default="csv,bibtex", help=f"출력 형식, 쉼표로 구분 ({', '.join(EXPORT_FORMATS)})")
+    parser.add_argument("--source", default="both", choices=["both", "semantic", "openalex"])
+    parser.add_argument("--year-start", type=int, default=2015)
+    parser.add_argument("--year-end", type=int, default=datetime.now().year)
+    parser.add_argument("--min-citations", type=int, default=0)
+    parser.add_argument("--limit", type=int, default=100)
+    parser.add_argument("--max-pages", type=int, help="소스당 최대 페이지 수 (결과 수에 맞춘 페이지보다 깊이, 관련 논문이 줄면 일찍 멈춤)")
+    parser.add_argument("--include-extended", action="store_true", help="확장 저널 포함")
+    parser.add_argument("--journals-only", action="store_true", help="핵심 저널 논문만 검색")
+    parser.add_argument("--smart", action="store_true", help="유의어 확장 + 키워드 그룹별 병렬 검색")
+    parser.add_argument("--workers", type=int, default=4, help="동시에 실행할 검색 수")
+    parser.add_argument("--dump-corpus", metavar="PATH", help="로컬 코퍼스 전체를 파일로 저장 (.csv/.bib, .gz 압축 가능 / .parquet/.arrow는 자체 압축)")
+    return parser.parse_args(argv)
+
+def main(argv=None):
+    args = parse_args(argv)
+    topics = build_topics(args)
+    if not topics and not args.dump_corpus:
+        print("실행할 주제가 없습니다. --presets, --keywords-file 또는 --dump-corpus를 지정하세요.", file=sys.stderr)
+        return 1
+    
+    if topics:
+        summary = run_batch(topics, args)
+        for entry in summary["results"]:
+            status = f"오류: {entry['error']}" if "error" in entry else f"{entry['results']}편"
+            print(f"{entry['name']:<40} {status:>10}  {entry['search_seconds']:.2f}s")
+        print(
+            f"\n주제 {summary['topics']}개 / 실제 검색 {summary['searches']}회 / "
+            f"API 요청 {summary['http']['requests']}회 / {summary['total_seconds']:.2f}s"
+        )
+        print(f"요약: {os.path.join(args.out, 'summary.json')}")
+    
+    # 검색이 끝난 뒤 덤프해야 이번 실행에서 받은 논문까지 포함됨
+    if args.dump_corpus:
+        dumped = dump_corpus(args.dump_corpus)
+        print(f"코퍼스 {dumped['papers']}편 -> {dumped['path']} ({dumped['seconds']:.2f}s)")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
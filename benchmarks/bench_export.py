@@ -0,0 +1,70 @@
+# benchmarks/bench_export.py
+# CSV/BibTeX 내보내기: 문자열 생성(to_csv/to_bibtex) vs 스트리밍(write_csv/write_bibtex), 10만 건 기준
+
+import os
+import tempfile
+import time
+import tracemalloc
+from typing import Dict, Iterator
+
+from utils.export import to_bibtex, to_csv, write_bibtex, write_csv
+
+def iter_papers(n: int) -> Iterator[Dict]:
+    """검색 결과 형식의 합성 논문 (생성기라 전체 목록을 메모리에 두지 않음)"""
+    for i in range(n):
+        yield {
+            "id": f"W{i}",
+            "title": f"Service robot acceptance in hotel settings: evidence from study {i}",
+            "authors": "Minji Kim, Jae Lee, Alex Park",
+            "year": 2015 + i % 10,
+            "venue": ["Tourism Management", "Annals of Tourism Research", "Journal of Travel Research"][i % 3],
+            "citations": i % 500,
+            "priority": ["High", "Medium", "Low"][i % 3],
+            "track": "Core Journal",
+            "source": "OpenAlex",
+            "url": f"https://doi.org/10.1000/{i}",
+            "abstract": "We examine how guests evaluate service robots in hotels. " * 12,
+        }
+
+def _peak_mb(func) -> float:
+    tracemalloc.start()
+    func()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return round(peak / 1024 / 1024, 1)
+
+def _write_devnull(writer, n: int):
+    with open(os.devnull, "wb") as f:
+        writer(iter_papers(n), f)
+
+def run(n: int = 100_000, memory_n: int = 20_000) -> dict:
+    results = {"records": n}
+    with tempfile.TemporaryDirectory() as tmp:
+        for name, writer, builder in (("csv", write_csv, to_csv), ("bibtex", write_bibtex, to_bibtex)):
+            # 처리량: 생성기 -> 파일 (압축 없음 / gzip)
+            for suffix, compress in (("", False), (".gz", True)):
+                path = os.path.join(tmp, f"out.{name}{suffix}")
+                start = time.perf_counter()
+                with open(path, "wb") as f:
+                    writer(iter_papers(n), f, compress=compress)
+                seconds = time.perf_counter() - start
+                label = f"{name}{'_gzip' if compress else ''}"
+                results[f"{label}_records_per_sec"] = round(n / seconds)
+                results[f"{label}_mb"] = round(os.path.getsize(path) / 1024 / 1024, 1)
+            
+            # 기존 방식: 목록 전체를 만든 뒤 문자열로 변환
+            papers = list(iter_papers(n))
+            start = time.perf_counter()
+            builder(papers)
+            results[f"{name}_string_records_per_sec"] = round(n / (time.perf_counter() - start))
+            del papers
+            
+            # 최대 메모리: 스트리밍은 건수와 무관하게 일정해야 함
+            results[f"{name}_stream_peak_mb"] = _peak_mb(lambda: _write_devnull(writer, memory_n))
+            results[f"{name}_string_peak_mb"] = _peak_mb(lambda: builder(list(iter_papers(memory_n))))
+    results["memory_records"] = memory_n
+    return results
+
+if __name__ == "__main__":
+    for key, value in run().items():
+        print(f"{key:>32}: {value}")
@@ -0,0 +1,94 @@
+# benchmarks/bench_journal_matcher.py
+# match_journal: 기존 루프 방식 vs JournalMatcher 인덱스 (10k venue)
+
+import random
+import time
+from typing import List
+
+from config.journals import get_all_target_journals, get_all_extended_journals
+from utils.matcher import JOURNAL_ALIASES, JournalMatcher, normalize_venue
+
+def legacy_match_journal(venue: str, target_journals: List[str]) -> bool:
+    """인덱스 도입 전 match_journal (비교 기준)"""
+    if not venue:
+        return False
+    venue_norm = normalize_venue(venue)
+    for target in target_journals:
+        target_norm = normalize_venue(target)
+        if target_norm == venue_norm:
+            return True
+        if target_norm in venue_norm or venue_norm in target_norm:
+            return True
+        target_words = set(target_norm.split())
+        venue_words = set(venue_norm.split())
+        common = target_words & venue_words
+        important_words = common - {"of", "the", "and", "in", "for", "a", "an", "journal", "international"}
+        if len(important_words) >= 2:
+            return True
+        if target_norm in JOURNAL_ALIASES:
+            for alias in JOURNAL_ALIASES[target_norm]:
+                alias_norm = normalize_venue(alias)
+                if alias_norm in venue_norm or venue_norm in alias_norm:
+                    return True
+    return False
+
+WORDS = [
+    "journal", "of", "applied", "computational", "review", "studies", "research", "science",
+    "management", "tourism", "marketing", "robotics", "human", "behavior", "letters", "systems",
+    "frontiers", "proceedings", "conference", "ieee", "acm", "transactions", "sustainability",
+    "energy", "medicine", "chemistry", "physics", "economics", "education", "policy",
+]
+
+def make_venues(n: int, seed: int = 42) -> List[str]:
+    """실제 저널명/약어/변형/무관한 저널명이 섞인 venue 목록"""
+    rng = random.Random(seed)
+    journals = get_all_target_journals() + get_all_extended_journals()
+    aliases = [a for values in JOURNAL_ALIASES.values() for a in values]
+    venues = []
+    for _ in range(n):
+        kind = rng.random()
+        if kind < 0.2:
+            venues.append(rng.choice(journals))
+        elif kind < 0.3:
+            venues.append(rng.choice(aliases).upper())
+        elif kind < 0.4:
+            venues.append(rng.choice(journals).replace("Journal", "J.") + " (Online)")
+        elif kind < 0.45:
+            venues.append("")
+        else:
+            venues.append(" ".join(rng.choice(WORDS) for _ in range(rng.randint(2, 6))).title())
+    return venues
+
+def run(n: int = 10000) -> dict:
+    targets = get_all_target_journals() + get_all_extended_journals()
+    venues = make_venues(n)
+    
+    start = time.perf_counter()
+    expected = [legacy_match_journal(v, targets) for v in venues]
+    legacy_seconds = time.perf_counter() - start
+    
+    start = time.perf_counter()
+    matcher = JournalMatcher(targets)
+    cold = [matcher.match(v) for v in venues]
+    cold_seconds = time.perf_counter() - start
+    
+    # 같은 venue가 반복되는 실제 검색처럼, 두 번째 패스는 메모이제이션 적중
+    start = time.perf_counter()
+    warm = [matcher.match(v) for v in venues]
+    warm_seconds = time.perf_counter() - start
+    
+    mismatches = sum(1 for a, b in zip(expected, cold) if a != b) + sum(1 for a, b in zip(expected, warm) if a != b)
+    return {
+        "venues": n,
+        "matches": sum(expected),
+        "mismatches": mismatches,
+        "legacy_seconds": round(legacy_seconds, 4),
+        "matcher_cold_seconds": round(cold_seconds, 4),
+        "matcher_warm_seconds": round(warm_seconds, 4),
+        "speedup_cold": round(legacy_seconds / cold_seconds, 1) if cold_seconds else None,
+        "speedup_warm": round(legacy_seconds / warm_seconds, 1) if warm_seconds else None,
+    }
+
+if __name__ == "__main__":
+    for key, value in run().items():
+        print(f"{key:>22}: {value}")
@@ -0,0 +1,89 @@
+# benchmarks/bench_keyword_matcher.py
+# check_relevance 키워드 검사: 부분 문자열 스캔 vs KeywordMatcher (키워드 수 증가에 따른 변화)
+
+import random
+import time
+from typing import List
+
+from config.keywords import KEYWORD_EXPANSIONS, get_all_expanded_terms
+from utils.matcher import KeywordMatcher
+from utils.search import DEFAULT_CONTEXT_KEYWORDS
+
+FILLER = (
+    "this study examines how visitors perceive service quality and maintain loyalty "
+    "we said that the proposed model explains behavioural intention in several settings"
+).split()
+
+def make_texts(n: int, terms: List[str], seed: int = 7) -> List[str]:
+    rng = random.Random(seed)
+    texts = []
+    for _ in range(n):
+        words = [rng.choice(FILLER) for _ in range(rng.randint(120, 220))]
+        for _ in range(rng.randint(0, 3)):
+            words.insert(rng.randrange(len(words)), rng.choice(terms).lower())
+        texts.append(" ".join(words))
+    return texts
+
+def legacy_scan(text: str, keywords: List[str], context_keywords: List[str]):
+    """기존 방식: 매칭 여부만 확인 (첫 매칭에서 중단)"""
+    keywords_lower = [k.lower() for k in keywords]
+    has_keyword = any(k in text for k in keywords_lower)
+    has_context = any(c in text for c in context_keywords)
+    return has_keyword, has_context
+
+def legacy_scan_all(text: str, keywords: List[str], context_keywords: List[str]):
+    """기존 방식으로 매칭된 용어 목록까지 구하는 경우"""
+    matched = [k for k in keywords if k.lower() in text]
+    context = [c for c in context_keywords if c in text]
+    return matched, context
+
+def matcher_check(matcher: KeywordMatcher, text: str):
+    """check_relevance 경로: 예/아니오 판정으로 거르고 통과한 텍스트만 매칭 목록을 구함"""
+    if not matcher.has_keyword(text):
+        return None
+    return matcher.matched_keywords(text), matcher.has_context(text)
+
+def run(n: int = 5000) -> dict:
+    small = ["AI", "Acceptance", "Tourism", "Trust"]
+    large = get_all_expanded_terms(list(KEYWORD_EXPANSIONS.keys()))
+    texts = make_texts(n, large)
+    
+    report = {"texts": n}
+    for label, keywords in (("small", small), ("large", large)):
+        start = time.perf_counter()
+        for text in texts:
+            legacy_scan(text, keywords, DEFAULT_CONTEXT_KEYWORDS)
+        legacy_seconds = time.perf_counter() - start
+        
+        start = time.perf_counter()
+        for text in texts:
+            legacy_scan_all(text, keywords, DEFAULT_CONTEXT_KEYWORDS)
+        legacy_all_seconds = time.perf_counter() - start
+        
+        matcher = KeywordMatcher(keywords, DEFAULT_CONTEXT_KEYWORDS)
+        start = time.perf_counter()
+        for text in texts:
+            matcher.has_keyword(text)
+        has_keyword_seconds = time.perf_counter() - start
+        
+        start = time.perf_counter()
+        for text in texts:
+            matcher_check(matcher, text)
+        check_seconds = time.perf_counter() - start
+        
+        start = time.perf_counter()
+        for text in texts:
+            matcher.find(text)
+        matcher_seconds = time.perf_counter() - start
+        
+        report[f"{label}_keywords"] = len(keywords)
+        report[f"{label}_legacy_seconds"] = round(legacy_seconds, 4)
+        report[f"{label}_legacy_all_seconds"] = round(legacy_all_seconds, 4)
+        report[f"{label}_has_keyword_seconds"] = round(has_keyword_seconds, 4)
+        report[f"{label}_check_seconds"] = round(check_seconds, 4)
+        report[f"{label}_find_seconds"] = round(matcher_seconds, 4)
+    return report
+
+if __name__ == "__main__":
+    for key, value in run().items():
+        print(f"{key:>24}: {value}")
@@ -0,0 +1,72 @@
+# benchmarks/bench_openalex_abstract.py
+# OpenAlex abstract_inverted_index 복원 처리량 (200개 work 페이지 기준)
+
+import random
+import time
+from typing import Dict, List
+
+from utils.search import _parse_openalex_work, reconstruct_abstract
+
+VOCAB = [
+    "the", "of", "and", "tourism", "robot", "service", "hotel", "guests", "study", "we",
+    "results", "acceptance", "trust", "model", "technology", "experience", "data", "findings",
+    "artificial", "intelligence", "customers", "intention", "survey", "analysis", "effects",
+]
+
+def make_inverted_index(n_words: int, rng: random.Random) -> Dict[str, List[int]]:
+    index: Dict[str, List[int]] = {}
+    for position in range(n_words):
+        index.setdefault(rng.choice(VOCAB) + str(rng.randint(0, 40)), []).append(position)
+    return index
+
+def make_page(n_works: int = 200, seed: int = 3) -> List[Dict]:
+    rng = random.Random(seed)
+    return [
+        {
+            "id": f"https://openalex.org/W{i}",
+            "title": f"Work {i}",
+            "publication_year": 2020,
+            "cited_by_count": i,
+            "abstract_inverted_index": make_inverted_index(rng.randint(120, 300), rng),
+        }
+        for i in range(n_works)
+    ]
+
+def legacy_reconstruct(inverted_index: Dict[str, List[int]]) -> str:
+    """흔한 구현: (위치, 단어) 리스트를 만들어 정렬 후 join"""
+    pairs = []
+    for word, positions in inverted_index.items():
+        for position in positions:
+            pairs.append((position, word))
+    pairs.sort()
+    return " ".join(word for _, word in pairs)
+
+def run(pages: int = 20) -> dict:
+    page = make_page()
+    works = page * pages
+    
+    start = time.perf_counter()
+    expected = [legacy_reconstruct(w["abstract_inverted_index"]) for w in works]
+    legacy_seconds = time.perf_counter() - start
+    
+    start = time.perf_counter()
+    actual = [reconstruct_abstract(w["abstract_inverted_index"]) for w in works]
+    reconstruct_seconds = time.perf_counter() - start
+    
+    # 초록 복원을 포함한 work 파싱 전체
+    start = time.perf_counter()
+    for w in works:
+        _parse_openalex_work(w)
+    parse_seconds = time.perf_counter() - start
+    
+    return {
+        "works": len(works),
+        "identical": expected == actual,
+        "legacy_works_per_sec": round(len(works) / legacy_seconds),
+        "reconstruct_works_per_sec": round(len(works) / reconstruct_seconds),
+        "parse_pages_per_sec": round(pages / parse_seconds, 1),
+    }
+
+if __name__ == "__main__":
+    for key, value in run().items():
+        print(f"{key:>28}: {value}")
@@ -0,0 +1,56 @@
+# benchmarks/bench_relevance.py
+# match_journal / check_relevance 처리량: 합성 논문 1만~100만 건
+
+import time
+from typing import Dict, List
+
+from benchmarks.bench_journal_matcher import make_venues
+from benchmarks.bench_keyword_matcher import make_texts
+from config.journals import get_all_extended_journals, get_all_target_journals
+from config.keywords import KEYWORD_EXPANSIONS, get_all_expanded_terms
+from utils.matcher import get_journal_matcher, get_keyword_matcher
+from utils.search import DEFAULT_CONTEXT_KEYWORDS, check_relevance, match_journal
+
+# 서로 다른 논문 수 (이보다 큰 집합은 이 풀을 돌려 쓰므로 100만 건도 메모리가 일정)
+POOL_SIZE = 20_000
+
+def make_papers(n: int) -> List[Dict]:
+    keywords = get_all_expanded_terms(list(KEYWORD_EXPANSIONS.keys()))
+    venues = make_venues(n)
+    texts = make_texts(n, keywords)
+    return [
+        {"title": text[:90], "abstract": text[90:], "venue": venue}
+        for text, venue in zip(texts, venues)
+    ]
+
+def run(sizes=(10_000, 100_000, 1_000_000)) -> dict:
+    targets = get_all_target_journals() + get_all_extended_journals()
+    keywords = ["service robot", "artificial intelligence", "chatbot", "acceptance"]
+    pool = make_papers(POOL_SIZE)
+    journal_matcher = get_journal_matcher(targets)
+    keyword_matcher = get_keyword_matcher(keywords, DEFAULT_CONTEXT_KEYWORDS)
+    
+    report = {"pool": POOL_SIZE}
+    for n in sizes:
+        start = time.perf_counter()
+        for i in range(n):
+            match_journal(pool[i % POOL_SIZE]["venue"], targets)
+        seconds = time.perf_counter() - start
+        report[f"match_journal_{n}_per_sec"] = round(n / seconds)
+        
+        start = time.perf_counter()
+        relevant = 0
+        for i in range(n):
+            if check_relevance(
+                pool[i % POOL_SIZE], keywords, targets,
+                journal_matcher=journal_matcher, keyword_matcher=keyword_matcher
+            ):
+                relevant += 1
+        seconds = time.perf_counter() - start
+        report[f"check_relevance_{n}_per_sec"] = round(n / seconds)
+        report[f"check_relevance_{n}_relevant"] = relevant
+    return report
+
+if __name__ == "__main__":
+    for key, value in run().items():
+        print(f"{key:>36}: {value}")
@@ -0,0 +1,61 @@
+# benchmarks/bench_search.py
+# search_and_filter 전체 지연 시간과 페이지 처리량 (대역 서버: 지연/오류/429 시나리오별)
+
+import statistics
+import time
+from typing import Dict
+
+from benchmarks.mock_api import MockScholarAPI, patched_search
+from config.journals import get_all_target_journals
+from utils.http import get_http_stats, reset_http_stats
+from utils.search import search_and_filter
+
+KEYWORDS = ["service robot", "artificial intelligence", "chatbot"]
+
+# 시나리오: MockScholarAPI 인자
+SCENARIOS = {
+    "fast": {},
+    "latency_100ms": {"latency": 0.1, "jitter": 0.02},
+    "errors_5pct": {"latency": 0.02, "error_rate": 0.05},
+    "throttled_10pct": {"latency": 0.02, "throttle_rate": 0.1},
+}
+
+def _percentile(values, q: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(round(q * (len(ordered) - 1))))]
+
+def run_scenario(repeats: int = 5, limit: int = 100, **server_kwargs) -> Dict:
+    targets = get_all_target_journals()
+    latencies = []
+    results = 0
+    with MockScholarAPI(**server_kwargs) as api, patched_search(api.url):
+        # 첫 실행(매처 생성, 커넥션 수립)은 측정에서 제외
+        search_and_filter(KEYWORDS, targets, limit=limit, use_corpus=False)
+        reset_http_stats()
+        started = time.perf_counter()
+        for _ in range(repeats):
+            start = time.perf_counter()
+            results = len(search_and_filter(KEYWORDS, targets, limit=limit, use_corpus=False))
+            latencies.append(time.perf_counter() - start)
+        seconds = time.perf_counter() - started
+        http = get_http_stats()["total"]
+    pages = http["requests"] - http["retries"]
+    return {
+        "results": results,
+        "median_ms": round(statistics.median(latencies) * 1000, 1),
+        "p95_ms": round(_percentile(latencies, 0.95) * 1000, 1),
+        "pages_per_sec": round(pages / seconds, 1),
+        "requests_per_search": round(http["requests"] / repeats, 1),
+        "retries_per_search": round(http["retries"] / repeats, 1),
+    }
+
+def run(repeats: int = 5, limit: int = 100) -> dict:
+    report = {"repeats": repeats, "limit": limit}
+    for name, server_kwargs in SCENARIOS.items():
+        for key, value in run_scenario(repeats, limit, **server_kwargs).items():
+            report[f"{name}_{key}"] = value
+    return report
+
+if __name__ == "__main__":
+    for key, value in run().items():
+        print(f"{key:>36}: {value}")
@@ -0,0 +1,353 @@
+# benchmarks/mock_api.py
+# Semantic Scholar / OpenAlex 대역 서버: 기록해 둔 응답(없으면 합성 응답)을 지연/오류/429와 함께 재생
+#
+# 사용 예:
+#   python -m benchmarks.mock_api serve --latency 0.1 --error-rate 0.05 --throttle-rate 0.1
+#   python -m benchmarks.mock_api record "service robot tourism"   # 실제 API 응답을 fixtures/에 저장
+
+import argparse
+import json
+import os
+import random
+import threading
+import time
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List, Optional
+from urllib.parse import parse_qs, urlparse
+
+FIXTURES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures")
+SEMANTIC_SCHOLAR_FIXTURE = "semantic_scholar_search.json"
+OPENALEX_FIXTURE = "openalex_works.json"
+
+# 합성 응답 재료 (저널 일부는 config.journals의 핵심 저널과 일치)
+VENUES = [
+    "Tourism Management", "Annals of Tourism Research", "Journal of Travel Research",
+    "International Journal of Hospitality Management", "Computers in Human Behavior",
+    "Journal of Business Research", "Sustainability", "",
+]
+TOPICS = ["service robot", "artificial intelligence", "chatbot", "smart tourism", "virtual reality", "technology acceptance"]
+SETTINGS = ["hotel", "restaurant", "airport", "destination", "museum", "theme park"]
+FILLER = (
+    "this study examines how visitors perceive service quality and we discuss the implications "
+    "for managers results show that trust and perceived usefulness shape behavioural intention"
+).split()
+
+def _synthetic_abstract(rng: random.Random, topic: str, setting: str) -> str:
+    words = [rng.choice(FILLER) for _ in range(rng.randint(80, 160))]
+    words.insert(rng.randrange(len(words)), topic)
+    words.insert(rng.randrange(len(words)), setting)
+    if rng.random() < 0.5:
+        words.insert(rng.randrange(len(words)), "tourism")
+    return " ".join(words)
+
+def synthetic_semantic_scholar_paper(i: int, seed: int = 0) -> Dict:
+    rng = random.Random(seed * 1_000_003 + i)
+    topic, setting = rng.choice(TOPICS), rng.choice(SETTINGS)
+    return {
+        "paperId": f"ss{i:08d}",
+        "externalIds": {"DOI": f"10.5555/bench.{i}"} if rng.random() < 0.8 else {},
+        "title": f"{topic.title()} in the {setting}: evidence from study {i}",
+        "abstract": _synthetic_abstract(rng, topic, setting) if rng.random() < 0.85 else None,
+        "year": rng.randint(2012, 2025),
+        "citationCount": int(rng.paretovariate(1.2)) - 1,
+        "authors": [{"name": f"Author {rng.randint(1, 5000)}"} for _ in range(rng.randint(1, 5))],
+        "venue": rng.choice(VENUES),
+        "openAccessPdf": {"url": f"https://example.org/pdf/{i}"} if rng.random() < 0.3 else None,
+    }
+
+def synthetic_openalex_work(i: int, seed: int = 0) -> Dict:
+    rng = random.Random(seed * 1_000_003 + i + 7)
+    topic, setting = rng.choice(TOPICS), rng.choice(SETTINGS)
+    inverted_index: Dict[str, List[int]] = {}
+    for position, word in enumerate(_synthetic_abstract(rng, topic, setting).split()):
+        inverted_index.setdefault(word, []).append(position)
+    # 절반은 Semantic Scholar 쪽과 같은 DOI/제목 (중복 병합 경로를 타도록)
+    doi_index = i if rng.random() < 0.5 else i + 10_000_000
+    return {
+        "id": f"https://openalex.org/W{i:08d}",
+        "doi": f"https://doi.org/10.5555/bench.{doi_index}",
+        "title": f"{topic.title()} in the {setting}: evidence from study {doi_index}",
+        "publication_year": rng.randint(2012, 2025),
+        "cited_by_count": int(rng.paretovariate(1.2)) - 1,
+        "authorships": [{"author": {"display_name": f"Author {rng.randint(1, 5000)}"}} for _ in range(rng.randint(1, 5))],
+        "primary_location": {
+            "is_oa": rng.random() < 0.3,
+            "pdf_url": f"https://example.org/pdf/W{i}",
+            "source": {"display_name": rng.choice(VENUES), "id": "https://openalex.org/S1"},
+        },
+        "abstract_inverted_index": inverted_index if rng.random() < 0.85 else None,
+    }
+
+def _bench_doi_index(doi: str) -> Optional[int]:
+    """합성 DOI(10.5555/bench.N)의 번호 N (다른 DOI는 None)"""
+    prefix = "10.5555/bench."
+    suffix = doi.lower().replace("https://doi.org/", "")
+    if not suffix.startswith(prefix) or not suffix[len(prefix):].isdigit():
+        return None
+    return int(suffix[len(prefix):])
+
+def load_fixture(name: str, fixtures_dir: str = FIXTURES_DIR) -> Optional[List[Dict]]:
+    """기록해 둔 응답 페이지 목록 (없으면 None)"""
+    path = os.path.join(fixtures_dir, name)
+    if not os.path.exists(path):
+        return None
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)["pages"]
+
+class MockScholarAPI:
+    """
+    두 API의 대역 HTTP 서버 (스레드로 실행)
+    
+    - latency/jitter: 요청마다 지연(초), error_rate: 503 비율, throttle_rate: 429(Retry-After) 비율
+    - fixtures/에 기록된 페이지가 있으면 순서대로 재생하고, 없으면 시드 고정 합성 응답
+    - total: 검색 한 건당 결과 수 (offset/cursor가 이를 넘으면 빈 페이지)
+    """
+    
+    def __init__(
+        self,
+        latency: float = 0.0,
+        jitter: float = 0.0,
+        error_rate: float = 0.0,
+        throttle_rate: float = 0.0,
+        retry_after: float = 0.05,
+        total: int = 1000,
+        seed: int = 0,
+        fixtures_dir: str = FIXTURES_DIR
+    ):
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.throttle_rate = throttle_rate
+        self.retry_after = retry_after
+        self.total = total
+        self.seed = seed
+        self.semantic_pages = load_fixture(SEMANTIC_SCHOLAR_FIXTURE, fixtures_dir)
+        self.openalex_pages = load_fixture(OPENALEX_FIXTURE, fixtures_dir)
+        self.stats = {"requests": 0, "errors": 0, "throttled": 0, "bytes": 0}
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+        self._server: Optional[ThreadingHTTPServer] = None
+    
+    @property
+    def url(self) -> str:
+        return f"http://127.0.0.1:{self._server.server_address[1]}"
+    
+    def start(self) -> str:
+        api = self
+        
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, *args):
+                pass
+            
+            def do_GET(self):
+                api._handle(self, None)
+            
+            def do_POST(self):
+                length = int(self.headers.get("Content-Length", 0))
+                api._handle(self, json.loads(self.rfile.read(length) or b"{}"))
+        
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self._server.daemon_threads = True
+        threading.Thread(target=self._server.serve_forever, daemon=True).start()
+        return self.url
+    
+    def stop(self):
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+    
+    def __enter__(self) -> "MockScholarAPI":
+        self.start()
+        return self
+    
+    def __exit__(self, *exc):
+        self.stop()
+    
+    # ---------- 요청 처리 ----------
+    
+    def _handle(self, handler: BaseHTTPRequestHandler, body: Optional[Dict]):
+        with self._lock:
+            self.stats["requests"] += 1
+            delay = self.latency + (self._rng.uniform(-self.jitter, self.jitter) if self.jitter else 0.0)
+            roll = self._rng.random()
+        time.sleep(max(0.0, delay))
+        
+        if roll < self.throttle_rate:
+            with self._lock:
+                self.stats["throttled"] += 1
+            self._send(handler, 429, {"message": "Too Many Requests"}, {"Retry-After": str(self.retry_after)})
+            return
+        if roll < self.throttle_rate + self.error_rate:
+            with self._lock:
+                self.stats["errors"] += 1
+            self._send(handler, 503, {"message": "Service Unavailable"})
+            return
+        
+        url = urlparse(handler.path)
+        query = {key: values[0] for key, values in parse_qs(url.query).items()}
+        if url.path.endswith("/paper/search"):
+            payload = self._semantic_scholar_page(int(query.get("offset", 0)), int(query.get("limit", 100)))
+        elif url.path.endswith("/paper/batch") and body is not None:
+            payload = [self._semantic_scholar_by_id(pid) for pid in body.get("ids", [])]
+        elif url.path.endswith("/works") and query.get("filter", "").startswith("doi:"):
+            payload = self._openalex_by_doi(query["filter"][len("doi:"):].split("|"))
+        elif url.path.endswith("/works"):
+            payload = self._openalex_page(query.get("cursor", "*"), int(query.get("per_page", 25)))
+        elif url.path.endswith("/sources"):
+            payload = {"meta": {"count": 0}, "results": []}
+        else:
+            self._send(handler, 404, {"message": "Not Found"})
+            return
+        self._send(handler, 200, payload)
+    
+    def _send(self, handler: BaseHTTPRequestHandler, status: int, payload, headers: Dict = None):
+        data = json.dumps(payload).encode("utf-8")
+        with self._lock:
+            self.stats["bytes"] += len(data)
+        try:
+            handler.send_response(status)
+            handler.send_header("Content-Type", "application/json")
+            handler.send_header("Content-Length", str(len(data)))
+            for key, value in (headers or {}).items():
+                handler.send_header(key, value)
+            handler.end_headers()
+            handler.wfile.write(data)
+        except (BrokenPipeError, ConnectionResetError):
+            # 클라이언트가 타임아웃/마감으로 먼저 연결을 끊은 경우
+            pass
+    
+    def _semantic_scholar_page(self, offset: int, limit: int) -> Dict:
+        if self.semantic_pages:
+            page = self.semantic_pages[(offset // max(1, limit)) % len(self.semantic_pages)]
+            data = page.get("data", []) if offset < self.total else []
+        else:
+            data = [synthetic_semantic_scholar_paper(i, self.seed) for i in range(offset, min(offset + limit, self.total))]
+        return {"total": self.total, "offset": offset, "data": data}
+    
+    def _semantic_scholar_by_id(self, paper_id: str) -> Optional[Dict]:
+        if paper_id.startswith("DOI:"):
+            index = _bench_doi_index(paper_id[len("DOI:"):])
+            paper = synthetic_semantic_scholar_paper(index, self.seed) if index is not None else None
+            return paper if paper and paper["externalIds"].get("DOI") == paper_id[len("DOI:"):] else None
+        if not paper_id.startswith("ss") or not paper_id[2:].isdigit():
+            return None
+        return synthetic_semantic_scholar_paper(int(paper_id[2:]), self.seed)
+    
+    def _openalex_by_doi(self, dois: List[str]) -> Dict:
+        """doi: 필터 조회 (합성 work의 DOI 번호는 i 또는 i + 10_000_000)"""
+        results = []
+        for doi in dois:
+            index = _bench_doi_index(doi)
+            if index is None:
+                continue
+            for i in (index, index - 10_000_000):
+                work = synthetic_openalex_work(i, self.seed) if i >= 0 else None
+                if work and work["doi"].endswith("/" + doi):
+                    results.append(work)
+                    break
+        return {"meta": {"count": len(results), "next_cursor": None}, "results": results}
+    
+    def _openalex_page(self, cursor: str, per_page: int) -> Dict:
+        page = 0 if cursor == "*" else int(cursor)
+        start = page * per_page
+        if self.openalex_pages:
+            results = self.openalex_pages[page % len(self.openalex_pages)].get("results", []) if start < self.total else []
+        else:
+            results = [synthetic_openalex_work(i, self.seed) for i in range(start, min(start + per_page, self.total))]
+        next_cursor = str(page + 1) if start + per_page < self.total else None
+        return {"meta": {"count": self.total, "next_cursor": next_cursor}, "results": results}
+
+@contextmanager
+def patched_search(base_url: str):
+    """
+    utils.search가 대역 서버를 쓰도록 전환 (끝나면 원래 설정으로 복원)
+    
+    응답 캐시/메모리 검색 결과 캐시/로컬 코퍼스/보강 기록은 끄고, 대역 호스트의 속도 제한은 풀고, 재시도 백오프는 줄임
+    (Retry-After가 있는 429는 서버가 준 값만큼 기다림)
+    """
+    from utils import cache, corpus, enrich, http, search
+    
+    saved = (
+        search.SEMANTIC_SCHOLAR_API, search.OPENALEX_API, cache.CACHE_ENABLED, corpus.CORPUS_ENABLED,
+        http.BACKOFF_BASE, dict(http.RATE_LIMITS), search._search_cache.maxsize, enrich.ENRICH_CACHE_ENABLED
+    )
+    search.SEMANTIC_SCHOLAR_API = base_url
+    search.OPENALEX_API = base_url
+    cache.CACHE_ENABLED = False
+    corpus.CORPUS_ENABLED = False
+    enrich.ENRICH_CACHE_ENABLED = False
+    search.clear_search_cache()
+    search._search_cache.maxsize = 0
+    http.BACKOFF_BASE = 0.01
+    http.RATE_LIMITS[urlparse(base_url).netloc] = (10_000.0, 10_000)
+    http.reset_http_stats()
+    try:
+        yield
+    finally:
+        (search.SEMANTIC_SCHOLAR_API, search.OPENALEX_API, cache.CACHE_ENABLED, corpus.CORPUS_ENABLED,
+         http.BACKOFF_BASE, rate_limits, search._search_cache.maxsize, enrich.ENRICH_CACHE_ENABLED) = saved
+        search.clear_search_cache()
+        http.RATE_LIMITS.clear()
+        http.RATE_LIMITS.update(rate_limits)
+
+# ==================== 응답 기록 ====================
+
+def record_fixtures(query: str, pages: int = 3, fixtures_dir: str = FIXTURES_DIR) -> Dict[str, int]:
+    """실제 API에서 검색 페이지를 받아 fixtures/에 저장 (대역 서버가 이후 그대로 재생)"""
+    from utils.http import get_json
+    from utils.search import OPENALEX_API, OPENALEX_SELECT, PAGE_SIZE, SEMANTIC_SCHOLAR_API, SEMANTIC_SCHOLAR_FIELDS
+    
+    semantic_pages = []
+    for page in range(pages):
+        semantic_pages.append(get_json(f"{SEMANTIC_SCHOLAR_API}/paper/search", params={
+            "query": query, "limit": PAGE_SIZE, "offset": page * PAGE_SIZE, "fields": SEMANTIC_SCHOLAR_FIELDS
+        }))
+    
+    openalex_pages = []
+    cursor = "*"
+    for _ in range(pages):
+        data = get_json(f"{OPENALEX_API}/works", params={
+            "search": query, "sort": "cited_by_count:desc", "per_page": PAGE_SIZE, "cursor": cursor, "select": OPENALEX_SELECT
+        })
+        openalex_pages.append(data)
+        cursor = data.get("meta", {}).get("next_cursor")
+        if not cursor:
+            break
+    
+    os.makedirs(fixtures_dir, exist_ok=True)
+    for name, recorded in ((SEMANTIC_SCHOLAR_FIXTURE, semantic_pages), (OPENALEX_FIXTURE, openalex_pages)):
+        with open(os.path.join(fixtures_dir, name), "w", encoding="utf-8") as f:
+            json.dump({"query": query, "recorded_at": time.strftime("%Y-%m-%d"), "pages": recorded}, f, ensure_ascii=False)
+    return {"semantic_scholar_pages": len(semantic_pages), "openalex_pages": len(openalex_pages)}
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Semantic Scholar / OpenAlex 대역 서버")
+    commands = parser.add_subparsers(dest="command", required=True)
+    serve = commands.add_parser("serve", help="대역 서버 실행 (Ctrl+C로 종료)")
+    serve.add_argument("--latency", type=float, default=0.0)
+    serve.add_argument("--jitter", type=float, default=0.0)
+    serve.add_argument("--error-rate", type=float, default=0.0)
+    serve.add_argument("--throttle-rate", type=float, default=0.0)
+    serve.add_argument("--total", type=int, default=1000)
+    record = commands.add_parser("record", help="실제 API 응답을 fixtures/에 기록")
+    record.add_argument("query")
+    record.add_argument("--pages", type=int, default=3)
+    args = parser.parse_args(argv)
+    
+    if args.command == "record":
+        print(record_fixtures(args.query, args.pages))
+        return 0
+    
+    with MockScholarAPI(args.latency, args.jitter, args.error_rate, args.throttle_rate, total=args.total) as api:
+        print(f"대역 서버: {api.url} (SEMANTIC_SCHOLAR_API/OPENALEX_API를 이 주소로 바꿔 사용)")
+        try:
+            while True:
+                time.sleep(1)
+        except KeyboardInterrupt:
+            pass
+    return 0
+
+if __name__ == "__main__":
+    raise SystemExit(main())
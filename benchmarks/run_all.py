@@ -0,0 +1,151 @@
+# benchmarks/run_all.py
+# 벤치마크 전체 실행 -> benchmarks/runs/<시각>.json 저장, 이전 실행과 비교해 성능 저하 표시
+#
+# 사용 예:
+#   python -m benchmarks.run_all --quick
+#   python -m benchmarks.run_all --only search,relevance --compare benchmarks/runs/20250101-120000.json
+
+import argparse
+import importlib
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+from datetime import datetime
+from typing import Dict, List, Optional
+
+RUNS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "runs")
+
+# 이름 -> 모듈 (각 모듈의 run()이 {지표: 값}을 반환)
+SUITE = {
+    "search": "benchmarks.bench_search",
+    "relevance": "benchmarks.bench_relevance",
+    "export": "benchmarks.bench_export",
+    "journal_matcher": "benchmarks.bench_journal_matcher",
+    "keyword_matcher": "benchmarks.bench_keyword_matcher",
+    "openalex_abstract": "benchmarks.bench_openalex_abstract",
+}
+
+# --quick: CI에서 1분 안에 끝나는 크기
+QUICK_PARAMS = {
+    "search": {"repeats": 2},
+    "relevance": {"sizes": (10_000,)},
+    "export": {"n": 10_000, "memory_n": 2_000},
+    "journal_matcher": {"n": 2_000},
+    "keyword_matcher": {"n": 1_000},
+    "openalex_abstract": {"pages": 5},
+}
+
+# 지표 이름으로 좋아지는 방향을 판단 (해당 없는 지표는 비교하지 않음)
+HIGHER_IS_BETTER = ("_per_sec", "speedup")
+LOWER_IS_BETTER = ("_seconds", "_ms", "_mb")
+
+def _git_commit() -> Optional[str]:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True,
+            cwd=os.path.dirname(RUNS_DIR)
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+def run_suite(names: List[str], quick: bool = False) -> Dict:
+    report = {
+        "started_at": datetime.now().isoformat(timespec="seconds"),
+        "commit": _git_commit(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "quick": quick,
+        "benchmarks": {},
+    }
+    for name in names:
+        module = importlib.import_module(SUITE[name])
+        started = time.perf_counter()
+        results = module.run(**(QUICK_PARAMS.get(name, {}) if quick else {}))
+        results["wall_seconds"] = round(time.perf_counter() - started, 2)
+        report["benchmarks"][name] = results
+        print(f"[{name}] {results['wall_seconds']}s", file=sys.stderr)
+    return report
+
+def _direction(metric: str) -> int:
+    if metric == "wall_seconds":
+        return 0
+    if any(part in metric for part in HIGHER_IS_BETTER):
+        return 1
+    if metric.endswith(LOWER_IS_BETTER):
+        return -1
+    return 0
+
+def compare(current: Dict, baseline: Dict, threshold: float = 0.1) -> List[Dict]:
+    """기준 실행 대비 threshold(비율) 넘게 나빠진 지표 목록"""
+    regressions = []
+    for name, results in current["benchmarks"].items():
+        base_results = baseline.get("benchmarks", {}).get(name, {})
+        for metric, value in results.items():
+            base = base_results.get(metric)
+            direction = _direction(metric)
+            if not direction or not isinstance(value, (int, float)) or not isinstance(base, (int, float)) or not base:
+                continue
+            change = (value - base) / base * direction
+            if change < -threshold:
+                regressions.append({"benchmark": name, "metric": metric, "baseline": base, "current": value, "change": round(change, 3)})
+    return regressions
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="벤치마크 전체 실행 및 이전 결과와 비교")
+    parser.add_argument("--only", help=f"실행할 벤치마크, 쉼표로 구분 ({', '.join(SUITE)})")
+    parser.add_argument("--quick", action="store_true", help="작은 크기로 빠르게 실행")
+    parser.add_argument("--out", default=RUNS_DIR, help="결과 저장 폴더")
+    parser.add_argument("--compare", metavar="PATH", help="비교할 이전 결과 파일 (기본: 같은 모드의 가장 최근 실행)")
+    parser.add_argument("--threshold", type=float, default=0.1, help="성능 저하로 볼 변화 비율 (기본 0.1 = 10%%)")
+    return parser.parse_args(argv)
+
+def _latest_run(out: str, quick: bool) -> Optional[str]:
+    if not os.path.isdir(out):
+        return None
+    for filename in sorted(os.listdir(out), reverse=True):
+        if not filename.endswith(".json"):
+            continue
+        path = os.path.join(out, filename)
+        with open(path, encoding="utf-8") as f:
+            if json.load(f).get("quick") == quick:
+                return path
+    return None
+
+def main(argv=None):
+    args = parse_args(argv)
+    names = [n.strip() for n in args.only.split(",")] if args.only else list(SUITE)
+    for name in names:
+        if name not in SUITE:
+            raise SystemExit(f"알 수 없는 벤치마크: {name} (가능: {', '.join(SUITE)})")
+    
+    baseline_path = args.compare or _latest_run(args.out, args.quick)
+    report = run_suite(names, args.quick)
+    
+    os.makedirs(args.out, exist_ok=True)
+    path = os.path.join(args.out, datetime.now().strftime("%Y%m%d-%H%M%S") + ".json")
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(report, f, ensure_ascii=False, indent=2)
+    
+    for name, results in report["benchmarks"].items():
+        print(f"\n## {name}")
+        for key, value in results.items():
+            print(f"{key:>40}: {value}")
+    print(f"\n결과: {path}")
+    
+    if baseline_path:
+        with open(baseline_path, encoding="utf-8") as f:
+            baseline = json.load(f)
+        regressions = compare(report, baseline, args.threshold)
+        print(f"비교 기준: {baseline_path} ({baseline.get('commit')})")
+        for r in regressions:
+            print(f"  느려짐: {r['benchmark']}.{r['metric']} {r['baseline']} -> {r['current']} ({r['change']:+.0%})")
+        if regressions:
+            return 1
+        print("  성능 저하 없음")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
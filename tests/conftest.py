@@ -0,0 +1,7 @@
+# tests/conftest.py
+# 테스트 공통 설정: 캐시/코퍼스 파일을 임시 디렉터리에 두어 개발용 .cache/를 건드리지 않음
+
+import os
+import tempfile
+
+os.environ.setdefault("PAPER_TRACKER_CACHE_DIR", tempfile.mkdtemp(prefix="paper-tracker-tests-"))
@@ -0,0 +1,45 @@
+# tests/test_corpus.py
+# 로컬 코퍼스: 받아 둔 연도 구간(coverage)과 아직 받지 않은 구간 계산
+
+import pytest
+
+from utils import search
+from utils.corpus import PaperCorpus
+
+SCOPE = {"venues": None}
+
+@pytest.fixture
+def corpus():
+    return PaperCorpus(":memory:")
+
+def test_gaps_around_covered_ranges(corpus):
+    corpus.record_coverage("Semantic Scholar", "ai", SCOPE, 2016, 2018, 0, 200)
+    corpus.record_coverage("Semantic Scholar", "ai", SCOPE, 2021, 2022, 0, 200)
+    assert corpus.find_gaps("Semantic Scholar", "ai", SCOPE, 2015, 2024, 0, 200) == [(2015, 2015), (2019, 2020), (2023, 2024)]
+    assert corpus.find_gaps("Semantic Scholar", "ai", SCOPE, 2016, 2018, 0, 200) == []
+
+def test_coverage_only_counts_for_compatible_searches(corpus):
+    corpus.record_coverage("OpenAlex", "ai", SCOPE, 2015, 2024, 10, 100)
+    # 인용수 조건이 더 느슨하거나, 더 많은 결과를 원하거나, 다른 소스/범위면 다시 받아야 함
+    assert corpus.find_gaps("OpenAlex", "ai", SCOPE, 2015, 2024, 0, 100) == [(2015, 2024)]
+    assert corpus.find_gaps("OpenAlex", "ai", SCOPE, 2015, 2024, 10, 200) == [(2015, 2024)]
+    assert corpus.find_gaps("Semantic Scholar", "ai", SCOPE, 2015, 2024, 10, 100) == [(2015, 2024)]
+    assert corpus.find_gaps("OpenAlex", "ai", {"venues": ["x"]}, 2015, 2024, 10, 100) == [(2015, 2024)]
+    assert corpus.find_gaps("OpenAlex", "ai", SCOPE, 2015, 2024, 20, 50) == []
+
+@pytest.mark.parametrize("partial, expected_gaps", [(False, []), (True, [(2015, 2024)])])
+def test_only_complete_fetches_are_recorded(corpus, monkeypatch, partial, expected_gaps):
+    monkeypatch.setattr(search, "get_corpus", lambda: corpus)
+    
+    def fetch(query, year_start, year_end, min_citations, limit, **kwargs):
+        if partial:
+            search._report_missing("semantic", query, 1)
+        return [{"id": "s1", "title": "Service robots", "source": "Semantic Scholar", "year": 2020}]
+    
+    token = search._missing_pages.set([])
+    try:
+        papers = search._search_with_corpus("semantic", fetch, "ai", 2015, 2024, 0, 100)
+    finally:
+        search._missing_pages.reset(token)
+    assert [paper["id"] for paper in papers] == ["s1"]
+    assert corpus.find_gaps("Semantic Scholar", "ai", {}, 2015, 2024, 0, 100) == expected_gaps
@@ -0,0 +1,89 @@
+# tests/test_deadline.py
+# 마감 시간과 요청 합치기/속도 제한/hedging의 상호작용
+
+import threading
+import time
+
+import pytest
+
+from utils import http, search
+from utils.http import DeadlineExceeded, TokenBucket, deadline_scope
+from utils.singleflight import SingleFlight
+
+def test_follower_falls_back_after_timeout():
+    flight = SingleFlight()
+    release = threading.Event()
+    leader = threading.Thread(target=lambda: flight.do("key", lambda: release.wait(5) and "leader"))
+    leader.start()
+    while not flight.in_flight():
+        time.sleep(0.001)
+    
+    assert flight.do("key", lambda: "own", timeout=0.05) == ("own", False)
+    release.set()
+    leader.join()
+
+def test_follower_without_timeout_shares_result():
+    flight = SingleFlight()
+    release = threading.Event()
+    leader = threading.Thread(target=lambda: flight.do("key", lambda: release.wait(5) and "leader"))
+    leader.start()
+    while not flight.in_flight():
+        time.sleep(0.001)
+    
+    threading.Timer(0.05, release.set).start()
+    assert flight.do("key", lambda: "own") == ("leader", True)
+    leader.join()
+
+def test_token_bucket_does_not_sleep_past_max_wait():
+    bucket = TokenBucket(rate=1.0, capacity=1)
+    assert bucket.acquire() == 0.0
+    started = time.monotonic()
+    assert bucket.acquire(max_wait=0.1) is None
+    assert time.monotonic() - started < 0.05
+    # 거절된 요청은 토큰을 쓰지 않음
+    assert bucket.acquire(max_wait=1.5) == pytest.approx(1.0, abs=0.1)
+
+def test_page_without_deadline_does_not_join_deadline_request(monkeypatch):
+    release = threading.Event()
+    
+    def fake_load(url, params, key):
+        if http.time_remaining() is not None:
+            release.wait(5)
+            raise DeadlineExceeded("leader ran out of time")
+        return {"results": ["own"]}
+    
+    monkeypatch.setattr(search, "_load_json", fake_load)
+    errors = []
+    
+    def with_deadline():
+        with deadline_scope(5):
+            try:
+                search._cached_get_json("https://api.openalex.org/works", {"search": "ai"})
+            except DeadlineExceeded as e:
+                errors.append(e)
+    
+    leader = threading.Thread(target=with_deadline)
+    leader.start()
+    while not search._request_flight.in_flight():
+        time.sleep(0.001)
+    
+    assert search._cached_get_json("https://api.openalex.org/works", {"search": "ai"}) == {"results": ["own"]}
+    release.set()
+    leader.join()
+    assert len(errors) == 1
+
+@pytest.mark.parametrize("host, expected_calls", [
+    ("api.semanticscholar.org", 1),
+    ("api.openalex.org", 2),
+])
+def test_hedging_skips_rate_limited_hosts(monkeypatch, host, expected_calls):
+    calls = []
+    
+    def slow_get_json(url, params=None, timeout=30):
+        calls.append(url)
+        time.sleep(0.2)
+        return {}
+    
+    monkeypatch.setattr(http, "get_json", slow_get_json)
+    http.get_json_hedged(f"https://{host}/search", hedge_after=0.05)
+    assert len(calls) == expected_calls
@@ -0,0 +1,53 @@
+# tests/test_dedup.py
+# 중복 병합: DOI/ID 정확 매칭, 제목 유사 매칭, 그룹 단위 충돌 검사
+
+from utils.dedup import DuplicateIndex, merge_duplicates
+
+def paper(source, id, title, doi="", year=2024, **fields):
+    return {"source": source, "id": id, "title": title, "doi": doi, "year": year, **fields}
+
+def test_exact_doi_and_title_matches():
+    merged = merge_duplicates([
+        paper("semantic", "s1", "Service robots in hotels", doi="10.1/abc", citations=3),
+        paper("openalex", "W1", "Service Robots in Hotels.", doi="https://doi.org/10.1/ABC", citations=5),
+        paper("openalex", "W2", "Service robots in hotels: a review", abstract="long abstract"),
+    ])
+    assert len(merged) == 2
+    assert merged[0]["sources"] == ["semantic", "openalex"]
+    assert merged[0]["citations"] == 5
+
+def test_keeps_numbered_parts_and_distant_years_apart():
+    merged = merge_duplicates([
+        paper("semantic", "s1", "Smart tourism destinations Part 1"),
+        paper("openalex", "W1", "Smart tourism destinations Part 2"),
+        paper("crossref", "c1", "Smart tourism destinations Part 1", year=2018),
+    ])
+    assert len(merged) == 3
+
+def test_similar_titles_from_same_source_stay_apart():
+    merged = merge_duplicates([
+        paper("semantic", "s1", "Service robot acceptance in hotel settings"),
+        paper("semantic", "s2", "Service robots acceptance in hotel setting"),
+    ])
+    assert len(merged) == 2
+
+def test_bridge_record_does_not_merge_conflicting_groups():
+    # s1/s2는 제목이 거의 같은 별개의 Semantic Scholar 논문, W1은 둘 다와 비슷한 OpenAlex 레코드
+    # W1이 s1과 묶인 뒤 s2와의 쌍만 보면 병합 가능해 보이지만, 그러면 s1과 s2가 한 그룹이 됨
+    index = DuplicateIndex()
+    index.add_many([
+        paper("semantic", "s1", "Service robot acceptance in hotel settings"),
+        paper("openalex", "W1", "Service robots acceptance in hotel settings"),
+        paper("semantic", "s2", "Service robots acceptance in hotel setting"),
+    ])
+    assert index.group_of(1) == index.group_of(0)
+    assert index.group_of(2) != index.group_of(0)
+    assert len(index.merged()) == 2
+
+def test_bridge_record_does_not_merge_conflicting_dois():
+    index = DuplicateIndex()
+    index.add(paper("semantic", "s1", "Service robot acceptance in hotel settings", doi="10.1/a"))
+    index.add(paper("openalex", "W1", "Service robots acceptance in hotel settings"))
+    index.add(paper("crossref", "c1", "Service robots acceptance in hotel setting", doi="10.1/b"))
+    assert index.group_of(1) == 0
+    assert index.group_of(2) == 2
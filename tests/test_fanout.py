@@ -0,0 +1,18 @@
+# tests/test_fanout.py
+# 하위 쿼리 분할: 요청 예산과 예산을 넘는 키워드 그룹 처리
+
+from utils.search import PAGE_SIZE, plan_fanout
+
+def test_plan_respects_budget():
+    plan = plan_fanout([["a"], ["b"], ["c"]], n_sources=2, search_limit=1000, budget=12)
+    assert [query for query, _ in plan] == ["a", "b", "c"]
+    assert all(limit == 2 * PAGE_SIZE for _, limit in plan)
+
+def test_extra_groups_are_merged_not_dropped():
+    groups = [["a", "a2"], ["b"], ["c"], ["d"], ["e"]]
+    plan = plan_fanout(groups, n_sources=2, search_limit=100, budget=4)
+    assert [query for query, _ in plan] == ["a OR a2 OR c OR e", "b OR d"]
+    assert groups[0] == ["a", "a2"]
+
+def test_empty_groups():
+    assert plan_fanout([[], []], n_sources=2, search_limit=100) == []
@@ -0,0 +1,62 @@
+# tests/test_matcher.py
+# KeywordMatcher: 단어 경계 매칭과 예/아니오 판정(has_keyword/has_context)과 find의 일치
+
+import pytest
+
+from config.keywords import KEYWORD_EXPANSIONS, get_all_expanded_terms
+from utils import matcher
+from utils.matcher import KeywordMatcher
+from utils.search import DEFAULT_CONTEXT_KEYWORDS, check_relevance
+
+TEXTS = [
+    "",
+    "we said the model explains loyalty",
+    "AI-based service robots in hotels",
+    "Artificial-Intelligence adoption by tourists",
+    "robotics and automation in hospitality",
+    "smart tourism technologies",
+    "x_ai_y token and chatbots",
+    "Trust in AI. Acceptance of robots!",
+    "virtual reality, augmented reality and destination image",
+]
+
+def test_word_boundaries():
+    m = KeywordMatcher(["AI", "robot", "technology"], [])
+    assert not m.has_keyword("we said nothing")
+    assert not m.has_keyword("robotics research")
+    assert m.matched_keywords("robotics and AI-based robots") == ["AI", "robot"]
+    assert m.matched_keywords("new technologies") == ["technology"]
+
+def test_multi_word_terms_span_punctuation():
+    m = KeywordMatcher(["artificial intelligence"], [])
+    assert m.has_keyword("Artificial-Intelligence adoption")
+    assert m.matched_keywords("artificial  intelligence") == ["artificial intelligence"]
+    assert not m.has_keyword("artificial intelligent agents")
+
+@pytest.mark.parametrize("literal_scan_max", [0, matcher.LITERAL_SCAN_MAX_TERMS])
+@pytest.mark.parametrize("keywords", [
+    ["AI", "Acceptance", "Tourism", "Trust"],
+    ["service robot", "technology", "AI", "smart tourism"],
+    get_all_expanded_terms(list(KEYWORD_EXPANSIONS.keys())),
+])
+def test_scans_agree_with_find(monkeypatch, keywords, literal_scan_max):
+    monkeypatch.setattr(matcher, "LITERAL_SCAN_MAX_TERMS", literal_scan_max)
+    m = KeywordMatcher(keywords, DEFAULT_CONTEXT_KEYWORDS)
+    for text in TEXTS:
+        hits = m.find(text)
+        assert m.has_keyword(text) == bool(hits["keywords"]), text
+        assert m.matched_keywords(text) == hits["keywords"], text
+        assert m.has_context(text) == bool(hits["context"]), text
+
+def test_check_relevance_priorities():
+    keywords = ["chatbot"]
+    journals = ["Tourism Management"]
+    paper = {"title": "Chatbots at the front desk", "abstract": "", "venue": "Tourism Management"}
+    assert check_relevance(paper, keywords, journals)["priority"] == "High"
+    paper["venue"] = "Other Journal"
+    paper["abstract"] = "evidence from hotels"
+    assert check_relevance(paper, keywords, journals)["priority"] == "Medium"
+    paper["abstract"] = "evidence from factories"
+    assert check_relevance(paper, keywords, journals)["priority"] == "Low"
+    assert check_relevance(paper, keywords, journals, strict_journal_filter=True) is None
+    assert check_relevance({"title": "Chatbotics in factories", "abstract": ""}, keywords, journals) is None
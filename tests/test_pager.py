@@ -0,0 +1,65 @@
+# tests/test_pager.py
+# 적응형 페이지 요청: 고정 페이지 수, 깊은 페이지의 조기 중단, Semantic Scholar offset 한도
+
+import pytest
+
+from utils import search
+from utils.search import PAGE_SIZE, AdaptivePager
+
+@pytest.fixture
+def semantic_pages(monkeypatch):
+    """요청한 offset을 기록하고 항상 꽉 찬 페이지를 돌려주는 가짜 Semantic Scholar"""
+    offsets = []
+    
+    def fake_page(url, params):
+        offsets.append(params["offset"])
+        return [{"id": f"s{params['offset'] + i}", "citations": 0} for i in range(PAGE_SIZE)]
+    
+    monkeypatch.setattr(search, "_fetch_semantic_scholar_page", fake_page)
+    monkeypatch.setattr(search, "_store_in_corpus", lambda papers: None)
+    return offsets
+
+def run_with_pager(pager, **kwargs):
+    token = search._pager.set(pager)
+    try:
+        return search.search_semantic_scholar("service robot", **kwargs)
+    finally:
+        search._pager.reset(token)
+
+def test_no_pager_uses_fixed_paging(semantic_pages):
+    results = run_with_pager(None, limit=200)
+    assert sorted(semantic_pages) == [0, 100]
+    assert len(results) == 200
+
+def test_shallow_pager_keeps_fixed_paging(semantic_pages):
+    # 고정 페이지 수를 넘지 않는 페이저는 무시하고 페이지를 동시에 받음 (적중률이 낮아도 멈추지 않음)
+    results = run_with_pager(AdaptivePager(lambda paper: False, max_pages=2), limit=200)
+    assert sorted(semantic_pages) == [0, 100]
+    assert len(results) == 200
+
+def test_low_hit_rate_stops_early(semantic_pages):
+    run_with_pager(AdaptivePager(lambda paper: False, max_pages=5), limit=200)
+    assert semantic_pages == [0]
+
+def test_deep_paging_is_clamped_to_offset_limit(semantic_pages):
+    results = run_with_pager(AdaptivePager(lambda paper: True, max_pages=20), limit=200)
+    assert max(semantic_pages) == search.SEMANTIC_SCHOLAR_MAX_RESULTS - PAGE_SIZE
+    assert len(semantic_pages) == search.SEMANTIC_SCHOLAR_MAX_RESULTS // PAGE_SIZE
+    assert len(results) == search.SEMANTIC_SCHOLAR_MAX_RESULTS
+
+@pytest.mark.parametrize("max_pages, expected", [(None, None), (5, 5)])
+def test_search_and_filter_sets_pager(monkeypatch, max_pages, expected):
+    seen = []
+    
+    def fake_search(query, *args, **kwargs):
+        pager = search._pager.get()
+        seen.append(pager.max_pages if pager is not None else None)
+        return []
+    
+    monkeypatch.setattr(search, "search_semantic_scholar", fake_search)
+    monkeypatch.setattr(search, "PAGER_MAX_PAGES", None)
+    search.search_and_filter(
+        ["pager test"], ["Tourism Management"], search_source="semantic",
+        use_corpus=False, enrich=False, max_pages=max_pages
+    )
+    assert seen == [expected]
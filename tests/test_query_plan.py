@@ -0,0 +1,38 @@
+# tests/test_query_plan.py
+# 검색 조건의 API 위임: Semantic Scholar venue 목록과 쉼표가 들어간 저널명
+
+import pytest
+
+from utils import search
+from utils.search import plan_query
+
+COMMA_JOURNAL = "Computers, Environment and Urban Systems"
+
+@pytest.fixture
+def semantic_params(monkeypatch):
+    """search_semantic_scholar가 만든 페이지 요청 파라미터를 기록"""
+    requested = []
+    
+    def fake_page(url, params):
+        requested.append(params)
+        return []
+    
+    monkeypatch.setattr(search, "_fetch_semantic_scholar_page", fake_page)
+    monkeypatch.setattr(search, "_store_in_corpus", lambda papers: None)
+    return requested
+
+def semantic_search(journals):
+    plan = plan_query(journals, journals_only=True, search_source="semantic")
+    search.search_semantic_scholar("smart city", limit=100, **plan["sources"]["semantic"]["kwargs"])
+    return plan
+
+def test_venues_pushed_to_semantic_scholar(semantic_params):
+    plan = semantic_search(["Tourism Management", "Cities"])
+    assert semantic_params[0]["venue"] == "Tourism Management,Cities"
+    assert "journals" in plan["sources"]["semantic"]["pushed"]
+
+def test_comma_in_journal_name_keeps_venue_filter_client_side(semantic_params):
+    plan = semantic_search(["Tourism Management", COMMA_JOURNAL])
+    assert "venue" not in semantic_params[0]
+    assert "journals" not in plan["sources"]["semantic"]["pushed"]
+    assert "journals" in plan["client_filters"]
@@ -0,0 +1,75 @@
+# tests/test_watch.py
+# 저장된 검색: watch별 잠금이 검색 요청 동안 다른 watch를 막지 않는지
+
+import threading
+from datetime import date
+
+import pytest
+
+from utils import watch as watch_module
+from utils.resultset import ResultSet
+
+@pytest.fixture(autouse=True)
+def watch_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(watch_module, "WATCH_DIR", str(tmp_path))
+    monkeypatch.setattr(watch_module, "fetch_citations", lambda results: {})
+
+def test_different_watches_search_concurrently(monkeypatch):
+    both_searching = threading.Barrier(2, timeout=5)
+    
+    def fake_search(keywords, target_journals, **kwargs):
+        both_searching.wait()  # 잠금을 잡은 채 검색하면 두 번째 watch가 여기 오지 못해 시간 초과
+        return ResultSet.from_dicts([{"id": keywords[0], "title": keywords[0], "source": "OpenAlex"}], meta={"missing": []})
+    
+    monkeypatch.setattr(watch_module, "search_and_filter", fake_search)
+    runs = {}
+    threads = [
+        threading.Thread(target=lambda name=name: runs.setdefault(name, watch_module.run_watch(name, [name], [])))
+        for name in ("alpha", "beta")
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert sorted(runs) == ["alpha", "beta"]
+    assert [paper["id"] for paper in runs["alpha"]["results"]] == ["alpha"]
+
+class FakeDate(date):
+    """date.today()를 테스트에서 정한 날짜로 바꾼 date"""
+    current = date(2026, 1, 1)
+    
+    @classmethod
+    def today(cls):
+        return cls.current
+
+def test_incremental_run_keeps_high_water_for_missing_source(monkeypatch):
+    monkeypatch.setattr(watch_module, "date", FakeDate)
+    monkeypatch.setattr(FakeDate, "current", date(2026, 1, 1))
+    responses = [
+        ResultSet.from_dicts([{"id": "W1", "title": "First", "source": "OpenAlex"}], meta={"missing": []}),
+        ResultSet.from_dicts(
+            [{"id": "W2", "title": "Second", "source": "OpenAlex"}],
+            meta={"missing": [{"source": "openalex", "page": 1}]}
+        ),
+    ]
+    monkeypatch.setattr(watch_module, "search_and_filter", lambda *args, **kwargs: responses.pop(0))
+    first = watch_module.run_watch("gamma", ["ai"], [])
+    assert first["high_water"] == {"semantic": "2026-01-01", "openalex": "2026-01-01"}
+    
+    monkeypatch.setattr(FakeDate, "current", date(2026, 2, 1))
+    second = watch_module.run_watch("gamma", ["ai"], [])
+    assert second["run"]["mode"] == "incremental"
+    assert second["run"]["new"] == 1
+    assert {paper["id"] for paper in second["results"]} == {"W1", "W2"}
+    # 페이지가 빠진 소스만 기준 날짜를 유지해 다음 실행에서 다시 받음
+    assert second["high_water"] == {"semantic": "2026-02-01", "openalex": "2026-01-01"}
+
+def test_apply_citations_keeps_merged_maximum():
+    results = [
+        {"id": "W1", "citations": 40},  # 다른 소스에서 병합된 더 큰 인용수
+        {"id": "W2", "citations": 3},
+        {"id": "W3", "citations": 7},
+    ]
+    changed = watch_module.apply_citations(results, {"W1": 12, "W2": 5})
+    assert changed == 1
+    assert [paper["citations"] for paper in results] == [40, 5, 7]
@@ -5,12 +5,96 @@ from .search import (
     search_semantic_scholar,
     search_openalex,
     search_and_filter,
+    stream_search,
     check_relevance,
-    match_journal
+    match_journal,
+    reconstruct_abstract,
+    plan_query,
+    plan_fanout,
+    fuse_rankings,
+    fetch_semantic_scholar_citations,
+    fetch_openalex_citations,
+    enrich_papers,
+    get_search_cache_stats,
+    clear_search_cache
+)
+
+from .matcher import (
+    JournalMatcher,
+    KeywordMatcher,
+    get_journal_matcher,
+    get_keyword_matcher,
+    normalize_venue
+)
+
+from .dedup import (
+    DuplicateIndex,
+    merge_duplicates,
+    normalize_doi
+)
+
+from .http import (
+    get_http_stats,
+    reset_http_stats
+)
+
+from .cache import (
+    get_response_cache,
+    get_cache_stats
+)
+
+from .corpus import (
+    PaperCorpus,
+    get_corpus
+)
+
+from .enrich import (
+    EnrichmentStore,
+    get_enrichment_store
+)
+
+from .watch import (
+    run_watch,
+    load_watch,
+    list_watches,
+    delete_watch,
+    merge_results,
+    refresh_citations
+)
+
+from .resultset import (
+    ResultSet,
+    ResultSetBuilder,
+    PaperRow
 )
 
 from .export import (
     to_csv,
     to_bibtex,
-    get_summary_stats
+    write_csv,
+    write_bibtex,
+    write_parquet,
+    write_arrow,
+    to_parquet,
+    load_results,
+    get_summary_stats,
+    aggregate_results,
+    EXPORT_FORMATS,
+    register_export_format,
+    fingerprint_papers,
+    get_export
+)
+
+from .metrics import (
+    Trace,
+    start_trace,
+    finish_trace,
+    span,
+    count,
+    traced
+)
+
+from .singleflight import (
+    SingleFlight,
+    LRUCache
 )
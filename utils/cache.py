@@ -0,0 +1,149 @@
+# utils/cache.py
+# API 응답 디스크 캐시 (SQLite + TTL + LRU 제거 + 압축 저장)
+
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+import zlib
+from typing import Dict, Optional
+
+# 캐시 설정 (환경 변수로 변경 가능)
+CACHE_DIR = os.environ.get(
+    "PAPER_TRACKER_CACHE_DIR",
+    os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), ".cache")
+)
+CACHE_ENABLED = os.environ.get("PAPER_TRACKER_CACHE", "1") != "0"
+CACHE_TTL = int(os.environ.get("PAPER_TRACKER_CACHE_TTL", 24 * 60 * 60))  # 초
+CACHE_MAX_BYTES = int(os.environ.get("PAPER_TRACKER_CACHE_MAX_BYTES", 200 * 1024 * 1024))
+
+def make_cache_key(endpoint: str, params: Dict = None) -> str:
+    """요청(엔드포인트 + 파라미터)을 정규화한 캐시 키"""
+    canonical = json.dumps({"endpoint": endpoint, "params": params or {}}, sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+class ResponseCache:
+    """SQLite 기반 응답 캐시 (스레드 안전)"""
+    
+    def __init__(self, path: str, ttl: int = CACHE_TTL, max_bytes: int = CACHE_MAX_BYTES):
+        self.path = path
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        
+        if path != ":memory:":
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None, timeout=30)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS responses (
+                key TEXT PRIMARY KEY,
+                endpoint TEXT NOT NULL,
+                payload BLOB NOT NULL,
+                size INTEGER NOT NULL,
+                created_at REAL NOT NULL,
+                accessed_at REAL NOT NULL
+            )
+        """)
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_responses_accessed ON responses(accessed_at)")
+        self._total_bytes = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+    
+    def get(self, key: str):
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute("SELECT payload, created_at FROM responses WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                self.misses += 1
+                return None
+            payload, created_at = row
+            if now - created_at > self.ttl:
+                self._delete(key)
+                self.misses += 1
+                return None
+            self._conn.execute("UPDATE responses SET accessed_at = ? WHERE key = ?", (now, key))
+            self.hits += 1
+        return json.loads(zlib.decompress(payload))
+    
+    def set(self, key: str, endpoint: str, value):
+        payload = zlib.compress(json.dumps(value, ensure_ascii=False).encode("utf-8"), 6)
+        size = len(payload)
+        if size > self.max_bytes:
+            return
+        now = time.time()
+        with self._lock:
+            old = self._conn.execute("SELECT size FROM responses WHERE key = ?", (key,)).fetchone()
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses (key, endpoint, payload, size, created_at, accessed_at) VALUES (?, ?, ?, ?, ?, ?)",
+                (key, endpoint, payload, size, now, now)
+            )
+            self._total_bytes += size - (old[0] if old else 0)
+            if self._total_bytes > self.max_bytes:
+                self._evict()
+    
+    def _delete(self, key: str):
+        row = self._conn.execute("SELECT size FROM responses WHERE key = ?", (key,)).fetchone()
+        if row:
+            self._conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+            self._total_bytes -= row[0]
+    
+    def _evict(self):
+        """만료 항목을 먼저 지우고, 그래도 넘치면 가장 오래 안 쓴 항목부터 제거 (LRU)"""
+        self._conn.execute("DELETE FROM responses WHERE created_at < ?", (time.time() - self.ttl,))
+        self._total_bytes = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+        
+        # 여유분을 두고 최대 용량의 90%까지 줄임
+        target = int(self.max_bytes * 0.9)
+        if self._total_bytes <= target:
+            return
+        freed = 0
+        victims = []
+        for key, size in self._conn.execute("SELECT key, size FROM responses ORDER BY accessed_at"):
+            victims.append((key,))
+            freed += size
+            if self._total_bytes - freed <= target:
+                break
+        self._conn.executemany("DELETE FROM responses WHERE key = ?", victims)
+        self._total_bytes -= freed
+    
+    def clear(self):
+        with self._lock:
+            self._conn.execute("DELETE FROM responses")
+            self._total_bytes = 0
+            self.hits = 0
+            self.misses = 0
+    
+    def stats(self) -> Dict:
+        with self._lock:
+            entries = self._conn.execute("SELECT COUNT(*) FROM responses").fetchone()[0]
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / lookups, 3) if lookups else 0.0,
+                "entries": entries,
+                "bytes": self._total_bytes,
+            }
+
+_cache: Optional[ResponseCache] = None
+_cache_lock = threading.Lock()
+
+def get_response_cache() -> Optional[ResponseCache]:
+    """프로세스 공용 응답 캐시 (비활성화 시 None)"""
+    global _cache
+    if not CACHE_ENABLED:
+        return None
+    with _cache_lock:
+        if _cache is None:
+            _cache = ResponseCache(os.path.join(CACHE_DIR, "responses.sqlite"))
+        return _cache
+
+def get_cache_stats() -> Dict:
+    cache = get_response_cache()
+    if cache is None:
+        return {"hits": 0, "misses": 0, "hit_rate": 0.0, "entries": 0, "bytes": 0}
+    return cache.stats()
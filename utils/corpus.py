@@ -0,0 +1,229 @@
+# utils/corpus.py
+# 로컬 논문 코퍼스 (SQLite + FTS5): 한 번 받은 논문을 저장해 재검색은 로컬에서 처리
+
+import json
+import os
+import sqlite3
+import threading
+import time
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from .cache import CACHE_DIR
+
+CORPUS_ENABLED = os.environ.get("PAPER_TRACKER_CORPUS", "1") != "0"
+# 이 기간 안에 받은 검색 범위는 API를 다시 호출하지 않고 로컬에서 응답
+CORPUS_COVERAGE_TTL = int(os.environ.get("PAPER_TRACKER_CORPUS_TTL", 7 * 24 * 60 * 60))  # 초
+
+PAPER_COLUMNS = ["id", "doi", "title", "abstract", "year", "citations", "authors", "venue", "url", "pdf_url", "source"]
+
+def _paper_key(paper: Dict) -> str:
+    return f"{paper.get('source', '')}:{paper.get('id') or paper.get('doi') or paper.get('title', '')}"
+
+def _fts_query(query: str) -> str:
+    """'a OR b c' 형태의 검색어를 FTS5 구절 OR 검색식으로 변환"""
+    terms = [t.strip() for t in query.split(" OR ") if t.strip()]
+    return " OR ".join('"' + t.replace('"', '""') + '"' for t in terms)
+
+class PaperCorpus:
+    """논문 저장소 + 제목/초록 전문 검색 색인 + 검색 범위(coverage) 기록"""
+    
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+        if path != ":memory:":
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None, timeout=30)
+        self._conn.row_factory = sqlite3.Row
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript("""
+            CREATE TABLE IF NOT EXISTS papers (
+                key TEXT PRIMARY KEY,
+                id TEXT,
+                doi TEXT,
+                title TEXT,
+                abstract TEXT,
+                year INTEGER,
+                citations INTEGER,
+                authors TEXT,
+                venue TEXT,
+                url TEXT,
+                pdf_url TEXT,
+                source TEXT,
+                updated_at REAL
+            );
+            CREATE INDEX IF NOT EXISTS idx_papers_doi ON papers(doi);
+            CREATE INDEX IF NOT EXISTS idx_papers_source_year ON papers(source, year);
+            CREATE INDEX IF NOT EXISTS idx_papers_venue ON papers(venue);
+            CREATE INDEX IF NOT EXISTS idx_papers_citations ON papers(citations);
+            
+            CREATE VIRTUAL TABLE IF NOT EXISTS papers_fts USING fts5(
+                title, abstract, content='papers', content_rowid='rowid', tokenize='porter unicode61'
+            );
+            CREATE TRIGGER IF NOT EXISTS papers_ai AFTER INSERT ON papers BEGIN
+                INSERT INTO papers_fts(rowid, title, abstract) VALUES (new.rowid, new.title, new.abstract);
+            END;
+            CREATE TRIGGER IF NOT EXISTS papers_ad AFTER DELETE ON papers BEGIN
+                INSERT INTO papers_fts(papers_fts, rowid, title, abstract) VALUES ('delete', old.rowid, old.title, old.abstract);
+            END;
+            CREATE TRIGGER IF NOT EXISTS papers_au AFTER UPDATE ON papers BEGIN
+                INSERT INTO papers_fts(papers_fts, rowid, title, abstract) VALUES ('delete', old.rowid, old.title, old.abstract);
+                INSERT INTO papers_fts(rowid, title, abstract) VALUES (new.rowid, new.title, new.abstract);
+            END;
+            
+            CREATE TABLE IF NOT EXISTS coverage (
+                source TEXT NOT NULL,
+                query TEXT NOT NULL,
+                scope TEXT NOT NULL,
+                year_start INTEGER NOT NULL,
+                year_end INTEGER NOT NULL,
+                min_citations INTEGER NOT NULL,
+                max_results INTEGER NOT NULL,
+                fetched_at REAL NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS idx_coverage_query ON coverage(source, query, scope);
+        """)
+    
+    def upsert(self, papers: List[Dict]):
+        """ID 기준으로 저장 (이미 있으면 갱신, 새 초록/PDF가 비어 있으면 기존 값 유지)"""
+        if not papers:
+            return
+        now = time.time()
+        rows = []
+        for p in papers:
+            rows.append((
+                _paper_key(p), p.get("id", ""), p.get("doi", ""), p.get("title", ""),
+                str(p.get("abstract") or ""), p.get("year"), p.get("citations", 0) or 0,
+                p.get("authors", ""), p.get("venue", ""), p.get("url", ""), p.get("pdf_url", "") or "",
+                p.get("source", ""), now
+            ))
+        with self._lock:
+            self._conn.execute("BEGIN")
+            self._conn.executemany("""
+                INSERT INTO papers (key, id, doi, title, abstract, year, citations, authors, venue, url, pdf_url, source, updated_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT(key) DO UPDATE SET
+                    doi = COALESCE(NULLIF(excluded.doi, ''), papers.doi),
+                    title = excluded.title,
+                    abstract = COALESCE(NULLIF(excluded.abstract, ''), papers.abstract),
+                    year = COALESCE(excluded.year, papers.year),
+                    citations = excluded.citations,
+                    authors = excluded.authors,
+                    venue = excluded.venue,
+                    url = excluded.url,
+                    pdf_url = COALESCE(NULLIF(excluded.pdf_url, ''), papers.pdf_url),
+                    updated_at = excluded.updated_at
+            """, rows)
+            self._conn.execute("COMMIT")
+    
+    def search(
+        self,
+        query: str,
+        source: str,
+        year_start: int,
+        year_end: int,
+        min_citations: int = 0,
+        limit: int = 100,
+        order: str = "relevance"
+    ) -> List[Dict]:
+        """FTS5 색인으로 로컬 검색 (order: relevance=bm25, citations=인용수 내림차순)"""
+        match = _fts_query(query)
+        if not match:
+            return []
+        order_by = "bm25(papers_fts)" if order == "relevance" else "p.citations DESC"
+        with self._lock:
+            rows = self._conn.execute(f"""
+                SELECT p.* FROM papers_fts
+                JOIN papers p ON p.rowid = papers_fts.rowid
+                WHERE papers_fts MATCH ?
+                  AND p.source = ? AND p.year BETWEEN ? AND ? AND p.citations >= ?
+                ORDER BY {order_by}
+                LIMIT ?
+            """, (match, source, year_start, year_end, min_citations, limit)).fetchall()
+        return [{column: row[column] for column in PAPER_COLUMNS} for row in rows]
+    
+    def record_coverage(self, source: str, query: str, scope: Dict, year_start: int, year_end: int, min_citations: int, max_results: int):
+        with self._lock:
+            self._conn.execute(
+                "INSERT INTO coverage VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (source, query, json.dumps(scope, sort_keys=True), year_start, year_end, min_citations, max_results, time.time())
+            )
+    
+    def find_gaps(
+        self,
+        source: str,
+        query: str,
+        scope: Dict,
+        year_start: int,
+        year_end: int,
+        min_citations: int,
+        max_results: int
+    ) -> List[Tuple[int, int]]:
+        """
+        요청한 연도 범위 중 아직 API로 받지 않은 구간 목록
+        
+        같은 쿼리/범위 조건으로 최근에 받았고, 인용수 조건이 같거나 느슨했고,
+        결과 수가 같거나 많았던 기록만 유효한 것으로 봄
+        """
+        with self._lock:
+            rows = self._conn.execute("""
+                SELECT year_start, year_end FROM coverage
+                WHERE source = ? AND query = ? AND scope = ?
+                  AND min_citations <= ? AND max_results >= ? AND fetched_at >= ?
+                ORDER BY year_start
+            """, (source, query, json.dumps(scope, sort_keys=True), min_citations, max_results,
+                  time.time() - CORPUS_COVERAGE_TTL)).fetchall()
+        
+        gaps = []
+        cursor = year_start
+        for covered_start, covered_end in rows:
+            if covered_end < cursor:
+                continue
+            if covered_start > year_end:
+                break
+            if covered_start > cursor:
+                gaps.append((cursor, covered_start - 1))
+            cursor = max(cursor, covered_end + 1)
+            if cursor > year_end:
+                break
+        if cursor <= year_end:
+            gaps.append((cursor, year_end))
+        return gaps
+    
+    def iter_papers(self, batch_size: int = 1000) -> Iterator[Dict]:
+        """저장된 논문 전체를 rowid 순으로 조금씩 읽어 하나씩 반환 (대용량 덤프용)"""
+        last_rowid = 0
+        while True:
+            with self._lock:
+                rows = self._conn.execute(
+                    "SELECT rowid, * FROM papers WHERE rowid > ? ORDER BY rowid LIMIT ?", (last_rowid, batch_size)
+                ).fetchall()
+            if not rows:
+                return
+            for row in rows:
+                yield {column: row[column] for column in PAPER_COLUMNS}
+            last_rowid = rows[-1]["rowid"]
+    
+    def stats(self) -> Dict:
+        with self._lock:
+            papers = self._conn.execute("SELECT COUNT(*) FROM papers").fetchone()[0]
+            queries = self._conn.execute("SELECT COUNT(DISTINCT source || query || scope) FROM coverage").fetchone()[0]
+        return {"papers": papers, "queries": queries}
+    
+    def clear(self):
+        with self._lock:
+            self._conn.execute("DELETE FROM papers")
+            self._conn.execute("DELETE FROM coverage")
+
+_corpus: Optional[PaperCorpus] = None
+_corpus_lock = threading.Lock()
+
+def get_corpus() -> Optional[PaperCorpus]:
+    """프로세스 공용 로컬 코퍼스 (비활성화 시 None)"""
+    global _corpus
+    if not CORPUS_ENABLED:
+        return None
+    with _corpus_lock:
+        if _corpus is None:
+            _corpus = PaperCorpus(os.path.join(CACHE_DIR, "corpus.sqlite"))
+        return _corpus
@@ -0,0 +1,230 @@
+# utils/dedup.py
+# 소스 간 중복 논문 병합 (DOI/ID 정확 매칭 + 제목 MinHash/LSH 유사 매칭)
+
+import re
+from typing import Dict, List, Optional
+
+import numpy as np
+
+# MinHash/LSH 설정: 64개 해시를 16개 밴드 x 4행으로 나눔
+# -> 제목 유사도 약 0.5 이상이면 후보로 잡히고, 실제 병합은 SIMILARITY_THRESHOLD로 검증
+NUM_PERM = 64
+BANDS = 16
+ROWS = NUM_PERM // BANDS
+SHINGLE_SIZE = 4
+SIMILARITY_THRESHOLD = 0.8
+MAX_YEAR_GAP = 1
+# 흔한 n-gram으로 버킷이 커져도 비교 횟수가 늘지 않도록 버킷당 비교 상한
+MAX_BUCKET_CANDIDATES = 32
+
+_PRIME = (1 << 31) - 1
+_rng = np.random.RandomState(20240101)
+_A = _rng.randint(1, _PRIME, size=NUM_PERM).astype(np.uint64)
+_B = _rng.randint(0, _PRIME, size=NUM_PERM).astype(np.uint64)
+
+_NON_ALNUM = re.compile(r"[\W_]+")
+_NUMBER = re.compile(r"\d+")
+
+def normalize_doi(doi: str) -> str:
+    """https://doi.org/10.x/y, doi:10.x/y 등을 10.x/y 소문자로 통일"""
+    if not doi:
+        return ""
+    doi = doi.strip().lower()
+    for prefix in ("https://doi.org/", "http://doi.org/", "https://dx.doi.org/", "http://dx.doi.org/", "doi:"):
+        if doi.startswith(prefix):
+            doi = doi[len(prefix):]
+            break
+    return doi
+
+def normalize_title(title: str) -> str:
+    return _NON_ALNUM.sub(" ", (title or "").lower()).strip()
+
+def _shingles(title_norm: str) -> np.ndarray:
+    """제목의 바이트 n-gram을 정수 코드로 만든 정렬된 고유 배열 (문자열 집합 대신 벡터 연산)"""
+    data = np.frombuffer(title_norm.encode("utf-8"), dtype=np.uint8).astype(np.uint64)
+    if len(data) == 0:
+        return data
+    if len(data) < SHINGLE_SIZE:
+        data = np.concatenate([data, np.zeros(SHINGLE_SIZE - len(data), dtype=np.uint64)])
+    codes = np.zeros(len(data) - SHINGLE_SIZE + 1, dtype=np.uint64)
+    for k in range(SHINGLE_SIZE):
+        codes = (codes << np.uint64(8)) | data[k:len(data) - SHINGLE_SIZE + 1 + k]
+    return np.unique(codes)
+
+def _minhash(shingles: np.ndarray) -> np.ndarray:
+    hashes = shingles % _PRIME
+    return ((_A[:, None] * hashes[None, :] + _B[:, None]) % _PRIME).min(axis=1)
+
+def _minhash_many(shingle_arrays: List[np.ndarray], chunk_size: int = 512) -> List[Optional[np.ndarray]]:
+    """여러 제목의 MinHash 서명을 청크 단위로 한 번에 계산 (빈 제목은 None)"""
+    signatures: List[Optional[np.ndarray]] = [None] * len(shingle_arrays)
+    for start in range(0, len(shingle_arrays), chunk_size):
+        chunk = [(i, arr) for i, arr in enumerate(shingle_arrays[start:start + chunk_size], start) if len(arr)]
+        if not chunk:
+            continue
+        hashes = np.concatenate([arr for _, arr in chunk]) % _PRIME
+        offsets = np.cumsum([0] + [len(arr) for _, arr in chunk[:-1]])
+        mins = np.minimum.reduceat((_A[:, None] * hashes[None, :] + _B[:, None]) % _PRIME, offsets, axis=1)
+        for column, (i, _) in enumerate(chunk):
+            signatures[i] = mins[:, column]
+    return signatures
+
+def _merge_records(records: List[Dict]) -> Dict:
+    """같은 논문으로 묶인 레코드들에서 필드별로 가장 좋은 값을 골라 하나로 병합"""
+    merged = dict(records[0])
+    if len(records) == 1:
+        merged["sources"] = [merged.get("source", "")]
+        return merged
+    
+    def first(field):
+        for r in records:
+            if r.get(field):
+                return r[field]
+        return merged.get(field)
+    
+    for field in ("title", "authors", "venue", "url", "pdf_url", "doi", "year"):
+        merged[field] = first(field)
+    
+    # 초록은 가장 긴 것, 인용수는 최댓값
+    merged["abstract"] = max((r.get("abstract") or "" for r in records), key=len)
+    merged["citations"] = max((r.get("citations") or 0 for r in records))
+    
+    sources = []
+    for r in records:
+        if r.get("source") and r["source"] not in sources:
+            sources.append(r["source"])
+    merged["sources"] = sources
+    return merged
+
+class DuplicateIndex:
+    """
+    논문을 하나씩 추가하며 중복 그룹을 관리하는 색인
+    
+    1. DOI / 소스 ID가 같으면 같은 논문
+    2. 제목 MinHash를 LSH 밴드로 버킷팅해 후보만 비교 (전체 쌍 비교 없음)
+       -> 문자 n-gram Jaccard 유사도가 임계값 이상이고 연도 차이가 작으면 같은 논문
+    
+    유사 매칭은 그룹을 통째로 합치므로 DOI/소스 ID 충돌은 두 레코드가 아니라 두 그룹 전체를 기준으로 검사
+    (OpenAlex 레코드 하나가 Semantic Scholar의 서로 다른 두 논문과 각각 비슷해도 둘을 잇지 않음)
+    """
+    
+    def __init__(self, threshold: float = SIMILARITY_THRESHOLD):
+        self.threshold = threshold
+        self._records: List[Dict] = []
+        self._parent: List[int] = []
+        self._shingles: List[np.ndarray] = []
+        self._numbers: List[frozenset] = []
+        self._keys: Dict[str, int] = {}
+        self._buckets: Dict[tuple, List[int]] = {}
+        # 그룹 대표 -> 그룹의 DOI 집합 / 소스별 ID 집합
+        self._group_dois: Dict[int, set] = {}
+        self._group_ids: Dict[int, Dict[str, set]] = {}
+    
+    def __len__(self) -> int:
+        return len(self._records)
+    
+    def _find(self, i: int) -> int:
+        while self._parent[i] != i:
+            self._parent[i] = self._parent[self._parent[i]]
+            i = self._parent[i]
+        return i
+    
+    def _union(self, i: int, j: int):
+        ri, rj = self._find(i), self._find(j)
+        if ri != rj:
+            # 먼저 들어온 레코드가 그룹 대표가 되도록
+            root, child = min(ri, rj), max(ri, rj)
+            self._parent[child] = root
+            self._group_dois[root] |= self._group_dois.pop(child)
+            for source, ids in self._group_ids.pop(child).items():
+                self._group_ids[root].setdefault(source, set()).update(ids)
+    
+    def _compatible(self, ri: int, rj: int) -> bool:
+        """두 그룹을 합쳐도 되는지: DOI가 서로 다르거나, 같은 소스에서 ID가 다르면 별개 논문"""
+        dois_i, dois_j = self._group_dois[ri], self._group_dois[rj]
+        if dois_i and dois_j and dois_i != dois_j:
+            return False
+        ids_i, ids_j = self._group_ids[ri], self._group_ids[rj]
+        for source, ids in ids_i.items():
+            other = ids_j.get(source)
+            if other is not None and other != ids:
+                return False
+        return True
+    
+    def _similar(self, i: int, j: int) -> bool:
+        paper_i, paper_j = self._records[i], self._records[j]
+        
+        year_i, year_j = paper_i.get("year"), paper_j.get("year")
+        if isinstance(year_i, int) and isinstance(year_j, int) and abs(year_i - year_j) > MAX_YEAR_GAP:
+            return False
+        
+        # "Part 1" / "Part 2"처럼 숫자만 다른 제목은 병합하지 않음
+        if self._numbers[i] != self._numbers[j]:
+            return False
+        
+        a, b = self._shingles[i], self._shingles[j]
+        common = len(np.intersect1d(a, b, assume_unique=True))
+        return common / (len(a) + len(b) - common) >= self.threshold
+    
+    def add(self, paper: Dict) -> bool:
+        """논문 추가. 기존 논문과 병합되지 않은 새 논문이면 True"""
+        shingles = _shingles(normalize_title(paper.get("title")))
+        return self._add(paper, shingles, _minhash(shingles) if len(shingles) else None)
+    
+    def add_many(self, papers: List[Dict]):
+        """여러 논문을 한 번에 추가 (MinHash 서명을 벡터 연산으로 일괄 계산)"""
+        shingle_arrays = [_shingles(normalize_title(p.get("title"))) for p in papers]
+        for paper, shingles, signature in zip(papers, shingle_arrays, _minhash_many(shingle_arrays)):
+            self._add(paper, shingles, signature)
+    
+    def _add(self, paper: Dict, shingles: np.ndarray, signature: Optional[np.ndarray]) -> bool:
+        i = len(self._records)
+        self._records.append(paper)
+        self._parent.append(i)
+        self._shingles.append(shingles)
+        self._numbers.append(frozenset(_NUMBER.findall(paper.get("title") or "")))
+        doi = normalize_doi(paper.get("doi", ""))
+        self._group_dois[i] = {doi} if doi else set()
+        self._group_ids[i] = {paper.get("source"): {paper.get("id")}}
+        
+        keys = []
+        if doi:
+            keys.append("doi:" + doi)
+        if paper.get("id"):
+            keys.append("id:" + str(paper["id"]))
+        for key in keys:
+            if key in self._keys:
+                self._union(i, self._keys[key])
+            else:
+                self._keys[key] = i
+        
+        if signature is not None:
+            checked = set()
+            for band, rows in enumerate(signature.reshape(BANDS, ROWS).tolist()):
+                bucket = self._buckets.setdefault((band, *rows), [])
+                for j in bucket[-MAX_BUCKET_CANDIDATES:]:
+                    if j in checked:
+                        continue
+                    checked.add(j)
+                    ri, rj = self._find(i), self._find(j)
+                    if ri != rj and self._compatible(ri, rj) and self._similar(i, j):
+                        self._union(i, j)
+                bucket.append(i)
+        
+        return self._find(i) == i
+    
+    def group_of(self, i: int) -> int:
+        return self._find(i)
+    
+    def merged(self) -> List[Dict]:
+        """그룹별 병합 결과 (각 그룹이 처음 등장한 순서)"""
+        groups: Dict[int, List[Dict]] = {}
+        for i, record in enumerate(self._records):
+            groups.setdefault(self._find(i), []).append(record)
+        return [_merge_records(groups[root]) for root in sorted(groups)]
+
+def merge_duplicates(papers: List[Dict], threshold: Optional[float] = None) -> List[Dict]:
+    """여러 소스의 논문 목록에서 중복을 찾아 필드를 병합한 목록 반환"""
+    index = DuplicateIndex(threshold if threshold is not None else SIMILARITY_THRESHOLD)
+    index.add_many(papers)
+    return index.merged()
@@ -0,0 +1,90 @@
+# utils/enrich.py
+# 초록/PDF 링크 보강 결과 저장소 (SQLite): DOI마다 소스별로 한 번만 조회하도록 기록
+
+import os
+import sqlite3
+import threading
+import time
+from typing import Dict, List, Optional
+
+from .cache import CACHE_DIR
+
+# 0이면 기록 없이 검색할 때마다 다시 조회
+ENRICH_CACHE_ENABLED = os.environ.get("PAPER_TRACKER_ENRICH_CACHE", "1") != "0"
+
+# SQLite IN 절 하나에 넣는 최대 값 개수
+_QUERY_CHUNK = 500
+
+EMPTY_FIELDS = {"abstract": "", "pdf_url": ""}
+
+class EnrichmentStore:
+    """DOI x 소스별 보강 결과 (찾지 못한 DOI도 빈 값으로 기록해 다시 조회하지 않음)"""
+    
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+        if path != ":memory:":
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None, timeout=30)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS enrichment (
+                doi TEXT NOT NULL,
+                source TEXT NOT NULL,
+                abstract TEXT NOT NULL,
+                pdf_url TEXT NOT NULL,
+                fetched_at REAL NOT NULL,
+                PRIMARY KEY (doi, source)
+            )
+        """)
+    
+    def get_many(self, source: str, dois: List[str]) -> Dict[str, Dict]:
+        """이미 조회한 DOI -> {"abstract", "pdf_url"} (조회한 적 없는 DOI는 빠짐)"""
+        found = {}
+        with self._lock:
+            for i in range(0, len(dois), _QUERY_CHUNK):
+                chunk = dois[i:i + _QUERY_CHUNK]
+                rows = self._conn.execute(
+                    f"SELECT doi, abstract, pdf_url FROM enrichment WHERE source = ? AND doi IN ({','.join('?' * len(chunk))})",
+                    (source, *chunk)
+                ).fetchall()
+                for doi, abstract, pdf_url in rows:
+                    found[doi] = {"abstract": abstract, "pdf_url": pdf_url}
+        return found
+    
+    def put_many(self, source: str, dois: List[str], found: Dict[str, Dict]):
+        """조회한 DOI 전체를 기록 (found에 없는 DOI는 빈 값)"""
+        now = time.time()
+        rows = [
+            (doi, source, found.get(doi, EMPTY_FIELDS)["abstract"], found.get(doi, EMPTY_FIELDS)["pdf_url"], now)
+            for doi in dois
+        ]
+        with self._lock:
+            self._conn.execute("BEGIN")
+            self._conn.executemany("INSERT OR REPLACE INTO enrichment VALUES (?, ?, ?, ?, ?)", rows)
+            self._conn.execute("COMMIT")
+    
+    def stats(self) -> Dict:
+        with self._lock:
+            entries, filled = self._conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(abstract != '' OR pdf_url != ''), 0) FROM enrichment"
+            ).fetchone()
+        return {"entries": entries, "filled": filled}
+    
+    def clear(self):
+        with self._lock:
+            self._conn.execute("DELETE FROM enrichment")
+
+_store: Optional[EnrichmentStore] = None
+_store_lock = threading.Lock()
+
+def get_enrichment_store() -> Optional[EnrichmentStore]:
+    """프로세스 공용 보강 결과 저장소 (비활성화 시 None)"""
+    global _store
+    if not ENRICH_CACHE_ENABLED:
+        return None
+    with _store_lock:
+        if _store is None:
+            _store = EnrichmentStore(os.path.join(CACHE_DIR, "enrichment.sqlite"))
+        return _store
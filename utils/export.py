@@ -2,8 +2,97 @@
 # 검색 결과 내보내기 기능
 
 import csv
+import gzip
+import hashlib
 import io
-from typing import List, Dict
+import json
+import threading
+from collections import OrderedDict
+from typing import Callable, Iterable, List, Dict, Optional, Union
+
+import numpy as np
+
+from .resultset import ResultSet
+
+# Parquet/Arrow 내보내기는 pyarrow가 있을 때만 사용
+try:
+    import pyarrow as pa
+    import pyarrow.ipc as pa_ipc
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = None
+
+# 내보내기 결과를 메모리에 보관할 결과 집합 x 형식 개수
+EXPORT_CACHE_SIZE = 32
+
+# Parquet 행 그룹 크기
+PARQUET_BATCH_SIZE = 10_000
+
+CSV_FIELDS = ["title", "authors", "year", "venue", "citations", "priority", "track", "source", "url", "abstract"]
+
+def _open_text_stream(stream, compress: bool):
+    """
+    쓰기 대상을 텍스트 스트림으로 통일
+    
+    반환: (텍스트 스트림, 정리 함수). 호출자가 넘긴 스트림은 닫지 않음
+    """
+    if isinstance(stream, str):
+        compress = compress or stream.endswith(".gz")
+        raw = open(stream, "wb")
+        binary, owned = raw, raw
+    else:
+        binary = isinstance(stream, (io.RawIOBase, io.BufferedIOBase)) or "b" in getattr(stream, "mode", "")
+        if not binary:
+            if compress:
+                raise ValueError("gzip 압축은 바이너리 스트림에만 쓸 수 있습니다")
+            return stream, lambda: None
+        raw, owned = stream, None
+    
+    gz = gzip.GzipFile(fileobj=raw, mode="wb") if compress else None
+    text = io.TextIOWrapper(gz or raw, encoding="utf-8", newline="", write_through=False)
+    
+    def close():
+        text.flush()
+        text.detach()
+        if gz is not None:
+            gz.close()
+        if owned is not None:
+            owned.close()
+    
+    return text, close
+
+def write_csv(papers: Iterable[Dict], stream, compress: bool = False) -> int:
+    """
+    논문을 하나씩 CSV로 스트리밍 저장 (전체 결과를 메모리에 모으지 않음)
+    
+    stream: 텍스트/바이너리 파일 객체 또는 경로 (.gz 경로면 자동 압축)
+    텍스트 파일은 newline=""로 열어야 to_csv와 같은 줄바꿈(\r\n)이 됨
+    반환: 기록한 논문 수
+    """
+    out, close = _open_text_stream(stream, compress)
+    count = 0
+    try:
+        writer = csv.writer(out)
+        for paper in papers:
+            # 빈 결과면 헤더도 쓰지 않음 (to_csv와 동일)
+            if count == 0:
+                writer.writerow(CSV_FIELDS)
+            writer.writerow([
+                paper.get("title", ""),
+                paper.get("authors", ""),
+                paper.get("year", ""),
+                paper.get("venue", ""),
+                paper.get("citations", 0),
+                paper.get("priority", ""),
+                paper.get("track", ""),
+                paper.get("source", ""),
+                paper.get("url", ""),
+                (paper.get("abstract", "") or "")[:500]
+            ])
+            count += 1
+    finally:
+        close()
+    return count
 
 def to_csv(papers: List[Dict]) -> str:
     """논문 목록을 CSV 형식으로 변환"""
@@ -11,62 +100,195 @@ def to_csv(papers: List[Dict]) -> str:
         return ""
     
     output = io.StringIO()
-    fieldnames = ["title", "authors", "year", "venue", "citations", "priority", "track", "source", "url", "abstract"]
+    write_csv(papers, output)
+    return output.getvalue()
+
+def _bibtex_entry(paper: Dict, i: int) -> str:
+    # BibTeX 키 생성
+    first_author = (paper.get("authors", "") or "Unknown").split(",")[0].split()[-1] if paper.get("authors") else "Unknown"
+    year = paper.get("year", "0000") or "0000"
+    key = f"{first_author}{year}_{i}"
+    key = "".join(c for c in key if c.isalnum() or c == "_")
     
-    writer = csv.DictWriter(output, fieldnames=fieldnames, extrasaction='ignore')
-    writer.writeheader()
+    # BibTeX 엔트리 생성
+    parts = [
+        f"@article{{{key},\n",
+        f"  title = {{{paper.get('title', 'No Title')}}},\n",
+        f"  author = {{{paper.get('authors', 'Unknown')}}},\n",
+        f"  year = {{{year}}},\n",
+        f"  journal = {{{paper.get('venue', 'Unknown')}}},\n",
+    ]
     
-    for paper in papers:
-        writer.writerow({
-            "title": paper.get("title", ""),
-            "authors": paper.get("authors", ""),
-            "year": paper.get("year", ""),
-            "venue": paper.get("venue", ""),
-            "citations": paper.get("citations", 0),
-            "priority": paper.get("priority", ""),
-            "track": paper.get("track", ""),
-            "source": paper.get("source", ""),
-            "url": paper.get("url", ""),
-            "abstract": (paper.get("abstract", "") or "")[:500]
-        })
+    if paper.get("url"):
+        parts.append(f"  url = {{{paper.get('url')}}},\n")
     
-    return output.getvalue()
+    if paper.get("citations"):
+        parts.append(f"  note = {{Cited by {paper.get('citations')}}},\n")
+    
+    parts.append("}\n")
+    return "".join(parts)
+
+def write_bibtex(papers: Iterable[Dict], stream, compress: bool = False) -> int:
+    """논문을 하나씩 BibTeX로 스트리밍 저장 (stream/compress는 write_csv와 같음), 반환: 기록한 논문 수"""
+    out, close = _open_text_stream(stream, compress)
+    count = 0
+    try:
+        for i, paper in enumerate(papers):
+            # 엔트리 사이에 빈 줄 하나 (to_bibtex의 "\n".join과 동일)
+            if i:
+                out.write("\n")
+            out.write(_bibtex_entry(paper, i))
+            count += 1
+    finally:
+        close()
+    return count
 
 def to_bibtex(papers: List[Dict]) -> str:
     """논문 목록을 BibTeX 형식으로 변환"""
     if not papers:
         return ""
     
-    entries = []
-    for i, paper in enumerate(papers):
-        # BibTeX 키 생성
-        first_author = (paper.get("authors", "") or "Unknown").split(",")[0].split()[-1] if paper.get("authors") else "Unknown"
-        year = paper.get("year", "0000") or "0000"
-        key = f"{first_author}{year}_{i}"
-        key = "".join(c for c in key if c.isalnum() or c == "_")
-        
-        # BibTeX 엔트리 생성
-        entry = f"@article{{{key},\n"
-        entry += f"  title = {{{paper.get('title', 'No Title')}}},\n"
-        entry += f"  author = {{{paper.get('authors', 'Unknown')}}},\n"
-        entry += f"  year = {{{year}}},\n"
-        entry += f"  journal = {{{paper.get('venue', 'Unknown')}}},\n"
-        
-        if paper.get("url"):
-            entry += f"  url = {{{paper.get('url')}}},\n"
-        
-        if paper.get("citations"):
-            entry += f"  note = {{Cited by {paper.get('citations')}}},\n"
-        
-        entry += "}\n"
-        entries.append(entry)
-    
-    return "\n".join(entries)
+    output = io.StringIO()
+    write_bibtex(papers, output)
+    return output.getvalue()
 
-def get_summary_stats(papers: List[Dict]) -> Dict:
-    """검색 결과 요약 통계"""
-    if not papers:
-        return {
+# ==================== Parquet / Arrow ====================
+
+# 문자열 열 중 값 종류가 적은 열은 사전(dictionary) 인코딩
+DICTIONARY_COLUMNS = ["venue", "source", "priority", "track"]
+
+def _require_pyarrow():
+    if pa is None:
+        raise ImportError("Parquet/Arrow 내보내기에는 pyarrow가 필요합니다 (pip install pyarrow)")
+
+def _result_schema():
+    dictionary = pa.dictionary(pa.int32(), pa.string())
+    return pa.schema([
+        ("id", pa.string()),
+        ("doi", pa.string()),
+        ("title", pa.string()),
+        ("authors", pa.string()),
+        ("year", pa.int32()),
+        ("venue", dictionary),
+        ("citations", pa.int64()),
+        ("abstract", pa.string()),
+        ("url", pa.string()),
+        ("pdf_url", pa.string()),
+        ("source", dictionary),
+        ("sources", pa.list_(pa.string())),
+        ("priority", dictionary),
+        ("track", dictionary),
+        ("matched_keywords", pa.list_(pa.string())),
+    ])
+
+def _record_batch(papers: List[Dict], schema, dictionaries: Dict[str, Dict[str, int]]):
+    """
+    논문 목록 -> Arrow RecordBatch (초록 등 모든 필드를 자르지 않고 저장)
+    
+    dictionaries: 배치 사이에 공유하는 열별 사전 (기존 코드를 유지하고 새 값만 뒤에 추가하므로
+    Arrow IPC 파일에서는 사전 델타로 기록됨)
+    """
+    columns = {field.name: [] for field in schema}
+    for paper in papers:
+        year = paper.get("year")
+        columns["year"].append(year if isinstance(year, int) else None)
+        columns["citations"].append(paper.get("citations") or 0)
+        columns["abstract"].append(str(paper.get("abstract") or ""))
+        columns["sources"].append(list(paper.get("sources") or [paper.get("source", "")]))
+        columns["matched_keywords"].append(list(paper.get("matched_keywords") or []))
+        for name in ("id", "doi", "title", "authors", "url", "pdf_url", *DICTIONARY_COLUMNS):
+            columns[name].append(paper.get(name) or "")
+    
+    arrays = []
+    for field in schema:
+        if pa.types.is_dictionary(field.type):
+            codes = dictionaries.setdefault(field.name, {})
+            indices = [codes.setdefault(value, len(codes)) for value in columns[field.name]]
+            arrays.append(pa.DictionaryArray.from_arrays(
+                pa.array(indices, pa.int32()), pa.array(list(codes), pa.string())
+            ))
+        else:
+            arrays.append(pa.array(columns[field.name], field.type))
+    return pa.RecordBatch.from_arrays(arrays, schema=schema)
+
+def _batches(papers: Iterable[Dict], batch_size: int):
+    batch = []
+    for paper in papers:
+        batch.append(paper)
+        if len(batch) >= batch_size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+def write_parquet(papers: Iterable[Dict], sink, batch_size: int = PARQUET_BATCH_SIZE) -> int:
+    """논문을 batch_size씩 Parquet 행 그룹으로 스트리밍 저장 (sink: 경로 또는 바이너리 스트림), 반환: 논문 수"""
+    _require_pyarrow()
+    schema = _result_schema()
+    count = 0
+    dictionaries = {}
+    with pq.ParquetWriter(sink, schema, compression="zstd") as writer:
+        for batch in _batches(papers, batch_size):
+            writer.write_batch(_record_batch(batch, schema, dictionaries))
+            count += len(batch)
+    return count
+
+def write_arrow(papers: Iterable[Dict], sink, batch_size: int = PARQUET_BATCH_SIZE) -> int:
+    """Arrow IPC 파일로 저장 (압축 없음, 불러올 때 memory-map으로 복사 없이 읽힘)"""
+    _require_pyarrow()
+    schema = _result_schema()
+    count = 0
+    dictionaries = {}
+    options = pa_ipc.IpcWriteOptions(emit_dictionary_deltas=True)
+    with pa_ipc.new_file(sink, schema, options=options) as writer:
+        for batch in _batches(papers, batch_size):
+            writer.write_batch(_record_batch(batch, schema, dictionaries))
+            count += len(batch)
+    return count
+
+def to_parquet(papers: List[Dict]) -> bytes:
+    """논문 목록을 Parquet 바이트로 변환 (다운로드용)"""
+    sink = pa.BufferOutputStream()
+    write_parquet(papers, sink)
+    return sink.getvalue().to_pybytes()
+
+def _read_table(source):
+    """경로(.parquet/.arrow)나 바이트를 Arrow 테이블로 읽음 (경로면 memory-map)"""
+    if isinstance(source, (bytes, bytearray, memoryview)):
+        buffer = pa.py_buffer(source)
+        # Arrow IPC 파일은 "ARROW1" 매직 바이트로 시작
+        if bytes(buffer[:6]) == b"ARROW1":
+            return pa_ipc.open_file(buffer).read_all()
+        return pq.read_table(pa.BufferReader(buffer))
+    if str(source).endswith((".arrow", ".feather")):
+        return pa_ipc.open_file(pa.memory_map(str(source), "r")).read_all()
+    return pq.read_table(source, memory_map=True)
+
+def load_results(source) -> List[Dict]:
+    """
+    write_parquet/write_arrow로 저장한 결과 집합을 검색 결과 형식으로 다시 읽음
+    
+    API를 다시 호출하지 않고 대시보드에 그대로 넣을 수 있음
+    """
+    _require_pyarrow()
+    return _read_table(source).to_pylist()
+
+# ==================== 요약 통계 / 차트 집계 ====================
+
+# 저널 집계에서 제외하는 값
+EMPTY_VENUES = ["Unknown", "", "N/A"]
+# 차트 항목 수
+TOP_CITED_COUNT = 10
+TOP_VENUE_COUNT = 15
+# 결과 집합별 집계를 메모리에 보관할 개수
+AGGREGATE_CACHE_SIZE = 32
+
+_aggregate_cache: "OrderedDict[str, Dict]" = OrderedDict()
+_aggregate_lock = threading.Lock()
+
+def _empty_aggregates() -> Dict:
+    return {
+        "stats": {
             "total": 0,
             "high_priority": 0,
             "medium_priority": 0,
@@ -74,25 +296,137 @@ def get_summary_stats(papers: List[Dict]) -> Dict:
             "avg_citations": 0,
             "year_range": "N/A",
             "top_journals": []
-        }
+        },
+        "charts": {
+            "year": {"x": [], "y": []},
+            "priority": {"names": [], "values": []},
+            "source": {"names": [], "values": []},
+            "top_cited": {"x": [], "y": []},
+            "venue": {"x": [], "y": []},
+        },
+    }
+
+def _compute_aggregates(results: ResultSet) -> Dict:
+    citations = results.column("citations")
+    years = results.column("year")
+    priorities = results.value_counts("priority")
+    sources = results.value_counts("source")
+    venues = [(v, n) for v, n in results.value_counts("venue").items() if v not in EMPTY_VENUES]
     
-    priorities = [p.get("priority", "Unknown") for p in papers]
-    citations = [p.get("citations", 0) or 0 for p in papers]
-    years = [p.get("year") for p in papers if p.get("year") and p.get("year") != "N/A"]
-    venues = [p.get("venue") for p in papers if p.get("venue") and p.get("venue") not in ["Unknown", "", "N/A"]]
+    # 연도별 개수: 연도 배열 bincount (0 = 연도 없음)
+    known_years = years[years > 0]
+    year_x, year_y = [], []
+    if len(known_years):
+        first = int(known_years.min())
+        counts = np.bincount(known_years - first)
+        year_x = [first + i for i in np.flatnonzero(counts).tolist()]
+        year_y = counts[counts > 0].tolist()
     
-    # 상위 저널
-    venue_counts = {}
-    for v in venues:
-        venue_counts[v] = venue_counts.get(v, 0) + 1
-    top_journals = sorted(venue_counts.items(), key=lambda x: x[1], reverse=True)[:5]
+    # 인용수 상위 논문 (같은 인용수는 원래 순서)
+    top = np.argsort(-citations, kind="stable")[:TOP_CITED_COUNT]
+    titles = results.column("title")
+    top_titles = [titles[i][:35] + "..." if len(titles[i]) > 35 else titles[i] for i in top.tolist()]
     
     return {
-        "total": len(papers),
-        "high_priority": priorities.count("High"),
-        "medium_priority": priorities.count("Medium"),
-        "low_priority": priorities.count("Low"),
-        "avg_citations": round(sum(citations) / len(citations), 1) if citations else 0,
-        "year_range": f"{min(years)}-{max(years)}" if years else "N/A",
-        "top_journals": top_journals
+        "stats": {
+            "total": len(results),
+            "high_priority": priorities.get("High", 0),
+            "medium_priority": priorities.get("Medium", 0),
+            "low_priority": priorities.get("Low", 0),
+            "avg_citations": round(int(citations.sum()) / len(results), 1),
+            "year_range": f"{known_years.min()}-{known_years.max()}" if len(known_years) else "N/A",
+            "top_journals": venues[:5]
+        },
+        "charts": {
+            "year": {"x": year_x, "y": year_y},
+            "priority": {"names": list(priorities), "values": list(priorities.values())},
+            "source": {"names": list(sources), "values": list(sources.values())},
+            "top_cited": {"x": citations[top].tolist(), "y": top_titles},
+            "venue": {"x": [n for _, n in venues[:TOP_VENUE_COUNT]], "y": [v for v, _ in venues[:TOP_VENUE_COUNT]]},
+        },
     }
+
+def aggregate_results(papers) -> Dict:
+    """
+    요약 통계와 시각화 탭 차트 데이터를 한 번에 계산 (결과 집합 해시별로 캐시)
+    
+    반환: {"stats": get_summary_stats와 같은 dict, "charts": {차트 이름: 축 데이터}}
+    """
+    if not len(papers):
+        return _empty_aggregates()
+    if not isinstance(papers, ResultSet):
+        papers = ResultSet.from_dicts(papers)
+    
+    key = papers.fingerprint()
+    with _aggregate_lock:
+        cached = _aggregate_cache.get(key)
+        if cached is not None:
+            _aggregate_cache.move_to_end(key)
+            return cached
+    
+    aggregates = _compute_aggregates(papers)
+    with _aggregate_lock:
+        _aggregate_cache[key] = aggregates
+        while len(_aggregate_cache) > AGGREGATE_CACHE_SIZE:
+            _aggregate_cache.popitem(last=False)
+    return aggregates
+
+def get_summary_stats(papers: List[Dict]) -> Dict:
+    """검색 결과 요약 통계"""
+    return aggregate_results(papers)["stats"]
+
+# ==================== 내보내기 형식 등록 + 캐시 ====================
+
+EXPORT_FORMATS: Dict[str, Dict] = {}
+
+_export_cache: "OrderedDict[tuple, Union[str, bytes]]" = OrderedDict()
+_export_lock = threading.Lock()
+
+def register_export_format(name: str, func: Callable[[List[Dict]], Union[str, bytes]], extension: str, mime: str, label: str = None):
+    """내보내기 형식 등록 (등록한 형식은 get_export 캐시를 함께 사용)"""
+    EXPORT_FORMATS[name] = {"func": func, "extension": extension, "mime": mime, "label": label or name}
+
+register_export_format("csv", to_csv, "csv", "text/csv", "CSV")
+register_export_format("bibtex", to_bibtex, "bib", "text/plain", "BibTeX")
+if pa is not None:
+    register_export_format("parquet", to_parquet, "parquet", "application/vnd.apache.parquet", "Parquet")
+
+def fingerprint_papers(papers: List[Dict]) -> str:
+    """논문 목록 내용 해시 (같은 결과 집합이면 항상 같은 값)"""
+    if hasattr(papers, "fingerprint"):
+        return papers.fingerprint()
+    digest = hashlib.sha1()
+    for paper in papers:
+        digest.update(json.dumps(paper, sort_keys=True, ensure_ascii=False, default=str).encode("utf-8"))
+        digest.update(b"\n")
+    return digest.hexdigest()
+
+def peek_export(fingerprint: str, fmt: str) -> Optional[Union[str, bytes]]:
+    """이미 만들어 둔 내보내기 결과 (없으면 None, 새로 만들지 않음)"""
+    with _export_lock:
+        payload = _export_cache.get((fingerprint, fmt))
+        if payload is not None:
+            _export_cache.move_to_end((fingerprint, fmt))
+        return payload
+
+def get_export(papers: List[Dict], fmt: str, fingerprint: str = None) -> Union[str, bytes]:
+    """
+    형식별 내보내기 결과를 결과 집합 해시 기준으로 한 번만 만들고 재사용
+    
+    fingerprint를 미리 계산해 두었다면 넘겨서 해시 계산을 생략
+    """
+    if fmt not in EXPORT_FORMATS:
+        raise ValueError(f"알 수 없는 내보내기 형식: {fmt}")
+    if fingerprint is None:
+        fingerprint = fingerprint_papers(papers)
+    
+    payload = peek_export(fingerprint, fmt)
+    if payload is not None:
+        return payload
+    
+    payload = EXPORT_FORMATS[fmt]["func"](papers)
+    with _export_lock:
+        _export_cache[(fingerprint, fmt)] = payload
+        while len(_export_cache) > EXPORT_CACHE_SIZE:
+            _export_cache.popitem(last=False)
+    return payload
@@ -0,0 +1,308 @@
+# utils/http.py
+# API 공용 HTTP 클라이언트 (호스트별 커넥션 풀 + 재시도 + 속도 제한)
+
+import contextvars
+import random
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from contextlib import contextmanager
+from email.utils import parsedate_to_datetime
+from typing import Dict, Optional
+from urllib.parse import urlparse
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from . import metrics
+
+# 호스트별 속도 제한: (초당 요청 수, 버스트 크기)
+# Semantic Scholar 비인증 한도는 100 requests/5분 수준이므로 보수적으로 설정
+RATE_LIMITS = {
+    "api.semanticscholar.org": (1.0, 5),
+    "api.openalex.org": (10.0, 10),
+}
+DEFAULT_RATE_LIMIT = (5.0, 10)
+
+# 재시도 설정
+MAX_RETRIES = 4
+BACKOFF_BASE = 1.0
+BACKOFF_MAX = 30.0
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+
+POOL_SIZE = 16
+USER_AGENT = "paper-tracker/1.0"
+
+# 마감 시간이 있는 요청이 이 시간(초) 안에 끝나지 않으면 같은 요청을 하나 더 보내 먼저 온 응답을 사용
+HEDGE_AFTER = 1.5
+HEDGE_WORKERS = 8
+# 초당 요청 한도가 이보다 낮은 호스트(Semantic Scholar)는 hedging하지 않음
+# (중복 요청이 한도를 그대로 깎고, 토큰 대기만으로도 hedge_after를 넘겨 거의 모든 요청이 중복됨)
+HEDGE_MIN_RATE = 5.0
+
+class DeadlineExceeded(requests.Timeout):
+    """deadline_scope로 정한 마감 시간 안에 요청을 끝낼 수 없음"""
+
+_deadline: contextvars.ContextVar = contextvars.ContextVar("paper_tracker_deadline", default=None)
+
+@contextmanager
+def deadline_scope(seconds: Optional[float]):
+    """
+    with 블록 안의 모든 요청(작업 스레드 포함, metrics.submit으로 넘긴 경우)에 공통 마감 시간 적용
+    
+    요청 타임아웃과 재시도 대기는 남은 시간으로 줄이고, 시간이 없으면 DeadlineExceeded
+    seconds가 None이면 제한 없음 (이미 더 이른 마감이 있으면 그쪽을 유지)
+    """
+    if seconds is None:
+        yield
+        return
+    deadline = time.monotonic() + seconds
+    current = _deadline.get()
+    token = _deadline.set(deadline if current is None else min(current, deadline))
+    try:
+        yield
+    finally:
+        _deadline.reset(token)
+
+def time_remaining() -> Optional[float]:
+    """현재 마감 시간까지 남은 초 (마감이 없으면 None)"""
+    deadline = _deadline.get()
+    return None if deadline is None else deadline - time.monotonic()
+
+class TokenBucket:
+    """토큰 버킷 속도 제한기 (스레드 안전)"""
+    
+    def __init__(self, rate: float, capacity: int):
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = float(capacity)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+    
+    def _refill(self):
+        now = time.monotonic()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+    
+    def acquire(self, max_wait: Optional[float] = None) -> Optional[float]:
+        """
+        토큰 1개를 확보하고, 기다린 시간(초)을 반환
+        
+        max_wait보다 오래 기다려야 하면 토큰을 쓰지 않고 바로 None (마감 시간이 지나도록 잠들지 않음)
+        """
+        with self._lock:
+            self._refill()
+            # 토큰을 미리 차감(예약)하고 부족분만큼 락 밖에서 대기
+            self._tokens -= 1
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0.0
+            if max_wait is not None and wait > max_wait:
+                self._tokens += 1
+                return None
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+    
+    def available(self) -> float:
+        """지금 기다리지 않고 쓸 수 있는 토큰 수"""
+        with self._lock:
+            self._refill()
+            return max(0.0, self._tokens)
+
+_sessions: Dict[str, requests.Session] = {}
+_buckets: Dict[str, TokenBucket] = {}
+_registry_lock = threading.Lock()
+
+_stats_lock = threading.Lock()
+_stats: Dict[str, Dict] = {}
+
+def _new_host_stats() -> Dict:
+    return {
+        "requests": 0,
+        "retries": 0,
+        "errors": 0,
+        "bytes": 0,
+        "hedged": 0,
+        "throttled": 0,
+        "throttle_seconds": 0.0,
+        "backoff_seconds": 0.0,
+    }
+
+def _record(host: str, **increments):
+    with _stats_lock:
+        host_stats = _stats.setdefault(host, _new_host_stats())
+        for key, value in increments.items():
+            host_stats[key] += value
+
+def _get_session(host: str) -> requests.Session:
+    with _registry_lock:
+        session = _sessions.get(host)
+        if session is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=POOL_SIZE, pool_maxsize=POOL_SIZE)
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+            session.headers["User-Agent"] = USER_AGENT
+            _sessions[host] = session
+        return session
+
+def _get_bucket(host: str) -> TokenBucket:
+    with _registry_lock:
+        bucket = _buckets.get(host)
+        if bucket is None:
+            rate, capacity = RATE_LIMITS.get(host, DEFAULT_RATE_LIMIT)
+            bucket = TokenBucket(rate, capacity)
+            _buckets[host] = bucket
+        return bucket
+
+def _retry_after(response: requests.Response) -> Optional[float]:
+    """Retry-After 헤더(초 또는 HTTP 날짜)를 초 단위로 변환"""
+    value = response.headers.get("Retry-After")
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+def _backoff_delay(attempt: int) -> float:
+    """지수 백오프 + 지터"""
+    delay = min(BACKOFF_MAX, BACKOFF_BASE * (2 ** attempt))
+    return delay * (0.5 + random.random() / 2)
+
+def request_json(
+    method: str,
+    url: str,
+    params: Dict = None,
+    json_body: Dict = None,
+    timeout: float = 30
+):
+    """
+    JSON API 요청 (풀링된 세션, 재시도, 속도 제한 적용)
+    
+    429/5xx 및 연결 오류는 MAX_RETRIES까지 재시도하고,
+    그래도 실패하면 requests.RequestException을 그대로 발생시킴
+    """
+    host = urlparse(url).netloc
+    session = _get_session(host)
+    bucket = _get_bucket(host)
+    
+    attempt = 0
+    while True:
+        remaining = time_remaining()
+        if remaining is not None and remaining <= 0:
+            _record(host, errors=1)
+            metrics.count("http.errors")
+            raise DeadlineExceeded(f"deadline exceeded before requesting {url}")
+        
+        waited = bucket.acquire(max_wait=remaining)
+        if waited is None:
+            _record(host, errors=1)
+            metrics.count("http.errors")
+            raise DeadlineExceeded(f"rate limit wait for {host} exceeds the deadline")
+        if waited > 0:
+            _record(host, throttled=1, throttle_seconds=waited)
+            metrics.count("http.throttle_ms", round(waited * 1000, 1))
+        # 토큰 대기 뒤 남은 시간으로 요청 타임아웃을 정함
+        remaining = time_remaining()
+        if remaining is not None:
+            if remaining <= 0:
+                _record(host, errors=1)
+                metrics.count("http.errors")
+                raise DeadlineExceeded(f"deadline exceeded before requesting {url}")
+            timeout = min(timeout, remaining)
+        _record(host, requests=1)
+        metrics.count("http.requests")
+        
+        try:
+            response = session.request(method, url, params=params, json=json_body, timeout=timeout)
+        except (requests.ConnectionError, requests.Timeout):
+            if attempt >= MAX_RETRIES:
+                _record(host, errors=1)
+                metrics.count("http.errors")
+                raise
+            delay = _backoff_delay(attempt)
+        else:
+            _record(host, bytes=len(response.content))
+            metrics.count("http.bytes", len(response.content))
+            if response.status_code not in RETRY_STATUSES:
+                if response.status_code >= 400:
+                    _record(host, errors=1)
+                    metrics.count("http.errors")
+                response.raise_for_status()
+                return response.json()
+            if attempt >= MAX_RETRIES:
+                _record(host, errors=1)
+                metrics.count("http.errors")
+                response.raise_for_status()
+            retry_after = _retry_after(response)
+            delay = min(BACKOFF_MAX, retry_after) if retry_after is not None else _backoff_delay(attempt)
+        
+        remaining = time_remaining()
+        if remaining is not None and delay >= remaining:
+            _record(host, errors=1)
+            metrics.count("http.errors")
+            raise DeadlineExceeded(f"no time left to retry {url}")
+        _record(host, retries=1, backoff_seconds=delay)
+        metrics.count("http.retries")
+        time.sleep(delay)
+        attempt += 1
+
+def get_json(url: str, params: Dict = None, timeout: float = 30):
+    return request_json("GET", url, params=params, timeout=timeout)
+
+_hedge_executor = ThreadPoolExecutor(max_workers=HEDGE_WORKERS, thread_name_prefix="hedge")
+
+def get_json_hedged(url: str, params: Dict = None, timeout: float = 30, hedge_after: float = None):
+    """
+    get_json + 지연 요청 대비 중복 요청(hedging)
+    
+    첫 요청이 hedge_after초 안에 끝나지 않고 마감까지 시간이 남아 있으면 같은 요청을 한 번 더 보내고
+    먼저 성공한 응답을 반환. 둘 다 실패하면 마지막 예외를 그대로 발생시킴.
+    속도 제한이 낮은 호스트(HEDGE_MIN_RATE 미만)나 지금 남은 토큰이 없는 호스트는 중복 요청하지 않음
+    """
+    host = urlparse(url).netloc
+    if RATE_LIMITS.get(host, DEFAULT_RATE_LIMIT)[0] < HEDGE_MIN_RATE:
+        return get_json(url, params, timeout)
+    if hedge_after is None:
+        hedge_after = HEDGE_AFTER
+    futures = [metrics.submit(_hedge_executor, get_json, url, params, timeout)]
+    done, _ = wait(futures, timeout=hedge_after)
+    remaining = time_remaining()
+    if not done and (remaining is None or remaining > hedge_after) and _get_bucket(host).available() >= 1:
+        _record(host, hedged=1)
+        metrics.count("http.hedged")
+        futures.append(metrics.submit(_hedge_executor, get_json, url, params, timeout))
+    
+    pending = set(futures)
+    error: Optional[BaseException] = None
+    while pending:
+        done, pending = wait(pending, return_when=FIRST_COMPLETED)
+        for future in done:
+            if future.exception() is None:
+                # 아직 시작하지 않은 나머지 요청은 보내지 않음
+                for other in pending:
+                    other.cancel()
+                return future.result()
+            error = future.exception()
+    raise error
+
+def post_json(url: str, json_body: Dict, params: Dict = None, timeout: float = 30):
+    return request_json("POST", url, params=params, json_body=json_body, timeout=timeout)
+
+def get_http_stats() -> Dict:
+    """호스트별 요청/재시도/속도 제한 카운터 (합계 포함)"""
+    with _stats_lock:
+        per_host = {host: dict(values) for host, values in _stats.items()}
+    total = _new_host_stats()
+    for values in per_host.values():
+        for key, value in values.items():
+            total[key] += value
+    return {"total": total, "hosts": per_host}
+
+def reset_http_stats():
+    with _stats_lock:
+        _stats.clear()
@@ -0,0 +1,321 @@
+# utils/matcher.py
+# 저널명 매칭 인덱스 (검색마다 한 번만 컴파일)
+
+import re
+from functools import lru_cache
+from typing import Dict, List, Tuple
+
+# 저널명 약어 사전
+JOURNAL_ALIASES = {
+    "annals of tourism research": ["ann tour res", "annals tourism", "atr", "ann. tour. res"],
+    "tourism management": ["tour manag", "tour manage", "tourism manage", "tour. manag"],
+    "journal of travel research": ["j travel res", "jtr", "j. travel res.", "j travel research"],
+    "journal of sustainable tourism": ["j sustain tour", "sustainable tourism", "j. sustain. tour"],
+    "international journal of hospitality management": ["int j hosp manag", "ijhm", "int j hospitality", "int. j. hosp. manag"],
+    "journal of hospitality and tourism research": ["j hosp tour res", "jhtr", "j. hosp. tour. res"],
+    "journal of hospitality & tourism research": ["j hosp tour res", "jhtr"],
+    "current issues in tourism": ["curr issues tour", "current issues tourism", "curr. issues tour"],
+    "tourism management perspectives": ["tour manag perspect", "tourism manage persp"],
+    "international journal of contemporary hospitality management": ["int j contemp hosp", "ijchm"],
+    "journal of travel & tourism marketing": ["j travel tour mark", "jttm"],
+    "journal of hospitality marketing & management": ["j hosp mark manage", "jhmm"],
+    "asia pacific journal of tourism research": ["asia pac j tour", "apjtr"],
+    "journal of hospitality and tourism management": ["j hosp tour manag", "jhtm"],
+    "international journal of tourism research": ["int j tour res", "ijtr"],
+    "journal of hospitality and tourism technology": ["j hosp tour tech", "jhtt"],
+    "information technology & tourism": ["inf technol tour", "it&t", "itt"],
+    "computers in human behavior": ["comput hum behav", "chb", "comput. hum. behav"],
+    "international journal of information management": ["int j inf manag", "ijim"],
+    "journal of business research": ["j bus res", "jbr", "j. bus. res"],
+    "journal of retailing and consumer services": ["j retail consum serv", "jrcs"],
+    "journal of marketing": ["j marketing", "j. marketing", "jm"],
+    "information systems research": ["inf syst res", "isr"],
+    "journal of service research": ["j serv res", "jsr"],
+    "international journal of social robotics": ["int j soc robot", "ijsr"],
+}
+
+def normalize_venue(venue: str) -> str:
+    if not venue:
+        return ""
+    normalized = venue.lower().strip()
+    for char in [".", ",", ":", ";", "&"]:
+        normalized = normalized.replace(char, " ")
+    normalized = " ".join(normalized.split())
+    return normalized
+
+# 핵심 단어 매칭에서 제외하는 불용어
+STOP_WORDS = frozenset({"of", "the", "and", "in", "for", "a", "an", "journal", "international"})
+
+# 저널 하나당 기억하는 판정 결과 최대 개수
+MAX_MEMO_SIZE = 50000
+
+def _trie_pattern(patterns: List[str], word_gap: bool = False) -> str:
+    """
+    여러 문자열을 공통 접두사 트라이로 묶은 정규식 본문
+    
+    word_gap이면 공백 자리에 단어 사이 구분자(공백, 하이픈, 문장 부호)를 허용 ("artificial-intelligence"도 매칭)
+    """
+    trie: Dict = {}
+    for pattern in patterns:
+        node = trie
+        for char in pattern:
+            node = node.setdefault(char, {})
+        node[""] = {}
+    
+    def build(node: Dict) -> str:
+        if "" in node and len(node) == 1:
+            return ""
+        branches = [
+            (r"\W+" if word_gap and char == " " else re.escape(char)) + build(child)
+            for char, child in sorted(node.items()) if char
+        ]
+        optional = "" in node
+        if len(branches) == 1 and not optional:
+            return branches[0]
+        group = "(?:" + "|".join(branches) + ")"
+        # 더 짧은 패턴이 여기서 끝날 수 있으면 나머지는 선택적
+        return group + "?" if optional else group
+    
+    return build(trie)
+
+def _compile_substring_pattern(patterns: List[str]):
+    """
+    여러 문자열 중 하나라도 포함되는지 한 번에 찾는 정규식 생성
+    
+    공통 접두사를 트라이로 묶어 컴파일하므로, 후보가 많아도
+    위치마다 모든 패턴을 하나씩 비교하지 않음
+    """
+    if not patterns:
+        return None
+    return re.compile(_trie_pattern(patterns))
+
+class JournalMatcher:
+    """
+    타겟 저널 목록으로 한 번만 만드는 매칭 인덱스
+    
+    판정 규칙은 기존 match_journal과 동일:
+    1. 정확한 매칭  2. 포함 관계  3. 핵심 단어 2개 이상 공유  4. 약어 포함 관계
+    """
+    
+    def __init__(self, target_journals: List[str]):
+        self.targets = list(target_journals)
+        target_norms = [normalize_venue(t) for t in self.targets]
+        
+        # 1. 정확한 매칭용 해시
+        self._exact = set(target_norms)
+        
+        # 2 + 4. 저널명/약어가 venue 안에 있는지 (컴파일된 패턴 하나로 검사)
+        names = set(target_norms)
+        for target_norm in target_norms:
+            for alias in JOURNAL_ALIASES.get(target_norm, []):
+                names.add(normalize_venue(alias))
+        self._contains = _compile_substring_pattern(sorted(names))
+        # venue가 저널명/약어 안에 있는지 (구분자로 이어 붙인 문자열 하나에서 검사)
+        self._container = "\x00".join(sorted(names))
+        
+        # 3. 핵심 단어 역색인: 단어 -> 그 단어를 가진 타겟 번호들
+        self._word_index: Dict[str, List[int]] = {}
+        for i, target_norm in enumerate(target_norms):
+            for word in set(target_norm.split()) - STOP_WORDS:
+                self._word_index.setdefault(word, []).append(i)
+        
+        self._memo: Dict[str, bool] = {}
+    
+    def match(self, venue: str) -> bool:
+        if not venue or not self.targets:
+            return False
+        
+        verdict = self._memo.get(venue)
+        if verdict is None:
+            verdict = self._match_uncached(normalize_venue(venue))
+            if len(self._memo) >= MAX_MEMO_SIZE:
+                self._memo.clear()
+            self._memo[venue] = verdict
+        return verdict
+    
+    def _match_uncached(self, venue_norm: str) -> bool:
+        if venue_norm in self._exact:
+            return True
+        
+        if venue_norm in self._container:
+            return True
+        if self._contains is not None and self._contains.search(venue_norm):
+            return True
+        
+        counts: Dict[int, int] = {}
+        for word in set(venue_norm.split()) - STOP_WORDS:
+            for i in self._word_index.get(word, ()):
+                counts[i] = counts.get(i, 0) + 1
+                if counts[i] >= 2:
+                    return True
+        
+        return False
+
+@lru_cache(maxsize=32)
+def _get_journal_matcher(targets: Tuple[str, ...]) -> JournalMatcher:
+    return JournalMatcher(list(targets))
+
+def get_journal_matcher(target_journals: List[str]) -> JournalMatcher:
+    """같은 저널 목록이면 검색 간에도 인덱스와 판정 결과를 재사용"""
+    return _get_journal_matcher(tuple(target_journals))
+
+# ==================== 키워드 매칭 ====================
+
+_TOKEN_RE = re.compile(r"\w+")
+
+# 용어가 이 개수 이하면 용어마다 리터럴로 시작하는 정규식을 따로 돌림 (re가 C 수준의 부분 문자열 검색으로
+# 후보 자리만 찾으므로 용어가 적을 때 빠르고, 용어가 많으면 트라이로 묶은 정규식 한 번이 빠름)
+LITERAL_SCAN_MAX_TERMS = 16
+
+def tokenize(text: str) -> List[str]:
+    return _TOKEN_RE.findall(text.lower()) if text else []
+
+def _term_variants(tokens: Tuple[str, ...]) -> List[Tuple[str, ...]]:
+    """마지막 단어의 복수형까지 같은 용어로 취급 (robot -> robots, technology -> technologies)"""
+    head, last = tokens[:-1], tokens[-1]
+    variants = [tokens, head + (last + "s",), head + (last + "es",)]
+    if last.endswith("y"):
+        variants.append(head + (last[:-1] + "ies",))
+    return variants
+
+def _term_lead(tokens: Tuple[str, ...]) -> str:
+    """모든 복수형 변형이 공유하는 앞부분 (마지막 단어만 바뀌므로 첫 단어, 한 단어 용어는 y를 뺀 어간)"""
+    return tokens[0][:-1] if len(tokens) == 1 and tokens[0].endswith("y") else tokens[0]
+
+class _TermScanner:
+    """
+    용어 목록(복수형 포함)을 단어 경계 기준으로 찾는 정규식 (소문자 텍스트 입력)
+    
+    용어가 적으면 용어마다 "앞부분(?<=\\b앞부분)나머지\\b" 형태로 리터럴로 시작하는 정규식을 둠.
+    단어 경계를 리터럴 뒤 lookbehind로 확인하므로 re의 부분 문자열 검색이 그대로 쓰여
+    "said" 같은 단어 안의 "ai"가 많아도 빠름. 용어가 많으면 트라이로 묶은 정규식 하나로 판정
+    """
+    
+    def __init__(self, terms: List[str]):
+        compiled = []
+        variants = set()
+        for term in dict.fromkeys(terms):
+            tokens = tuple(tokenize(term))
+            if not tokens:
+                continue
+            lead = _term_lead(tokens)
+            term_variants = sorted(" ".join(variant) for variant in _term_variants(tokens))
+            variants.update(term_variants)
+            compiled.append((term, lead, term_variants))
+        
+        self.per_term = len(compiled) <= LITERAL_SCAN_MAX_TERMS
+        self._patterns = []
+        self._any_re = None
+        if self.per_term:
+            self._patterns = [
+                (term, re.compile(
+                    re.escape(lead) + r"(?<=\b" + re.escape(lead) + ")"
+                    + _trie_pattern([v[len(lead):] for v in term_variants], word_gap=True) + r"\b"
+                ))
+                for term, lead, term_variants in compiled
+            ]
+        elif variants:
+            self._any_re = re.compile(r"\b" + _trie_pattern(sorted(variants), word_gap=True) + r"\b")
+    
+    def any(self, text: str) -> bool:
+        if self.per_term:
+            return any(pattern.search(text) for _, pattern in self._patterns)
+        return self._any_re is not None and self._any_re.search(text) is not None
+    
+    def matching(self, text: str) -> List[str]:
+        """매칭된 용어 목록 (per_term일 때만)"""
+        return [term for term, pattern in self._patterns if pattern.search(text)]
+
+class KeywordMatcher:
+    """
+    키워드와 맥락어를 단어 경계 기준으로 찾는 매칭 엔진
+    
+    - has_keyword / has_context: 하나라도 있는지만 판정 (컴파일된 정규식, 첫 매칭에서 중단)
+    - matched_keywords: 매칭된 키워드 목록 (키워드가 적으면 용어별 정규식, 많으면 find)
+    - find: 매칭된 키워드/맥락어 전체 (제목+초록을 한 번 토큰화해 단어 색인으로 찾음, 용어가 많아도 비용이 일정)
+    check_relevance는 has_keyword로 먼저 걸러 키워드가 있는 논문에만 목록을 구함
+    
+    단어 경계 기준이므로 "ai"가 "said", "maintain"에 매칭되지 않고, 같은 이유로
+    "robot"도 "robotics"에는 매칭되지 않음 (마지막 단어의 복수형만 같은 용어로 봄)
+    """
+    
+    def __init__(self, keywords: List[str], context_keywords: List[str] = ()):
+        self.keywords = list(keywords)
+        self.context_keywords = list(context_keywords)
+        
+        # 한 단어 용어: 단어 -> {(종류, 원래 용어)}
+        self._single: Dict[str, set] = {}
+        # 여러 단어 용어: 첫 단어 -> [(" 단어 단어", [(" 단어 단어(복수형) ", (종류, 원래 용어))])]
+        # 복수형 변형은 어간 구절이 본문에 있을 때만 검사
+        self._multi: Dict[str, List[Tuple[str, List[Tuple[str, Tuple[str, str]]]]]] = {}
+        for kind, terms in (("keyword", self.keywords), ("context", self.context_keywords)):
+            for term in terms:
+                tokens = tuple(tokenize(term))
+                if not tokens:
+                    continue
+                hit = (kind, term)
+                if len(tokens) == 1:
+                    for variant in _term_variants(tokens):
+                        self._single.setdefault(variant[0], set()).add(hit)
+                else:
+                    stem = " " + " ".join(tokens)
+                    if tokens[-1].endswith("y"):
+                        stem = stem[:-1]
+                    variants = [(" " + " ".join(v) + " ", hit) for v in _term_variants(tokens)]
+                    self._multi.setdefault(tokens[0], []).append((stem, variants))
+        self._keyword_scan = _TermScanner(self.keywords)
+        self._context_scan = _TermScanner(self.context_keywords)
+        self._single_words = frozenset(self._single)
+        self._multi_words = frozenset(self._multi)
+        self._order = {hit: i for i, hit in enumerate(
+            [("keyword", k) for k in self.keywords] + [("context", c) for c in self.context_keywords]
+        )}
+    
+    def has_keyword(self, text: str) -> bool:
+        """키워드가 하나라도 있는지 (find(text)["keywords"]가 비어 있지 않은지와 같음)"""
+        return bool(text) and self._keyword_scan.any(text.lower())
+    
+    def has_context(self, text: str) -> bool:
+        """맥락어가 하나라도 있는지 (find(text)["context"]가 비어 있지 않은지와 같음)"""
+        return bool(text) and self._context_scan.any(text.lower())
+    
+    def matched_keywords(self, text: str) -> List[str]:
+        """매칭된 키워드 목록 (입력 순서, find(text)["keywords"]와 같음)"""
+        if not text:
+            return []
+        if self._keyword_scan.per_term:
+            return self._keyword_scan.matching(text.lower())
+        return self.find(text)["keywords"]
+    
+    def find(self, text: str) -> Dict[str, List[str]]:
+        """텍스트에서 매칭된 키워드/맥락어 목록 (입력 순서 유지)"""
+        tokens = tokenize(text)
+        words = set(tokens)
+        
+        found = set()
+        for word in words & self._single_words:
+            found |= self._single[word]
+        
+        first_words = words & self._multi_words
+        if first_words:
+            joined = " " + " ".join(tokens) + " "
+            for word in first_words:
+                for stem, variants in self._multi[word]:
+                    if stem in joined:
+                        for phrase, hit in variants:
+                            if phrase in joined:
+                                found.add(hit)
+                                break
+        
+        ordered = sorted(found, key=self._order.__getitem__)
+        return {
+            "keywords": [term for kind, term in ordered if kind == "keyword"],
+            "context": [term for kind, term in ordered if kind == "context"],
+        }
+
+@lru_cache(maxsize=32)
+def _get_keyword_matcher(keywords: Tuple[str, ...], context_keywords: Tuple[str, ...]) -> KeywordMatcher:
+    return KeywordMatcher(list(keywords), list(context_keywords))
+
+def get_keyword_matcher(keywords: List[str], context_keywords: List[str] = ()) -> KeywordMatcher:
+    return _get_keyword_matcher(tuple(keywords), tuple(context_keywords))
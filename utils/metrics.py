@@ -0,0 +1,168 @@
+# utils/metrics.py
+# 검색 단계별 시간 측정 (contextvars 기반 trace/span + 카운터, JSON 로그)
+
+import contextvars
+import functools
+import json
+import logging
+import os
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Dict, Optional
+
+logger = logging.getLogger("paper_tracker.metrics")
+
+# 설정하면 trace가 끝날 때마다 요약을 JSON 한 줄로 이 파일에 추가
+METRICS_LOG = os.environ.get("PAPER_TRACKER_METRICS_LOG")
+
+class Trace:
+    """한 번의 검색(또는 화면 그리기) 동안 모은 단계별 시간과 카운터 (스레드 안전)"""
+    
+    def __init__(self, name: str, **attrs):
+        self.name = name
+        self.attrs = attrs
+        self.started_at = datetime.now().isoformat(timespec="seconds")
+        self.seconds = 0.0
+        self._start = time.perf_counter()
+        self._spans: Dict[str, Dict] = {}
+        self._counters: Dict[str, float] = {}
+        self._lock = threading.Lock()
+    
+    def add_span(self, name: str, seconds: float):
+        with self._lock:
+            span = self._spans.setdefault(name, {"count": 0, "seconds": 0.0, "max_seconds": 0.0})
+            span["count"] += 1
+            span["seconds"] += seconds
+            span["max_seconds"] = max(span["max_seconds"], seconds)
+    
+    def add(self, name: str, value: float = 1):
+        with self._lock:
+            self._counters[name] = self._counters.get(name, 0) + value
+    
+    def finish(self):
+        self.seconds = time.perf_counter() - self._start
+    
+    def to_dict(self) -> Dict:
+        """
+        요약 (병렬로 실행된 단계는 seconds가 합계라 전체 시간보다 클 수 있음)
+        
+        spans: {단계: {count, ms, max_ms}}, counters: {이름: 값}
+        """
+        with self._lock:
+            spans = {
+                name: {"count": s["count"], "ms": round(s["seconds"] * 1000, 1), "max_ms": round(s["max_seconds"] * 1000, 1)}
+                for name, s in self._spans.items()
+            }
+            counters = dict(self._counters)
+        return {
+            "trace": self.name,
+            "started_at": self.started_at,
+            "ms": round(self.seconds * 1000, 1),
+            "attrs": self.attrs,
+            "spans": spans,
+            "counters": counters,
+        }
+
+_current_trace: contextvars.ContextVar = contextvars.ContextVar("paper_tracker_trace", default=None)
+
+def current_trace() -> Optional[Trace]:
+    return _current_trace.get()
+
+@contextmanager
+def start_trace(name: str, **attrs):
+    """
+    새 trace 시작 (with 블록 안의 span/count가 여기에 모임)
+    
+    이미 trace가 진행 중이면 새로 만들지 않고 그 안의 span으로 기록
+    """
+    parent = _current_trace.get()
+    if parent is not None:
+        with span(name):
+            yield parent
+        return
+    
+    trace = Trace(name, **attrs)
+    token = _current_trace.set(trace)
+    try:
+        yield trace
+    finally:
+        _current_trace.reset(token)
+        finish_trace(trace)
+
+def finish_trace(trace: Trace) -> Dict:
+    """trace를 끝내고 JSON 로그로 내보낸 뒤 요약을 반환"""
+    trace.finish()
+    summary = trace.to_dict()
+    _emit(summary)
+    return summary
+
+@contextmanager
+def span(name: str, trace: Trace = None):
+    """
+    현재 trace(또는 지정한 trace)에 단계 시간 기록
+    
+    trace가 없으면 아무것도 하지 않음
+    """
+    if trace is None:
+        trace = _current_trace.get()
+    if trace is None:
+        yield
+        return
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        trace.add_span(name, time.perf_counter() - start)
+
+def count(name: str, value: float = 1):
+    """현재 trace의 카운터 증가 (바이트 수, 재시도, 캐시 적중 등)"""
+    trace = _current_trace.get()
+    if trace is not None:
+        trace.add(name, value)
+
+def traced(name: str):
+    """함수 실행 전체를 trace(진행 중인 trace가 있으면 span)로 기록하는 데코레이터"""
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with start_trace(name):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+def submit(executor, func, *args, **kwargs):
+    """executor.submit과 같지만 현재 trace를 작업 스레드로 이어 줌"""
+    return executor.submit(contextvars.copy_context().run, func, *args, **kwargs)
+
+# ==================== JSON 로그 ====================
+
+class JsonLineFormatter(logging.Formatter):
+    """메시지가 dict면 그대로, 아니면 message 필드로 감싸 JSON 한 줄로 출력"""
+    
+    def format(self, record: logging.LogRecord) -> str:
+        payload = record.msg if isinstance(record.msg, dict) else {"message": record.getMessage()}
+        return json.dumps({"level": record.levelname, "logger": record.name, **payload}, ensure_ascii=False, default=str)
+
+_log_lock = threading.Lock()
+_log_configured = False
+
+def _configure_log():
+    global _log_configured
+    with _log_lock:
+        if _log_configured or not METRICS_LOG:
+            _log_configured = True
+            return
+        os.makedirs(os.path.dirname(os.path.abspath(METRICS_LOG)), exist_ok=True)
+        handler = logging.FileHandler(METRICS_LOG, encoding="utf-8")
+        handler.setFormatter(JsonLineFormatter())
+        logger.addHandler(handler)
+        logger.setLevel(logging.INFO)
+        # 검색 모듈의 요청 실패 경고도 같은 파일로
+        logging.getLogger(__name__.rpartition(".")[0]).addHandler(handler)
+        _log_configured = True
+
+def _emit(summary: Dict):
+    _configure_log()
+    logger.info(summary)
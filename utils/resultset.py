@@ -0,0 +1,228 @@
+# utils/resultset.py
+# 검색 결과 열(column) 저장소: 논문마다 dict를 두지 않고 필드별 배열로 보관
+
+import hashlib
+import sys
+from collections.abc import Mapping, Sequence
+from typing import Dict, Iterable, Iterator, List, Optional
+
+import numpy as np
+
+# 문자열 그대로 보관하는 열
+TEXT_COLUMNS = ["id", "doi", "title", "authors", "abstract", "url", "pdf_url"]
+# 값 종류가 적어 코드 + 공유 문자열 표로 보관하는 열
+CATEGORY_COLUMNS = ["venue", "source", "priority", "track"]
+# 짧은 문자열 목록 열 (튜플로 보관, 원소는 intern)
+LIST_COLUMNS = ["sources", "matched_keywords"]
+
+# format_paper_for_display와 같은 필드 순서
+COLUMNS = [
+    "id", "doi", "title", "authors", "year", "venue", "citations", "abstract",
+    "url", "pdf_url", "source", "sources", "priority", "track", "matched_keywords"
+]
+
+# 연도 없음 표시값
+MISSING_YEAR = 0
+
+class PaperRow(Mapping):
+    """ResultSet의 한 행을 dict처럼 읽는 뷰 (값은 열에서 그때그때 꺼냄)"""
+    
+    __slots__ = ("_rs", "_i")
+    
+    def __init__(self, result_set: "ResultSet", i: int):
+        self._rs = result_set
+        self._i = i
+    
+    def __getitem__(self, key: str):
+        return self._rs._value(key, self._i)
+    
+    def __iter__(self) -> Iterator[str]:
+        return iter(COLUMNS)
+    
+    def __len__(self) -> int:
+        return len(COLUMNS)
+    
+    def __repr__(self) -> str:
+        return f"PaperRow({dict(self)!r})"
+
+class ResultSet(Sequence):
+    """
+    검색 결과 집합 (열 기반)
+    
+    - 연도/인용수는 numpy 정수 배열, 저널/소스/우선순위/트랙은 코드 배열 + intern된 문자열 표
+    - 인덱스로 꺼내면 PaperRow(dict처럼 읽기 가능), 슬라이스/take/filter는 새 ResultSet
+    - meta: 검색 조건, 부분 결과 여부 등 결과 집합 단위 정보
+    """
+    
+    def __init__(self, columns: Dict, meta: Dict = None):
+        self._columns = columns
+        self.meta = dict(meta or {})
+        self._fingerprint: Optional[str] = None
+    
+    # ---------- 생성 / 변환 ----------
+    
+    @classmethod
+    def from_dicts(cls, papers: Iterable[Mapping], meta: Dict = None) -> "ResultSet":
+        builder = ResultSetBuilder()
+        for paper in papers:
+            builder.append(paper)
+        return builder.build(meta)
+    
+    def to_dicts(self) -> List[Dict]:
+        return [dict(row) for row in self]
+    
+    # ---------- Sequence ----------
+    
+    def __len__(self) -> int:
+        return len(self._columns["citations"])
+    
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return self.take(np.arange(len(self))[index])
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("ResultSet index out of range")
+        return PaperRow(self, index)
+    
+    def __iter__(self) -> Iterator[PaperRow]:
+        for i in range(len(self)):
+            yield PaperRow(self, i)
+    
+    def __repr__(self) -> str:
+        return f"ResultSet({len(self)} papers)"
+    
+    def _value(self, key: str, i: int):
+        if key in CATEGORY_COLUMNS:
+            codes, categories = self._columns[key]
+            return categories[codes[i]]
+        if key == "year":
+            year = int(self._columns["year"][i])
+            return None if year == MISSING_YEAR else year
+        if key == "citations":
+            return int(self._columns["citations"][i])
+        if key in LIST_COLUMNS:
+            return list(self._columns[key][i])
+        if key in self._columns:
+            return self._columns[key][i]
+        raise KeyError(key)
+    
+    # ---------- 열 연산 ----------
+    
+    def column(self, name: str):
+        """열 전체 (연도/인용수는 numpy 배열, 범주형 열은 문자열 목록)"""
+        if name in CATEGORY_COLUMNS:
+            codes, categories = self._columns[name]
+            return [categories[c] for c in codes]
+        if name in LIST_COLUMNS:
+            return [list(values) for values in self._columns[name]]
+        return self._columns[name]
+    
+    def codes(self, name: str):
+        """범주형 열의 (코드 배열, 문자열 표)"""
+        return self._columns[name]
+    
+    def isin(self, name: str, values: Iterable[str]) -> np.ndarray:
+        """범주형 열 값이 values 중 하나인 행 마스크"""
+        codes, categories = self._columns[name]
+        wanted = [i for i, category in enumerate(categories) if category in set(values)]
+        return np.isin(codes, wanted)
+    
+    def value_counts(self, name: str) -> Dict[str, int]:
+        """범주형 열의 값별 개수 (많은 순)"""
+        codes, categories = self._columns[name]
+        counts = np.bincount(codes, minlength=len(categories))
+        order = np.argsort(-counts, kind="stable")
+        return {categories[i]: int(counts[i]) for i in order if counts[i]}
+    
+    def argsort(self, name: str, descending: bool = False, missing=None) -> np.ndarray:
+        """
+        열 기준 안정 정렬 순서 (같은 값은 원래 순서 유지)
+        
+        missing: 연도 없음 값을 대신할 정렬값
+        """
+        if name in CATEGORY_COLUMNS:
+            codes, categories = self._columns[name]
+            ranks = np.argsort(np.argsort(categories, kind="stable"), kind="stable")
+            values = ranks[codes]
+        else:
+            values = self._columns[name].astype(np.int64)
+            if name == "year" and missing is not None:
+                values = np.where(values == MISSING_YEAR, missing, values)
+        return np.argsort(-values if descending else values, kind="stable")
+    
+    def take(self, indices) -> "ResultSet":
+        indices = np.asarray(indices, dtype=np.int64)
+        columns = {}
+        for name, values in self._columns.items():
+            if name in CATEGORY_COLUMNS:
+                codes, categories = values
+                columns[name] = (codes[indices], categories)
+            elif isinstance(values, np.ndarray):
+                columns[name] = values[indices]
+            else:
+                columns[name] = [values[i] for i in indices]
+        return ResultSet(columns, self.meta)
+    
+    def filter(self, mask: np.ndarray) -> "ResultSet":
+        return self.take(np.flatnonzero(mask))
+    
+    def copy(self) -> "ResultSet":
+        """열 배열은 공유하고 meta만 따로 가진 사본 (여러 호출자에게 같은 결과를 줄 때)"""
+        copied = ResultSet(self._columns, self.meta)
+        copied._fingerprint = self._fingerprint
+        return copied
+    
+    def fingerprint(self) -> str:
+        """결과 집합 내용 해시 (열 단위로 계산해 한 번만 구함)"""
+        if self._fingerprint is None:
+            digest = hashlib.sha1()
+            for name in COLUMNS:
+                values = self._columns[name]
+                if name in CATEGORY_COLUMNS:
+                    codes, categories = values
+                    digest.update("\x1f".join(categories).encode("utf-8"))
+                    digest.update(codes.tobytes())
+                elif isinstance(values, np.ndarray):
+                    digest.update(values.tobytes())
+                else:
+                    digest.update(repr(values).encode("utf-8"))
+            self._fingerprint = digest.hexdigest()
+        return self._fingerprint
+
+class ResultSetBuilder:
+    """행을 하나씩 추가해 ResultSet을 만듦 (행 dict는 추가 후 버려도 됨)"""
+    
+    def __init__(self):
+        self._text = {name: [] for name in TEXT_COLUMNS}
+        self._lists = {name: [] for name in LIST_COLUMNS}
+        self._codes = {name: [] for name in CATEGORY_COLUMNS}
+        self._categories = {name: {} for name in CATEGORY_COLUMNS}
+        self._years: List[int] = []
+        self._citations: List[int] = []
+    
+    def append(self, paper: Mapping):
+        for name in TEXT_COLUMNS:
+            value = paper.get(name, "")
+            self._text[name].append("" if value is None else str(value))
+        for name in CATEGORY_COLUMNS:
+            value = paper.get(name) or ""
+            categories = self._categories[name]
+            code = categories.get(value)
+            if code is None:
+                code = categories[sys.intern(value)] = len(categories)
+            self._codes[name].append(code)
+        for name in LIST_COLUMNS:
+            self._lists[name].append(tuple(sys.intern(str(v)) for v in (paper.get(name) or ())))
+        year = paper.get("year")
+        self._years.append(year if isinstance(year, int) else MISSING_YEAR)
+        self._citations.append(paper.get("citations") or 0)
+    
+    def build(self, meta: Dict = None) -> ResultSet:
+        columns = dict(self._text)
+        columns.update(self._lists)
+        for name in CATEGORY_COLUMNS:
+            columns[name] = (np.array(self._codes[name], dtype=np.int32), list(self._categories[name]))
+        columns["year"] = np.array(self._years, dtype=np.int32)
+        columns["citations"] = np.array(self._citations, dtype=np.int64)
+        return ResultSet(columns, meta)
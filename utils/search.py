@@ -1,226 +1,834 @@
 # utils/search.py
 # Semantic Scholar + OpenAlex API 통합 검색
 
+import contextvars
+import functools
+import inspect
+import json
+import logging
+import math
+import os
+import queue
+import sqlite3
+import threading
+import numpy as np
 import requests
-from typing import List, Dict, Optional
+from concurrent.futures import ThreadPoolExecutor, as_completed, wait
+from typing import Callable, Iterator, List, Dict, Optional
 from datetime import datetime
 
+from . import metrics
+from .http import DeadlineExceeded, deadline_scope, get_json, get_json_hedged, post_json, time_remaining
+from .cache import get_response_cache, make_cache_key
+from .corpus import get_corpus
+from .enrich import EMPTY_FIELDS, get_enrichment_store
+from .resultset import ResultSet, ResultSetBuilder
+from .singleflight import LRUCache, SingleFlight
+from .dedup import merge_duplicates, normalize_doi
+from .matcher import (
+    JournalMatcher, KeywordMatcher,
+    normalize_venue, get_journal_matcher, get_keyword_matcher
+)
+
+logger = logging.getLogger(__name__)
+
 SEMANTIC_SCHOLAR_API = "https://api.semanticscholar.org/graph/v1"
 OPENALEX_API = "https://api.openalex.org"
 
-# 저널명 약어 사전
-JOURNAL_ALIASES = {
-    "annals of tourism research": ["ann tour res", "annals tourism", "atr", "ann. tour. res"],
-    "tourism management": ["tour manag", "tour manage", "tourism manage", "tour. manag"],
-    "journal of travel research": ["j travel res", "jtr", "j. travel res.", "j travel research"],
-    "journal of sustainable tourism": ["j sustain tour", "sustainable tourism", "j. sustain. tour"],
-    "international journal of hospitality management": ["int j hosp manag", "ijhm", "int j hospitality", "int. j. hosp. manag"],
-    "journal of hospitality and tourism research": ["j hosp tour res", "jhtr", "j. hosp. tour. res"],
-    "journal of hospitality & tourism research": ["j hosp tour res", "jhtr"],
-    "current issues in tourism": ["curr issues tour", "current issues tourism", "curr. issues tour"],
-    "tourism management perspectives": ["tour manag perspect", "tourism manage persp"],
-    "international journal of contemporary hospitality management": ["int j contemp hosp", "ijchm"],
-    "journal of travel & tourism marketing": ["j travel tour mark", "jttm"],
-    "journal of hospitality marketing & management": ["j hosp mark manage", "jhmm"],
-    "asia pacific journal of tourism research": ["asia pac j tour", "apjtr"],
-    "journal of hospitality and tourism management": ["j hosp tour manag", "jhtm"],
-    "international journal of tourism research": ["int j tour res", "ijtr"],
-    "journal of hospitality and tourism technology": ["j hosp tour tech", "jhtt"],
-    "information technology & tourism": ["inf technol tour", "it&t", "itt"],
-    "computers in human behavior": ["comput hum behav", "chb", "comput. hum. behav"],
-    "international journal of information management": ["int j inf manag", "ijim"],
-    "journal of business research": ["j bus res", "jbr", "j. bus. res"],
-    "journal of retailing and consumer services": ["j retail consum serv", "jrcs"],
-    "journal of marketing": ["j marketing", "j. marketing", "jm"],
-    "information systems research": ["inf syst res", "isr"],
-    "journal of service research": ["j serv res", "jsr"],
-    "international journal of social robotics": ["int j soc robot", "ijsr"],
-}
+# 병렬 요청 설정 (프로세스 전체에서 공유하는 워커 풀)
+PAGE_WORKERS = 8
+SOURCE_WORKERS = 4
 
-def normalize_venue(venue: str) -> str:
-    if not venue:
-        return ""
-    normalized = venue.lower().strip()
-    for char in [".", ",", ":", ";", "&"]:
-        normalized = normalized.replace(char, " ")
-    normalized = " ".join(normalized.split())
-    return normalized
+_page_executor = ThreadPoolExecutor(max_workers=PAGE_WORKERS, thread_name_prefix="page-fetch")
+_source_executor = ThreadPoolExecutor(max_workers=SOURCE_WORKERS, thread_name_prefix="source-fetch")
+_stream_executor = ThreadPoolExecutor(max_workers=SOURCE_WORKERS, thread_name_prefix="search-stream")
+
+# 응답에서 실제로 쓰는 필드만 요청 (페이지 크기 절감)
+SEMANTIC_SCHOLAR_FIELDS = "paperId,externalIds,title,abstract,year,citationCount,authors,venue,openAccessPdf"
+OPENALEX_SELECT = "id,doi,title,publication_year,cited_by_count,authorships,primary_location,abstract_inverted_index"
+
+# 하위 쿼리 분할 검색 설정: 검색 한 번에 허용하는 최대 API 요청 수, RRF 상수
+PAGE_SIZE = 100
+FANOUT_BUDGET = 12
+RRF_K = 60
+
+# 적응형 페이지 요청: 소스/쿼리당 최대 페이지 수, 계속 받을 최소 적중률(High/Medium 비율),
+# Semantic Scholar에서 한 번에 동시에 요청하는 최대 페이지 수 (적중률이 유지되면 1, 2, 4...로 늘림)
+# 최대 페이지 수는 search_and_filter(max_pages=)의 기본값. 정하지 않으면(0) 소스별 고정 페이지 수(limit 기준)로 동시에 받음
+PAGER_MAX_PAGES = int(os.environ.get("PAPER_TRACKER_MAX_PAGES", 0)) or None
+PAGER_MIN_HIT_RATE = float(os.environ.get("PAPER_TRACKER_MIN_HIT_RATE", 0.1))
+PAGER_MAX_WAVE = 4
+PAGER_HIT_PRIORITIES = ("High", "Medium")
+
+# OpenAlex OR 필터에 넣을 수 있는 최대 값 개수
+OPENALEX_MAX_OR_VALUES = 100
+
+# 증분 검색 기준 날짜 필터 (from_created_date/from_updated_date는 OpenAlex 유료 키가 있어야 동작)
+OPENALEX_SINCE_FILTER = "from_publication_date"
+
+# Semantic Scholar /paper/batch 한 번에 조회할 수 있는 최대 ID 개수
+SEMANTIC_SCHOLAR_BATCH_SIZE = 500
+
+# Semantic Scholar 관련도 검색은 offset + limit이 이 값 이하인 결과만 돌려줌
+SEMANTIC_SCHOLAR_MAX_RESULTS = 1000
+
+# 같은 검색 결과를 메모리에 보관할 개수/시간 (세션이 달라도 프로세스 안에서 공유)
+SEARCH_CACHE_SIZE = int(os.environ.get("PAPER_TRACKER_SEARCH_CACHE_SIZE", 64))
+SEARCH_CACHE_TTL = int(os.environ.get("PAPER_TRACKER_SEARCH_CACHE_TTL", 10 * 60))  # 초
+
+# 검색 마감 시간 중 API 요청에 쓰는 비율 (나머지는 중복 제거/관련성 판정/정렬 몫)
+DEADLINE_FETCH_SHARE = 0.85
+
+# stream_search가 새 페이지를 기다리는 간격 (초, 검색이 끝났는지 확인하는 주기)
+STREAM_POLL_INTERVAL = 0.1
+
+# 결과 정렬 우선순위
+PRIORITY_ORDER = {"High": 0, "Medium": 1, "Low": 2, "Unknown": 3}
+
+# check_relevance 기본 맥락 키워드
+DEFAULT_CONTEXT_KEYWORDS = [
+    "tourism", "travel", "hospitality", "hotel", "tourist",
+    "visitor", "destination", "leisure", "service", "robot",
+    "ai", "artificial intelligence", "technology", "digital"
+]
 
 def match_journal(venue: str, target_journals: List[str]) -> bool:
-    if not venue:
-        return False
+    return get_journal_matcher(target_journals).match(venue)
+
+# 동시에 같은 페이지/검색을 요청하면 한 번만 실행
+_request_flight = SingleFlight()
+_search_flight = SingleFlight()
+_search_cache = LRUCache(SEARCH_CACHE_SIZE, SEARCH_CACHE_TTL)
+_search_shared = 0
+_search_stats_lock = threading.Lock()
+
+def _cached_get_json(url: str, params: Dict) -> Dict:
+    """
+    디스크 응답 캐시를 거쳐 API 호출 (성공한 응답만 저장, 동시에 들어온 같은 요청은 하나로 합침)
     
-    venue_norm = normalize_venue(venue)
+    마감 시간이 있는 요청은 마감이 없는 요청과 합치지 않고(마감 초과 오류를 나눠 받지 않도록),
+    합친 요청은 남은 시간까지만 기다린 뒤 직접 요청함
+    """
+    key = make_cache_key(url, params)
+    remaining = time_remaining()
+    flight_key = key if remaining is None else key + ":deadline"
+    ran = []
     
-    for target in target_journals:
-        target_norm = normalize_venue(target)
-        
-        # 1. 정확한 매칭
-        if target_norm == venue_norm:
-            return True
-        
-        # 2. 포함 관계
-        if target_norm in venue_norm or venue_norm in target_norm:
-            return True
-        
-        # 3. 핵심 단어 매칭 (2개 이상)
-        target_words = set(target_norm.split())
-        venue_words = set(venue_norm.split())
-        common = target_words & venue_words
-        important_words = common - {"of", "the", "and", "in", "for", "a", "an", "journal", "international"}
-        if len(important_words) >= 2:
-            return True
-        
-        # 4. 약어 매칭
-        if target_norm in JOURNAL_ALIASES:
-            for alias in JOURNAL_ALIASES[target_norm]:
-                alias_norm = normalize_venue(alias)
-                if alias_norm in venue_norm or venue_norm in alias_norm:
-                    return True
+    def load():
+        ran.append(True)
+        return _load_json(url, params, key)
+    
+    try:
+        data, shared = _request_flight.do(flight_key, load, timeout=remaining)
+    except DeadlineExceeded:
+        # 마감이 더 이른 다른 검색의 요청에 합류했던 경우: 시간이 남았으면 직접 요청
+        remaining = time_remaining()
+        if ran or remaining is None or remaining <= 0:
+            raise
+        data, shared = load(), False
+    if shared:
+        metrics.count("http.coalesced")
+    return data
+
+def _get_json(url: str, params: Dict) -> Dict:
+    # 마감 시간이 있는 검색에서는 늦는 요청을 한 번 더 보내(hedging) 먼저 온 응답을 사용
+    if time_remaining() is not None:
+        return get_json_hedged(url, params=params)
+    return get_json(url, params=params)
+
+def _load_json(url: str, params: Dict, key: str) -> Dict:
+    cache = get_response_cache()
+    if cache is None:
+        return _get_json(url, params)
     
-    return False
+    data = cache.get(key)
+    if data is None:
+        metrics.count("cache.misses")
+        data = _get_json(url, params)
+        cache.set(key, url, data)
+    else:
+        metrics.count("cache.hits")
+    return data
+
+# 검색 한 번 동안 받지 못한 페이지 목록 (search_and_filter가 설정, 작업 스레드와 공유)
+_missing_pages: contextvars.ContextVar = contextvars.ContextVar("paper_tracker_missing_pages", default=None)
+
+def _report_missing(source: str, query: str, page: int, error: Exception = None):
+    """받지 못한 페이지 기록 (결과의 meta["missing"]으로 전달)"""
+    metrics.count("pages.missing")
+    missing = _missing_pages.get()
+    if missing is None:
+        return
+    if error is None or isinstance(error, DeadlineExceeded):
+        reason = "deadline"
+    elif isinstance(error, requests.Timeout):
+        reason = "timeout"
+    elif isinstance(error, requests.HTTPError) and error.response is not None:
+        reason = f"HTTP {error.response.status_code}"
+    else:
+        reason = type(error).__name__
+    missing.append({"source": source, "query": query, "page": page, "reason": reason})
+
+def _missing_count(source: str, query: str) -> int:
+    missing = _missing_pages.get() or []
+    return sum(1 for m in list(missing) if m["source"] == source and m["query"] == query)
+
+# 페이지가 도착할 때마다 (소스, 논문 목록)을 받는 콜백 (stream_search가 설정, 작업 스레드와 공유)
+_page_sink: contextvars.ContextVar = contextvars.ContextVar("paper_tracker_page_sink", default=None)
+
+def _emit_page(source: str, papers: List[Dict]):
+    sink = _page_sink.get()
+    if sink is not None and papers:
+        sink(source, papers)
+
+class AdaptivePager:
+    """
+    받은 페이지의 관련 논문 비율로 다음 페이지를 받을지 정함
+    
+    페이지마다 is_hit(논문)이 참인 비율을 구해 min_hit_rate 아래로 떨어지면 멈추고,
+    유지되면 max_pages까지 계속 받음. 소스는 max_pages가 자기 고정 페이지 수보다 클 때만 페이저를 씀
+    """
+    
+    def __init__(self, is_hit: Callable[[Dict], bool], max_pages: int, min_hit_rate: float = None):
+        self.is_hit = is_hit
+        self.max_pages = max(1, max_pages)
+        self.min_hit_rate = PAGER_MIN_HIT_RATE if min_hit_rate is None else min_hit_rate
+    
+    def deeper_than(self, fixed_pages: int) -> bool:
+        """고정 페이지 수(limit 기준)보다 깊이 받을 수 있는지"""
+        return self.max_pages > fixed_pages
+    
+    def keep_going(self, papers: List[Dict]) -> bool:
+        if not papers:
+            return False
+        hits = sum(1 for paper in papers if self.is_hit(paper))
+        metrics.count("pager.pages")
+        metrics.count("pager.hits", hits)
+        if hits / len(papers) < self.min_hit_rate:
+            metrics.count("pager.early_stops")
+            return False
+        return True
+
+# 검색 한 번에 쓰는 적응형 페이저 (search_and_filter가 설정, 없으면 limit에 맞춘 고정 페이지 수)
+_pager: contextvars.ContextVar = contextvars.ContextVar("paper_tracker_pager", default=None)
+
+def _store_in_corpus(papers: List[Dict]):
+    """받은 논문을 로컬 코퍼스에 저장 (저장 실패는 검색 결과에 영향 없음)"""
+    corpus = get_corpus()
+    if corpus is None or not papers:
+        return
+    try:
+        with metrics.span("corpus.store"):
+            corpus.upsert(papers)
+    except sqlite3.Error as e:
+        logger.warning("로컬 코퍼스 저장 실패: %s", e)
 
 # ==================== Semantic Scholar ====================
 
+def _fetch_semantic_scholar_page(url: str, params: Dict) -> Optional[List[Dict]]:
+    """표준 형식으로 변환한 페이지 논문 목록 (요청 실패/마감 초과는 None, 결과 끝은 빈 목록)"""
+    try:
+        with metrics.span("fetch.semantic_scholar"):
+            data = _cached_get_json(url, params).get("data", [])
+    except (requests.RequestException, ValueError) as e:
+        logger.warning("Semantic Scholar 페이지 요청 실패 (offset=%s): %s", params.get("offset"), e)
+        _report_missing("semantic", params["query"], params["offset"] // params["limit"], e)
+        return None
+    with metrics.span("parse.semantic_scholar"):
+        papers = [_parse_semantic_scholar_paper(p) for p in data]
+    _emit_page("semantic", papers)
+    return papers
+
+def _parse_semantic_scholar_paper(p: Dict) -> Dict:
+    return {
+        "id": p.get("paperId", ""),
+        "doi": normalize_doi((p.get("externalIds") or {}).get("DOI", "")),
+        "title": p.get("title", ""),
+        "abstract": p.get("abstract", ""),
+        "year": p.get("year"),
+        "citations": p.get("citationCount", 0) or 0,
+        "authors": ", ".join([a.get("name", "") for a in (p.get("authors") or [])[:3]]),
+        "venue": p.get("venue", ""),
+        "url": p.get("url") or (f"https://www.semanticscholar.org/paper/{p['paperId']}" if p.get("paperId") else ""),
+        "pdf_url": (p.get("openAccessPdf") or {}).get("url", ""),
+        "source": "Semantic Scholar"
+    }
+
 def search_semantic_scholar(
     query: str,
     year_start: int = 2015,
     year_end: int = None,
     min_citations: int = 0,
-    limit: int = 100
+    limit: int = 100,
+    venues: List[str] = None,
+    since: str = None
 ) -> List[Dict]:
+    """
+    since(YYYY-MM-DD)가 있으면 그 날짜 이후 출판된 논문만 요청
+    
+    적응형 페이저가 설정된 검색에서는 limit과 관계없이 적중률이 유지되는 동안 더 깊이 받음
+    """
     if year_end is None:
         year_end = datetime.now().year
     
-    fields = "paperId,title,abstract,year,citationCount,authors,venue,url,openAccessPdf"
-    all_papers = []
-    offset = 0
-    per_page = 100
-    max_pages = min(3, (limit // per_page) + 1)
+    url = f"{SEMANTIC_SCHOLAR_API}/paper/search"
+    per_page = PAGE_SIZE
     
-    for _ in range(max_pages):
-        url = f"{SEMANTIC_SCHOLAR_API}/paper/search"
+    def page_params(page: int) -> Dict:
         params = {
             "query": query,
             "year": f"{year_start}-{year_end}",
             "limit": per_page,
-            "offset": offset,
-            "fields": fields
+            "offset": page * per_page,
+            "fields": SEMANTIC_SCHOLAR_FIELDS
         }
-        
-        try:
-            response = requests.get(url, params=params, timeout=30)
-            response.raise_for_status()
-            papers = response.json().get("data", [])
-            if not papers:
-                break
-            all_papers.extend(papers)
-            offset += per_page
-            if len(all_papers) >= limit:
-                break
-        except:
-            break
+        if since:
+            params.pop("year")
+            params["publicationDateOrYear"] = f"{max(since, f'{year_start}-01-01')}:{year_end}-12-31"
+        # 인용수/저널 조건은 API에서 먼저 거름
+        if min_citations > 0:
+            params["minCitationCount"] = min_citations
+        if venues:
+            params["venue"] = ",".join(venues)
+        return params
+    
+    # offset 페이지는 서로 독립적이므로 동시에 요청
+    max_pages = min(3, max(1, math.ceil(limit / per_page)))
+    pager = _pager.get()
+    # 고정 페이지 수까지는 페이지를 동시에 받는 편이 빠르므로 그보다 깊이 받을 때만 페이저 사용
+    if pager is not None and pager.deeper_than(max_pages):
+        max_pages = min(pager.max_pages, SEMANTIC_SCHOLAR_MAX_RESULTS // per_page)
+        results = _fetch_semantic_scholar_adaptive(url, page_params, pager, max_pages)
+        _store_in_corpus(results)
+        if min_citations > 0:
+            results = [r for r in results if r["citations"] >= min_citations]
+        return results
     
-    # 표준 형식으로 변환
+    futures = [
+        metrics.submit(_page_executor, _fetch_semantic_scholar_page, url, page_params(page))
+        for page in range(max_pages)
+    ]
+    
+    # offset 순서대로 병합 (빈 페이지 이후는 버림, 실패한 페이지만 건너뛰고 뒤 페이지는 사용)
     results = []
-    for p in all_papers:
-        results.append({
-            "id": p.get("paperId", ""),
-            "title": p.get("title", ""),
-            "abstract": p.get("abstract", ""),
-            "year": p.get("year"),
-            "citations": p.get("citationCount", 0) or 0,
-            "authors": ", ".join([a.get("name", "") for a in (p.get("authors") or [])[:3]]),
-            "venue": p.get("venue", ""),
-            "url": p.get("url", ""),
-            "pdf_url": (p.get("openAccessPdf") or {}).get("url", ""),
-            "source": "Semantic Scholar"
-        })
+    for future in futures:
+        papers = future.result()
+        if papers is None:
+            continue
+        if not papers:
+            break
+        results.extend(papers)
+        if len(results) >= limit:
+            break
+    _store_in_corpus(results)
     
     if min_citations > 0:
         results = [r for r in results if r["citations"] >= min_citations]
     
     return results[:limit]
 
+def _fetch_semantic_scholar_adaptive(
+    url: str,
+    page_params: Callable[[int], Dict],
+    pager: AdaptivePager,
+    max_pages: int
+) -> List[Dict]:
+    """
+    offset 페이지를 묶음으로 동시에 요청하고, 묶음의 적중률이 유지되면 다음 묶음을 두 배 크기로 요청
+    
+    결과 끝(페이지 크기보다 작은 페이지), 적중률 하락, max_pages 도달 중 먼저 오는 곳에서 멈춤.
+    실패한 페이지는 건너뛰되 묶음 전체가 실패하면 멈춤
+    """
+    results = []
+    page, wave = 0, 1
+    while page < max_pages:
+        batch = range(page, min(page + wave, max_pages))
+        futures = [
+            metrics.submit(_page_executor, _fetch_semantic_scholar_page, url, page_params(p))
+            for p in batch
+        ]
+        page = batch.stop
+        received = []
+        exhausted = False
+        for future in futures:
+            papers = future.result()
+            if papers is None:
+                continue
+            received.extend(papers)
+            if len(papers) < PAGE_SIZE:
+                exhausted = True
+                break
+        results.extend(received)
+        if exhausted or not pager.keep_going(received):
+            break
+        wave = min(wave * 2, PAGER_MAX_WAVE)
+    return results
+
 # ==================== OpenAlex ====================
 
+def reconstruct_abstract(inverted_index: Dict[str, List[int]]) -> str:
+    """
+    OpenAlex abstract_inverted_index({단어: [위치, ...]})를 원문으로 복원
+    
+    (위치, 단어) 쌍을 만들거나 정렬하지 않고, 위치 배열을 한 번 할당해
+    채운 뒤 한 번에 join. 위치는 보통 0..n-1로 빈틈없이 이어지므로
+    길이는 위치 개수로 잡고, 빈틈이 있을 때만 최대 위치로 다시 할당
+    """
+    if not inverted_index:
+        return ""
+    words = [None] * sum(map(len, inverted_index.values()))
+    try:
+        _fill_positions(words, inverted_index)
+    except IndexError:
+        length = 1 + max(max(positions) for positions in inverted_index.values() if positions)
+        words = [None] * length
+        _fill_positions(words, inverted_index)
+    if None in words:
+        return " ".join(filter(None, words))
+    return " ".join(words)
+
+def _fill_positions(words: List, inverted_index: Dict[str, List[int]]):
+    for word, positions in inverted_index.items():
+        if len(positions) == 1:
+            words[positions[0]] = word
+        else:
+            for position in positions:
+                words[position] = word
+
+def _parse_openalex_work(w: Dict) -> Dict:
+    # 저자 추출
+    authors = []
+    for auth in (w.get("authorships") or [])[:3]:
+        name = (auth.get("author") or {}).get("display_name", "")
+        if name:
+            authors.append(name)
+    
+    # 저널명 추출
+    primary_loc = w.get("primary_location") or {}
+    source = primary_loc.get("source") or {}
+    venue = source.get("display_name", "")
+    
+    # PDF URL
+    pdf_url = ""
+    if primary_loc.get("is_oa"):
+        pdf_url = primary_loc.get("pdf_url", "") or ""
+    
+    # 초록 복원 (관련성 판정에 모든 논문의 초록이 필요하므로 파싱할 때 바로 복원)
+    abstract = reconstruct_abstract(w.get("abstract_inverted_index"))
+    
+    return {
+        "id": w.get("id", ""),
+        "doi": normalize_doi(w.get("doi", "")),
+        "title": w.get("title", ""),
+        "abstract": abstract,
+        "year": w.get("publication_year"),
+        "citations": w.get("cited_by_count", 0) or 0,
+        "authors": ", ".join(authors),
+        "venue": venue,
+        "url": w.get("doi", "") or w.get("id", ""),
+        "pdf_url": pdf_url,
+        "source": "OpenAlex"
+    }
+
 def search_openalex(
     query: str,
     year_start: int = 2015,
     year_end: int = None,
     min_citations: int = 0,
-    limit: int = 100
+    limit: int = 100,
+    source_ids: List[str] = None,
+    since: str = None
 ) -> List[Dict]:
+    """
+    since(YYYY-MM-DD)가 있으면 그 날짜 이후 출판된 논문만 요청
+    
+    고정 페이지 수보다 깊이 받도록 페이저가 설정된 검색에서는 cursor를 따라 한 페이지씩 받으며 적중률이 유지되는 동안 계속 받음
+    """
     if year_end is None:
         year_end = datetime.now().year
     
-    all_papers = []
-    per_page = 100
+    results = []
+    per_page = PAGE_SIZE
+    pager = _pager.get()
     max_pages = min(3, (limit // per_page) + 1)
+    if pager is not None and pager.deeper_than(max_pages):
+        max_pages = pager.max_pages
+    else:
+        pager = None
     cursor = "*"
     
-    for _ in range(max_pages):
+    # 연도/인용수/저널 조건은 API 필터로 먼저 거름
+    filters = [f"publication_year:{year_start}-{year_end}"]
+    if min_citations > 0:
+        filters.append(f"cited_by_count:>{min_citations - 1}")
+    if source_ids:
+        filters.append("primary_location.source.id:" + "|".join(source_ids))
+    if since:
+        filters.append(f"{OPENALEX_SINCE_FILTER}:{since}")
+    
+    for page in range(max_pages):
         url = f"{OPENALEX_API}/works"
         params = {
             "search": query,
-            "filter": f"publication_year:{year_start}-{year_end}",
+            "filter": ",".join(filters),
             "sort": "cited_by_count:desc",
             "per_page": per_page,
-            "cursor": cursor
+            "cursor": cursor,
+            "select": OPENALEX_SELECT
         }
         
         try:
-            response = requests.get(url, params=params, timeout=30)
-            response.raise_for_status()
-            data = response.json()
+            with metrics.span("fetch.openalex"):
+                data = _cached_get_json(url, params)
             works = data.get("results", [])
             if not works:
                 break
-            all_papers.extend(works)
+            # 표준 형식으로 변환
+            with metrics.span("parse.openalex"):
+                papers = [_parse_openalex_work(w) for w in works]
+            _emit_page("openalex", papers)
+            results.extend(papers)
             cursor = data.get("meta", {}).get("next_cursor")
-            if not cursor or len(all_papers) >= limit:
+            if not cursor:
+                break
+            if pager is not None:
+                if not pager.keep_going(papers):
+                    break
+            elif len(results) >= limit:
                 break
-        except:
+        except (requests.RequestException, ValueError) as e:
+            # cursor 방식이라 실패한 페이지 뒤로는 이어 받을 수 없음
+            logger.warning("OpenAlex 페이지 요청 실패 (%d건 받은 뒤 중단): %s", len(results), e)
+            _report_missing("openalex", query, page, e)
             break
-    
-    # 표준 형식으로 변환
-    results = []
-    for w in all_papers:
-        # 저자 추출
-        authors = []
-        for auth in (w.get("authorships") or [])[:3]:
-            name = auth.get("author", {}).get("display_name", "")
-            if name:
-                authors.append(name)
-        
-        # 저널명 추출
-        venue = ""
-        primary_loc = w.get("primary_location") or {}
-        source = primary_loc.get("source") or {}
-        venue = source.get("display_name", "")
-        
-        # PDF URL
-        pdf_url = ""
-        if primary_loc.get("is_oa"):
-            pdf_url = primary_loc.get("pdf_url", "") or ""
-        
-        results.append({
-            "id": w.get("id", ""),
-            "title": w.get("title", ""),
-            "abstract": (w.get("abstract_inverted_index") and "Abstract available") or "",
-            "year": w.get("publication_year"),
-            "citations": w.get("cited_by_count", 0) or 0,
-            "authors": ", ".join(authors),
-            "venue": venue,
-            "url": w.get("doi", "") or w.get("id", ""),
-            "pdf_url": pdf_url,
-            "source": "OpenAlex"
-        })
+    _store_in_corpus(results)
     
     if min_citations > 0:
         results = [r for r in results if r["citations"] >= min_citations]
     
-    return results[:limit]
+    return results if pager is not None else results[:limit]
+
+# ==================== 인용수 일괄 갱신 ====================
+
+def _fetch_semantic_scholar_citation_batch(paper_ids: List[str]) -> Dict[str, int]:
+    try:
+        data = post_json(f"{SEMANTIC_SCHOLAR_API}/paper/batch", {"ids": paper_ids}, params={"fields": "citationCount"})
+    except (requests.RequestException, ValueError) as e:
+        logger.warning("Semantic Scholar 인용수 일괄 조회 실패 (%d개): %s", len(paper_ids), e)
+        return {}
+    return {p["paperId"]: p.get("citationCount") or 0 for p in data if p and p.get("paperId")}
+
+def fetch_semantic_scholar_citations(paper_ids: List[str]) -> Dict[str, int]:
+    """Semantic Scholar 논문 ID -> 최신 인용수 (/paper/batch, 요청당 최대 500개)"""
+    paper_ids = list(dict.fromkeys(pid for pid in paper_ids if pid))
+    futures = [
+        metrics.submit(_page_executor, _fetch_semantic_scholar_citation_batch, paper_ids[i:i + SEMANTIC_SCHOLAR_BATCH_SIZE])
+        for i in range(0, len(paper_ids), SEMANTIC_SCHOLAR_BATCH_SIZE)
+    ]
+    citations = {}
+    for future in futures:
+        citations.update(future.result())
+    return citations
+
+def _fetch_openalex_citation_batch(work_ids: List[str]) -> Dict[str, int]:
+    params = {
+        "filter": "openalex:" + "|".join(wid.rsplit("/", 1)[-1] for wid in work_ids),
+        "per_page": len(work_ids),
+        "select": "id,cited_by_count"
+    }
+    try:
+        data = get_json(f"{OPENALEX_API}/works", params=params)
+    except (requests.RequestException, ValueError) as e:
+        logger.warning("OpenAlex 인용수 일괄 조회 실패 (%d개): %s", len(work_ids), e)
+        return {}
+    return {w["id"]: w.get("cited_by_count") or 0 for w in data.get("results", []) if w.get("id")}
+
+def fetch_openalex_citations(work_ids: List[str]) -> Dict[str, int]:
+    """OpenAlex work ID -> 최신 인용수 (openalex: OR 필터, 요청당 최대 100개)"""
+    work_ids = list(dict.fromkeys(wid for wid in work_ids if wid))
+    futures = [
+        metrics.submit(_page_executor, _fetch_openalex_citation_batch, work_ids[i:i + OPENALEX_MAX_OR_VALUES])
+        for i in range(0, len(work_ids), OPENALEX_MAX_OR_VALUES)
+    ]
+    citations = {}
+    for future in futures:
+        citations.update(future.result())
+    return citations
+
+# ==================== 초록/PDF 링크 일괄 보강 ====================
+
+def _fetch_semantic_scholar_enrichment_batch(dois: List[str]) -> Optional[Dict[str, Dict]]:
+    """DOI -> {"abstract", "pdf_url"} (/paper/batch에 "DOI:" ID로 조회, 요청 실패는 None)"""
+    try:
+        data = post_json(
+            f"{SEMANTIC_SCHOLAR_API}/paper/batch", {"ids": [f"DOI:{doi}" for doi in dois]},
+            params={"fields": "abstract,openAccessPdf"}
+        )
+    except (requests.RequestException, ValueError) as e:
+        logger.warning("Semantic Scholar 초록/PDF 일괄 조회 실패 (%d개): %s", len(dois), e)
+        return None
+    # 응답은 요청한 ID 순서대로이며 찾지 못한 논문은 null
+    return {
+        doi: {"abstract": p.get("abstract") or "", "pdf_url": (p.get("openAccessPdf") or {}).get("url") or ""}
+        for doi, p in zip(dois, data) if p
+    }
+
+def _fetch_openalex_enrichment_batch(dois: List[str]) -> Optional[Dict[str, Dict]]:
+    """DOI -> {"abstract", "pdf_url"} (doi: OR 필터, 요청 실패는 None)"""
+    params = {
+        "filter": "doi:" + "|".join(dois),
+        "per_page": len(dois),
+        "select": "doi,abstract_inverted_index,primary_location,best_oa_location"
+    }
+    try:
+        data = get_json(f"{OPENALEX_API}/works", params=params)
+    except (requests.RequestException, ValueError) as e:
+        logger.warning("OpenAlex 초록/PDF 일괄 조회 실패 (%d개): %s", len(dois), e)
+        return None
+    found = {}
+    for w in data.get("results", []):
+        primary_loc = w.get("primary_location") or {}
+        pdf_url = (w.get("best_oa_location") or {}).get("pdf_url") or (primary_loc.get("pdf_url") if primary_loc.get("is_oa") else "")
+        found[normalize_doi(w.get("doi", ""))] = {
+            "abstract": reconstruct_abstract(w.get("abstract_inverted_index")),
+            "pdf_url": pdf_url or ""
+        }
+    return found
+
+# 소스 이름 -> (결과의 source 값, 일괄 조회 함수, 요청당 최대 DOI 수)
+ENRICHMENT_SOURCES = {
+    "semantic": ("Semantic Scholar", _fetch_semantic_scholar_enrichment_batch, SEMANTIC_SCHOLAR_BATCH_SIZE),
+    "openalex": ("OpenAlex", _fetch_openalex_enrichment_batch, OPENALEX_MAX_OR_VALUES),
+}
+
+def enrich_papers(papers: List[Dict]) -> int:
+    """
+    초록이나 PDF 링크가 빈 논문을 DOI로 다른 소스에서 일괄 조회해 채움 (채운 논문 수)
+    
+    같은 소스에 다시 물어도 같은 값이므로, 논문을 받지 않은 소스에만 조회함.
+    조회 결과(찾지 못한 경우 포함)는 보강 저장소에 남겨 DOI마다 소스별로 한 번만 요청하고,
+    요청이 실패한 DOI는 기록하지 않아 다음 검색에서 다시 시도
+    """
+    store = get_enrichment_store()
+    
+    # 소스별 조회할 DOI -> 그 DOI를 가진 논문들
+    wanted: Dict[str, Dict[str, List[Dict]]] = {name: {} for name in ENRICHMENT_SOURCES}
+    for paper in papers:
+        doi = paper.get("doi")
+        # OR 필터 구분자가 들어간 DOI는 조회식이 깨지므로 제외
+        if not doi or "|" in doi or "," in doi or (paper.get("abstract") and paper.get("pdf_url")):
+            continue
+        sources = paper.get("sources") or [paper.get("source")]
+        for name, (label, _, _) in ENRICHMENT_SOURCES.items():
+            if label not in sources:
+                wanted[name].setdefault(doi, []).append(paper)
+    
+    found: Dict[str, Dict[str, Dict]] = {}
+    futures = []
+    for name, by_doi in wanted.items():
+        if not by_doi:
+            continue
+        found[name] = store.get_many(name, list(by_doi)) if store is not None else {}
+        metrics.count("enrich.cached", len(found[name]))
+        todo = [doi for doi in by_doi if doi not in found[name]]
+        _, fetch, batch_size = ENRICHMENT_SOURCES[name]
+        for i in range(0, len(todo), batch_size):
+            chunk = todo[i:i + batch_size]
+            futures.append((name, chunk, metrics.submit(_page_executor, fetch, chunk)))
+    
+    for name, chunk, future in futures:
+        result = future.result()
+        if result is None:
+            continue
+        if store is not None:
+            store.put_many(name, chunk, result)
+        for doi in chunk:
+            found[name][doi] = result.get(doi, EMPTY_FIELDS)
+    
+    filled = set()
+    for name, by_doi in found.items():
+        for doi, fields in by_doi.items():
+            for paper in wanted[name][doi]:
+                if fields["abstract"] and not paper.get("abstract"):
+                    paper["abstract"] = fields["abstract"]
+                    filled.add(id(paper))
+                if fields["pdf_url"] and not paper.get("pdf_url"):
+                    paper["pdf_url"] = fields["pdf_url"]
+                    filled.add(id(paper))
+    metrics.count("enrich.filled", len(filled))
+    return len(filled)
+
+# ==================== 쿼리 플래너 ====================
+
+_openalex_source_ids: Dict[str, Optional[str]] = {}
+
+def _resolve_openalex_source(journal: str) -> Optional[str]:
+    """저널명 -> OpenAlex source ID (이름이 정확히 일치하는 source만 인정)"""
+    url = f"{OPENALEX_API}/sources"
+    params = {"search": journal, "per_page": 5, "select": "id,display_name"}
+    try:
+        sources = _cached_get_json(url, params).get("results", [])
+    except (requests.RequestException, ValueError) as e:
+        logger.warning("OpenAlex 저널 ID 조회 실패 (%s): %s", journal, e)
+        return None
+    target = normalize_venue(journal)
+    for source in sources:
+        if normalize_venue(source.get("display_name", "")) == target:
+            return source.get("id", "").rsplit("/", 1)[-1] or None
+    return None
+
+def resolve_openalex_source_ids(journals: List[str]) -> Dict[str, Optional[str]]:
+    """여러 저널의 OpenAlex source ID를 병렬로 조회 (찾지 못하면 None)"""
+    missing = [j for j in journals if j not in _openalex_source_ids]
+    futures = {metrics.submit(_page_executor, _resolve_openalex_source, j): j for j in missing}
+    for future in as_completed(futures):
+        source_id = future.result()
+        # 조회 실패(None)는 기억하지 않고 다음 검색에서 다시 시도
+        if source_id:
+            _openalex_source_ids[futures[future]] = source_id
+    return {j: _openalex_source_ids.get(j) for j in journals}
+
+def plan_query(
+    target_journals: List[str],
+    min_citations: int = 0,
+    journals_only: bool = False,
+    search_source: str = "both"
+) -> Dict:
+    """
+    검색 조건을 소스별 API 파라미터로 변환
+    
+    - 인용수: Semantic Scholar minCitationCount / OpenAlex cited_by_count 필터
+    - 저널(journals_only일 때): Semantic Scholar venue (이름에 쉼표가 없을 때) / OpenAlex primary_location.source.id
+    - API로 표현할 수 없는 조건은 client_filters에 남겨 결과를 받은 뒤 거름
+    """
+    plan = {"sources": {}, "client_filters": []}
+    
+    if search_source in ["semantic", "both"]:
+        kwargs = {}
+        pushed = ["year"]
+        if min_citations > 0:
+            pushed.append("min_citations")
+        # venue 파라미터는 쉼표로 구분한 목록이므로 이름에 쉼표가 있는 저널("Computers, Environment and
+        # Urban Systems")이 있으면 위임하지 않고 클라이언트 매칭에 맡김
+        if journals_only and target_journals and not any("," in journal for journal in target_journals):
+            kwargs["venues"] = list(target_journals)
+            pushed.append("journals")
+        plan["sources"]["semantic"] = {"kwargs": kwargs, "pushed": pushed}
+    
+    if search_source in ["openalex", "both"]:
+        kwargs = {}
+        pushed = ["year", "fields"]
+        if min_citations > 0:
+            pushed.append("min_citations")
+        if journals_only and target_journals:
+            source_ids = resolve_openalex_source_ids(target_journals)
+            resolved = sorted({sid for sid in source_ids.values() if sid})
+            # 일부 저널만 필터에 넣으면 나머지 저널 논문이 빠지므로, 전부 찾은 경우에만 위임
+            if len(resolved) == len(set(target_journals)) and len(resolved) <= OPENALEX_MAX_OR_VALUES:
+                kwargs["source_ids"] = resolved
+                pushed.append("journals")
+        plan["sources"]["openalex"] = {"kwargs": kwargs, "pushed": pushed}
+    
+    if journals_only:
+        # API 위임 여부와 관계없이 저널 조건은 클라이언트에서 한 번 더 확인
+        plan["client_filters"].append("journals")
+    
+    return plan
+
+# ==================== 하위 쿼리 분할 ====================
+
+def plan_fanout(
+    query_groups: List[List[str]],
+    n_sources: int,
+    search_limit: int,
+    budget: int = FANOUT_BUDGET
+) -> List[tuple]:
+    """
+    확장 키워드 그룹을 하위 쿼리 [(쿼리, 소스당 결과 수)]로 변환
+    
+    전체 요청 수(하위 쿼리 x 소스 x 페이지)가 budget을 넘지 않도록
+    하위 쿼리 개수와 쿼리당 페이지 수를 정함. 하위 쿼리 개수를 넘는 그룹은 버리지 않고
+    앞쪽 하위 쿼리에 번갈아 OR로 합침 (요청 수만 제한하고 검색 범위는 유지)
+    """
+    groups = [list(group) for group in query_groups if group]
+    if not groups:
+        return []
+    n_sources = max(1, n_sources)
+    max_queries = max(1, budget // n_sources)
+    if len(groups) > max_queries:
+        for k, group in enumerate(groups[max_queries:]):
+            groups[k % max_queries].extend(group)
+        metrics.count("fanout.merged_groups", len(groups) - max_queries)
+        groups = groups[:max_queries]
+    subqueries = [" OR ".join(group) for group in groups]
+    pages = max(1, budget // (len(subqueries) * n_sources))
+    sub_limit = min(search_limit, pages * PAGE_SIZE)
+    return [(sub_query, sub_limit) for sub_query in subqueries]
+
+def fuse_rankings(ranked_lists: List[List[Dict]], k: int = RRF_K) -> List[Dict]:
+    """reciprocal-rank fusion: 여러 하위 쿼리의 순위를 1/(k + 순위) 합으로 합침"""
+    scores: Dict[tuple, float] = {}
+    records: Dict[tuple, Dict] = {}
+    for ranked in ranked_lists:
+        for rank, paper in enumerate(ranked, 1):
+            key = (paper.get("source"), paper.get("id") or paper.get("doi") or paper.get("title"))
+            scores[key] = scores.get(key, 0.0) + 1.0 / (k + rank)
+            records.setdefault(key, paper)
+    return [records[key] for key in sorted(scores, key=scores.get, reverse=True)]
+
+# ==================== 로컬 코퍼스 ====================
+
+# 코퍼스에 저장되는 소스 이름과 로컬 검색 정렬 (각 API의 기본 정렬과 맞춤)
+CORPUS_SOURCES = {
+    "semantic": ("Semantic Scholar", "relevance"),
+    "openalex": ("OpenAlex", "citations"),
+}
+
+def _search_with_corpus(name, fetch, query, year_start, year_end, min_citations, limit, **kwargs) -> List[Dict]:
+    """
+    로컬 코퍼스 우선 검색
+    
+    같은 쿼리로 이미 받아 둔 연도 구간은 FTS5 색인에서 바로 찾고,
+    아직 받지 않은 구간만 API로 요청해 코퍼스를 채운 뒤 로컬에서 한 번에 검색
+    """
+    corpus = get_corpus()
+    if corpus is None:
+        return fetch(query, year_start, year_end, min_citations, limit, **kwargs)
+    if year_end is None:
+        year_end = datetime.now().year
+    
+    source, order = CORPUS_SOURCES[name]
+    
+    def fetch_complete(gap_start, gap_end):
+        """(결과, 빠진 페이지 없이 받았는지)"""
+        missing_before = _missing_count(name, query)
+        papers = fetch(query, gap_start, gap_end, min_citations, limit, **kwargs)
+        return papers, _missing_count(name, query) == missing_before
+    
+    try:
+        gaps = corpus.find_gaps(source, query, kwargs, year_start, year_end, min_citations, limit)
+        if gaps == [(year_start, year_end)]:
+            # 처음 보는 검색은 API 결과를 그대로 사용
+            papers, complete = fetch_complete(year_start, year_end)
+            if papers and complete:
+                corpus.record_coverage(source, query, kwargs, year_start, year_end, min_citations, limit)
+            return papers
+        for gap_start, gap_end in gaps:
+            # 빈 결과나 일부 페이지가 빠진 결과는 기록하지 않고 다음 검색에서 다시 요청
+            papers, complete = fetch_complete(gap_start, gap_end)
+            if papers and complete:
+                corpus.record_coverage(source, query, kwargs, gap_start, gap_end, min_citations, limit)
+        # 적응형 페이저로 limit보다 깊이 받았을 수 있으므로 로컬 검색도 최대 페이지 수만큼 찾음
+        pager = _pager.get()
+        local_limit = max(limit, pager.max_pages * PAGE_SIZE) if pager is not None else limit
+        with metrics.span("corpus.search"):
+            papers = corpus.search(query, source, year_start, year_end, min_citations, local_limit, order)
+        # 로컬 색인 결과도 한 페이지처럼 바로 전달 (새로 받은 구간과 겹치는 논문은 stream_search가 거름)
+        _emit_page(name, papers)
+        return papers
+    except sqlite3.Error as e:
+        logger.warning("로컬 코퍼스 검색 실패, API로 대신 검색: %s", e)
+        return fetch(query, year_start, year_end, min_citations, limit, **kwargs)
 
 # ==================== 통합 검색 ====================
 
@@ -233,58 +841,144 @@ def check_relevance(
     keywords: List[str],
     target_journals: List[str],
     context_keywords: List[str] = None,
-    strict_journal_filter: bool = False
+    strict_journal_filter: bool = False,
+    journal_matcher: JournalMatcher = None,
+    keyword_matcher: KeywordMatcher = None
 ) -> Optional[Dict]:
     if context_keywords is None:
-        context_keywords = [
-            "tourism", "travel", "hospitality", "hotel", "tourist",
-            "visitor", "destination", "leisure", "service", "robot",
-            "ai", "artificial intelligence", "technology", "digital"
-        ]
+        context_keywords = DEFAULT_CONTEXT_KEYWORDS
     
     venue = paper.get("venue", "")
-    title = (paper.get("title") or "").lower()
-    abstract = (paper.get("abstract") or "").lower()
-    text = f"{title} {abstract}"
-    
-    is_target = match_journal(venue, target_journals)
-    
-    keywords_lower = [k.lower() for k in keywords]
-    has_keyword = any(k in text for k in keywords_lower)
+    title = paper.get("title") or ""
+    abstract = paper.get("abstract") or ""
     
-    if is_target and has_keyword:
-        return {"priority": "High", "track": "Core Journal", "reason": "타겟 저널 + 키워드 매칭"}
+    if journal_matcher is None:
+        journal_matcher = get_journal_matcher(target_journals)
+    if keyword_matcher is None:
+        keyword_matcher = get_keyword_matcher(keywords, context_keywords)
     
-    has_context = any(c in text for c in context_keywords)
-    
-    if has_context and has_keyword:
-        return {"priority": "Medium", "track": "Discovery", "reason": "맥락 + 기술 키워드 동시 매칭"}
+    # 대부분의 논문은 키워드가 없으므로 예/아니오 판정으로 먼저 거르고, 결과로 남는 논문만 매칭 목록을 구함
+    text = f"{title} {abstract}"
+    if not keyword_matcher.has_keyword(text):
+        return None
     
-    if has_keyword and not strict_journal_filter:
-        return {"priority": "Low", "track": "Keyword Match", "reason": "키워드 매칭"}
+    if journal_matcher.match(venue):
+        relevance = {"priority": "High", "track": "Core Journal", "reason": "타겟 저널 + 키워드 매칭"}
+    elif keyword_matcher.has_context(text):
+        relevance = {"priority": "Medium", "track": "Discovery", "reason": "맥락 + 기술 키워드 동시 매칭"}
+    elif not strict_journal_filter:
+        relevance = {"priority": "Low", "track": "Keyword Match", "reason": "키워드 매칭"}
+    else:
+        return None
     
-    return None
+    relevance["matched_keywords"] = keyword_matcher.matched_keywords(text)
+    return relevance
 
 def format_paper_for_display(paper: Dict, relevance: Dict = None) -> Dict:
     authors = paper.get("authors", "")
     if isinstance(authors, list):
         authors = ", ".join([a.get("name", str(a)) for a in authors[:3]])
     
+    abstract = paper.get("abstract", "No abstract available")
+    
     return {
         "id": paper.get("id", ""),
+        "doi": paper.get("doi", ""),
         "title": paper.get("title", "No Title"),
         "authors": authors or "Unknown",
         "year": paper.get("year", "N/A"),
         "venue": paper.get("venue", "Unknown"),
         "citations": paper.get("citations", 0),
-        "abstract": paper.get("abstract", "No abstract available"),
+        "abstract": abstract,
         "url": paper.get("url", ""),
         "pdf_url": paper.get("pdf_url", ""),
         "source": paper.get("source", "Unknown"),
+        "sources": paper.get("sources") or [paper.get("source", "Unknown")],
         "priority": relevance.get("priority", "Unknown") if relevance else "Unknown",
-        "track": relevance.get("track", "Unknown") if relevance else "Unknown"
+        "track": relevance.get("track", "Unknown") if relevance else "Unknown",
+        "matched_keywords": relevance.get("matched_keywords", []) if relevance else []
     }
 
+def _coalesced(func):
+    """
+    검색 함수를 정규화한 인자(기본값 채움, 키 정렬) 기준으로 합치는 데코레이터
+    
+    - 최근 같은 검색 결과가 메모리 LRU에 있으면 바로 반환
+    - 같은 검색이 이미 실행 중이면 새로 요청하지 않고 그 결과를 기다려 받음
+    - 빈 결과나 일부 페이지가 빠진(partial) 결과는 일시적 실패일 수 있으므로 보관하지 않음
+    - 마감 시간(deadline)은 일부 결과 여부를 바꾸므로 키에 포함. 마감이 있으면 실행 중인 검색은
+      마감까지만 기다리고, 그래도 끝나지 않으면 남은 시간으로 직접 검색 (메모리 LRU 키에서는 제외)
+    """
+    signature = inspect.signature(func)
+    
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        global _search_shared
+        bound = signature.bind(*args, **kwargs)
+        bound.apply_defaults()
+        if bound.arguments.get("year_end") is None:
+            bound.arguments["year_end"] = datetime.now().year
+        deadline = bound.arguments.get("deadline")
+        canonical = {name: value for name, value in bound.arguments.items() if name != "deadline"}
+        key = json.dumps(canonical, sort_keys=True, ensure_ascii=False, default=str)
+        
+        # 보관하는 결과는 모두 완전한 결과이므로 마감 시간과 관계없이 재사용
+        cached = _search_cache.get(key)
+        if cached is not None:
+            metrics.count("search.memory_hits")
+            return cached.copy()
+        
+        def run():
+            results = func(*bound.args, **bound.kwargs)
+            if len(results) and not results.meta.get("partial"):
+                _search_cache.set(key, results)
+            return results
+        
+        with deadline_scope(deadline):
+            results, shared = _search_flight.do(f"{key}:deadline={deadline}", run, timeout=time_remaining())
+        if shared:
+            metrics.count("search.coalesced")
+            with _search_stats_lock:
+                _search_shared += 1
+        return results.copy()
+    return wrapper
+
+def _search_scope(func):
+    """
+    검색 한 번의 범위 설정: 빠진 페이지 기록 목록 + 마감 시간
+    
+    deadline(초)이 있으면 그중 DEADLINE_FETCH_SHARE만큼을 API 요청 마감으로 두고
+    (소스/하위 쿼리는 동시에 실행되므로 각자 같은 마감을 공유, 페이지 요청 타임아웃과 재시도는
+    남은 시간으로 줄어듦) 나머지는 받은 결과의 처리 몫으로 남김
+    """
+    signature = inspect.signature(func)
+    
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        deadline = signature.bind(*args, **kwargs).arguments.get("deadline")
+        token = _missing_pages.set([])
+        try:
+            with deadline_scope(deadline * DEADLINE_FETCH_SHARE if deadline else None):
+                return func(*args, **kwargs)
+        finally:
+            _missing_pages.reset(token)
+    return wrapper
+
+def get_search_cache_stats() -> Dict:
+    """메모리 검색 결과 캐시: 보관 수, 적중/미스, 실행 중인 검색에 합류한 횟수"""
+    with _search_stats_lock:
+        shared = _search_shared
+    return {**_search_cache.stats(), "coalesced": shared, "in_flight": _search_flight.in_flight()}
+
+def clear_search_cache():
+    global _search_shared
+    _search_cache.clear()
+    with _search_stats_lock:
+        _search_shared = 0
+
+@metrics.traced("search")
+@_coalesced
+@_search_scope
 def search_and_filter(
     keywords: List[str],
     target_journals: List[str],
@@ -295,46 +989,230 @@ def search_and_filter(
     include_extended: bool = False,
     limit: int = 100,
     strict_journal_filter: bool = False,
-    search_source: str = "both"
-) -> List[Dict]:
+    search_source: str = "both",
+    journals_only: bool = False,
+    query_groups: List[List[str]] = None,
+    fanout_budget: int = FANOUT_BUDGET,
+    use_corpus: bool = True,
+    since: Dict[str, str] = None,
+    deadline: float = None,
+    adaptive_pages: bool = True,
+    max_pages: int = None,
+    enrich: bool = True
+) -> ResultSet:
+    """
+    deadline(초)이 있으면 그 안에 도착한 결과만으로 응답하고, 받지 못한 소스/페이지는
+    meta["missing"]에 남기고 meta["partial"]을 True로 표시
+    
+    max_pages(없으면 PAGER_MAX_PAGES)가 소스의 고정 페이지 수(limit 기준)보다 크면 그 소스는
+    max_pages까지 한 페이지(묶음)씩 더 깊이 받음. adaptive_pages면 페이지마다 관련성(High/Medium 비율)을
+    보고 적중률이 떨어지면 일찍 멈춤. 그 밖에는 고정 페이지 수를 동시에 받음
+    (하위 쿼리 분할 검색은 fanout 예산이 페이지 수를 정하므로 max_pages를 쓰지 않음)
+    
+    enrich면 중복 병합 뒤 초록/PDF 링크가 빈 논문을 다른 소스에서 DOI로 일괄 조회해 채움
+    """
     query = " OR ".join(keywords)
+    missing = _missing_pages.get()
     search_limit = min(limit * 2, 200)
     
-    all_papers = []
+    all_target = target_journals.copy()
+    if include_extended and extended_journals:
+        all_target.extend(extended_journals)
     
-    # 검색 소스에 따라 API 호출
-    if search_source in ["semantic", "both"]:
-        ss_results = search_semantic_scholar(query, year_start, year_end, min_citations, search_limit)
-        all_papers.extend(ss_results)
+    # 검색 조건 중 API에서 거를 수 있는 것은 소스별 파라미터로 변환
+    plan = plan_query(all_target, min_citations, journals_only, search_source)
     
-    if search_source in ["openalex", "both"]:
-        oa_results = search_openalex(query, year_start, year_end, min_citations, search_limit)
-        all_papers.extend(oa_results)
-    
-    # 중복 제거 (제목 기준)
-    seen_titles = set()
-    unique_papers = []
-    for p in all_papers:
-        title_key = (p.get("title") or "").lower().strip()[:50]
-        if title_key and title_key not in seen_titles:
-            seen_titles.add(title_key)
-            unique_papers.append(p)
+    # 검색 소스에 따라 API 동시 호출
+    fetchers = []
+    if "semantic" in plan["sources"]:
+        fetchers.append(("semantic", search_semantic_scholar))
+    if "openalex" in plan["sources"]:
+        fetchers.append(("openalex", search_openalex))
+    
+    # 확장 키워드 그룹이 있으면 하나의 거대한 OR 쿼리 대신 하위 쿼리로 나눠 병렬 검색
+    if query_groups:
+        subqueries = plan_fanout(query_groups, len(fetchers), search_limit, fanout_budget)
+    else:
+        subqueries = [(query, search_limit)]
+    
+    journal_matcher = get_journal_matcher(all_target)
+    keyword_matcher = get_keyword_matcher(keywords, DEFAULT_CONTEXT_KEYWORDS)
+    
+    def is_hit(paper: Dict) -> bool:
+        relevance = check_relevance(
+            paper, keywords, all_target,
+            strict_journal_filter=strict_journal_filter,
+            journal_matcher=journal_matcher,
+            keyword_matcher=keyword_matcher
+        )
+        if not relevance or relevance["priority"] not in PAGER_HIT_PRIORITIES:
+            return False
+        return "journals" not in plan["client_filters"] or relevance["track"] == "Core Journal"
+    
+    # 작업 스레드는 제출 시점의 context를 복사하므로 제출하는 동안만 페이저를 설정
+    if max_pages is None:
+        max_pages = PAGER_MAX_PAGES
+    pager = None
+    if max_pages and not query_groups:
+        pager = AdaptivePager(is_hit, max_pages, None if adaptive_pages else 0.0)
+    pager_token = _pager.set(pager)
+    
+    futures = {}
+    for sub_query, sub_limit in subqueries:
+        for name, fetch in fetchers:
+            kwargs = dict(plan["sources"][name]["kwargs"])
+            if since and since.get(name):
+                kwargs["since"] = since[name]
+            # 코퍼스를 쓰면 이미 받아 둔 범위는 로컬 색인에서, 나머지만 API에서 (증분 검색은 항상 API)
+            if use_corpus and "since" not in kwargs:
+                future = metrics.submit(
+                    _source_executor, _search_with_corpus, name, fetch, sub_query, year_start, year_end, min_citations, sub_limit,
+                    **kwargs
+                )
+            else:
+                future = metrics.submit(
+                    _source_executor, fetch, sub_query, year_start, year_end, min_citations, sub_limit,
+                    **kwargs
+                )
+            futures[future] = (name, sub_query)
+    _pager.reset(pager_token)
+    
+    # 마감까지 끝나지 않은 소스/하위 쿼리는 빈 결과로 두고 missing에 기록
+    # (아직 시작하지 않은 작업은 취소하고, 이미 시작한 작업은 뒤에서 마저 끝남)
+    remaining = time_remaining()
+    done, not_done = wait(futures, timeout=None if remaining is None else max(0.0, remaining))
+    results_by_task = {}
+    for future in done:
+        results_by_task[futures[future]] = future.result()
+    for future in not_done:
+        future.cancel()
+        name, sub_query = futures[future]
+        results_by_task[(name, sub_query)] = []
+        _report_missing(name, sub_query, None)
+    
+    # 도착 순서와 무관하게 소스 순서를 고정해야 중복 제거 결과가 일정함
+    all_papers = []
+    for name, _ in fetchers:
+        ranked_lists = [results_by_task[(name, sub_query)] for sub_query, _ in subqueries]
+        if len(ranked_lists) == 1:
+            all_papers.extend(ranked_lists[0])
+        else:
+            all_papers.extend(fuse_rankings(ranked_lists)[:search_limit])
+    
+    # 중복 병합 (DOI/ID -> 제목 유사도), 소스별로 가장 좋은 필드를 합침
+    with metrics.span("dedup"):
+        unique_papers = merge_duplicates([p for p in all_papers if (p.get("title") or "").strip()])
+    metrics.count("papers.fetched", len(all_papers))
+    metrics.count("papers.unique", len(unique_papers))
     
     if not unique_papers:
-        return []
+        return ResultSet.from_dicts([], meta={"partial": bool(missing), "missing": list(missing)})
     
-    all_target = target_journals.copy()
-    if include_extended and extended_journals:
-        all_target.extend(extended_journals)
+    # 관련성 판정 전에 채워야 보강한 초록의 키워드도 판정에 반영됨
+    if enrich:
+        with metrics.span("enrich"):
+            enrich_papers(unique_papers)
     
-    results = []
-    for paper in unique_papers:
-        relevance = check_relevance(paper, keywords, all_target, strict_journal_filter=strict_journal_filter)
-        if relevance:
-            formatted = format_paper_for_display(paper, relevance)
-            results.append(formatted)
+    with metrics.span("relevance"):
+        relevant = []
+        for paper in unique_papers:
+            relevance = check_relevance(
+                paper, keywords, all_target,
+                strict_journal_filter=strict_journal_filter,
+                journal_matcher=journal_matcher,
+                keyword_matcher=keyword_matcher
+            )
+            if not relevance:
+                continue
+            if "journals" in plan["client_filters"] and relevance["track"] != "Core Journal":
+                continue
+            relevant.append((paper, relevance))
     
-    priority_order = {"High": 0, "Medium": 1, "Low": 2, "Unknown": 3}
-    results.sort(key=lambda x: (priority_order.get(x["priority"], 3), -x["citations"]))
+    # 표시용 레코드는 바로 열 저장소에 추가 (논문별 dict를 결과로 들고 있지 않음)
+    with metrics.span("format"):
+        builder = ResultSetBuilder()
+        for paper, relevance in relevant:
+            builder.append(format_paper_for_display(paper, relevance))
+        results = builder.build()
     
-    return results[:limit]
+    # 우선순위 > 인용수(내림차순) 안정 정렬
+    with metrics.span("sort"):
+        codes, categories = results.codes("priority")
+        priority_rank = np.array([PRIORITY_ORDER.get(c, 3) for c in categories], dtype=np.int64)
+        order = np.lexsort((-results.column("citations"), priority_rank[codes]))
+        results = results.take(order[:limit])
+    metrics.count("papers.results", len(results))
+    results.meta.update(partial=bool(missing), missing=list(missing))
+    return results
+
+# ==================== 스트리밍 검색 ====================
+
+def _stream_key(paper: Dict) -> str:
+    doi = paper.get("doi")
+    if doi:
+        return doi
+    return " ".join((paper.get("title") or "").lower().split()) or paper.get("id", "")
+
+def stream_search(keywords: List[str], target_journals: List[str], **kwargs) -> Iterator[Dict]:
+    """
+    search_and_filter를 뒤에서 실행하면서 페이지가 도착할 때마다 관련성을 판정해 바로 전달
+    
+    새 페이지마다 {"source", "papers": 새로 찾은 관련 논문(표시용 레코드, 우선순위 > 인용수 순),
+    "counts": 지금까지 받은/관련/우선순위별 논문 수, "done": False, "results": None}을 내보내고,
+    마지막에는 search_and_filter의 최종 결과(중복 병합, 정렬, limit 적용)를 "results"에 담아
+    "done": True로 한 번 더 내보냄. 중간 결과는 미리보기용이며 최종 결과와 순서/개수가 다를 수 있음
+    (메모리 캐시에 있거나 이미 실행 중인 검색에 합류하면 중간 결과 없이 최종 결과만 옴)
+    """
+    arguments = inspect.signature(search_and_filter).bind(keywords, target_journals, **kwargs)
+    arguments.apply_defaults()
+    options = arguments.arguments
+    all_target = list(target_journals)
+    if options["include_extended"] and options["extended_journals"]:
+        all_target.extend(options["extended_journals"])
+    journal_matcher = get_journal_matcher(all_target)
+    keyword_matcher = get_keyword_matcher(keywords, DEFAULT_CONTEXT_KEYWORDS)
+    
+    pages: "queue.Queue[tuple]" = queue.Queue()
+    token = _page_sink.set(lambda source, papers: pages.put((source, papers)))
+    try:
+        future = metrics.submit(_stream_executor, search_and_filter, keywords, target_journals, **kwargs)
+    finally:
+        _page_sink.reset(token)
+    
+    seen = set()
+    counts = {"fetched": 0, "relevant": 0, "High": 0, "Medium": 0, "Low": 0}
+    while True:
+        try:
+            source, papers = pages.get(timeout=STREAM_POLL_INTERVAL)
+        except queue.Empty:
+            if future.done():
+                break
+            continue
+        
+        found = []
+        for paper in papers:
+            key = _stream_key(paper)
+            if not key or key in seen:
+                continue
+            seen.add(key)
+            counts["fetched"] += 1
+            if (paper.get("citations") or 0) < options["min_citations"]:
+                continue
+            relevance = check_relevance(
+                paper, keywords, all_target,
+                strict_journal_filter=options["strict_journal_filter"],
+                journal_matcher=journal_matcher,
+                keyword_matcher=keyword_matcher
+            )
+            if not relevance:
+                continue
+            if options["journals_only"] and relevance["track"] != "Core Journal":
+                continue
+            counts["relevant"] += 1
+            counts[relevance["priority"]] += 1
+            found.append(format_paper_for_display(paper, relevance))
+        
+        found.sort(key=lambda p: (PRIORITY_ORDER.get(p["priority"], 3), -(p["citations"] or 0)))
+        yield {"source": source, "papers": found, "counts": dict(counts), "done": False, "results": None}
+    
+    yield {"source": None, "papers": [], "counts": dict(counts), "done": True, "results": future.result()}
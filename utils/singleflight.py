@@ -0,0 +1,99 @@
+# utils/singleflight.py
+# 프로세스 공용 요청 합치기: 같은 키의 동시 호출은 한 번만 실행하고 결과를 공유 + 크기 제한 LRU
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Optional, Tuple
+
+class _Call:
+    __slots__ = ("done", "result", "error")
+    
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error: Optional[BaseException] = None
+
+class SingleFlight:
+    """
+    같은 키로 동시에 들어온 호출을 하나로 합침
+    
+    처음 호출한 스레드만 func를 실행하고, 실행 중에 들어온 호출은 그 결과(또는 예외)를 기다려 함께 받음.
+    실행이 끝나면 키를 지우므로 이후 호출은 다시 실행됨 (결과 보관은 LRUCache가 담당)
+    timeout을 주면 기다리는 쪽은 그 시간까지만 기다리고, 그래도 끝나지 않으면 func를 직접 실행함
+    """
+    
+    def __init__(self):
+        self._calls: Dict[str, _Call] = {}
+        self._lock = threading.Lock()
+    
+    def do(self, key: str, func: Callable[[], Any], timeout: Optional[float] = None) -> Tuple[Any, bool]:
+        """(결과, 다른 호출의 결과를 공유했는지)"""
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+        
+        if not leader:
+            if not call.done.wait(None if timeout is None else max(0.0, timeout)):
+                return func(), False
+            if call.error is not None:
+                raise call.error
+            return call.result, True
+        
+        try:
+            call.result = func()
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+        return call.result, False
+    
+    def in_flight(self) -> int:
+        with self._lock:
+            return len(self._calls)
+
+class LRUCache:
+    """크기 제한 + 유효 시간이 있는 메모리 LRU (스레드 안전)"""
+    
+    def __init__(self, maxsize: int, ttl: float):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._items: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+    
+    def get(self, key: str):
+        now = time.monotonic()
+        with self._lock:
+            item = self._items.get(key)
+            if item is None or now - item[0] > self.ttl:
+                if item is not None:
+                    del self._items[key]
+                self.misses += 1
+                return None
+            self._items.move_to_end(key)
+            self.hits += 1
+            return item[1]
+    
+    def set(self, key: str, value):
+        with self._lock:
+            self._items[key] = (time.monotonic(), value)
+            self._items.move_to_end(key)
+            while len(self._items) > self.maxsize:
+                self._items.popitem(last=False)
+    
+    def clear(self):
+        with self._lock:
+            self._items.clear()
+            self.hits = 0
+            self.misses = 0
+    
+    def stats(self) -> Dict:
+        with self._lock:
+            return {"entries": len(self._items), "hits": self.hits, "misses": self.misses}
@@ -0,0 +1,222 @@
+# utils/watch.py
+# 저장된 검색(watch): 지난 실행 이후 새로 나온 논문만 받아 기존 결과에 합침
+
+import hashlib
+import json
+import os
+import re
+import threading
+from datetime import date, timedelta
+from typing import Dict, List, Optional
+
+from .cache import CACHE_DIR
+from .dedup import normalize_doi, normalize_title
+from .http import get_http_stats
+from .search import PRIORITY_ORDER, fetch_openalex_citations, fetch_semantic_scholar_citations, search_and_filter
+
+WATCH_DIR = os.path.join(CACHE_DIR, "watches")
+# 출판일이 늦게 등록되는 논문을 놓치지 않도록 기준 날짜를 이만큼 앞당겨 다시 조회
+WATCH_OVERLAP_DAYS = 30
+
+# 결과에 영향을 주는 검색 조건 (바뀌면 증분 대신 전체 검색)
+WATCH_PARAMS = [
+    "target_journals", "extended_journals", "year_start", "min_citations", "include_extended",
+    "limit", "max_pages", "strict_journal_filter", "search_source", "journals_only", "query_groups"
+]
+
+# watch 이름 -> 잠금 (기준 날짜/결과를 읽고 쓰는 동안만 잡고, 검색 요청 중에는 잡지 않음)
+_watch_locks: Dict[str, threading.Lock] = {}
+_watch_locks_guard = threading.Lock()
+
+def _watch_lock(name: str) -> threading.Lock:
+    with _watch_locks_guard:
+        return _watch_locks.setdefault(name, threading.Lock())
+
+def _watch_path(name: str) -> str:
+    slug = re.sub(r"[^a-z0-9]+", "-", name.lower()).strip("-")[:40]
+    digest = hashlib.sha1(name.encode("utf-8")).hexdigest()[:8]
+    return os.path.join(WATCH_DIR, f"{slug}-{digest}.json")
+
+def load_watch(name: str) -> Optional[Dict]:
+    path = _watch_path(name)
+    if not os.path.exists(path):
+        return None
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+def save_watch(watch: Dict):
+    os.makedirs(WATCH_DIR, exist_ok=True)
+    path = _watch_path(watch["name"])
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(watch, f, ensure_ascii=False)
+    os.replace(tmp_path, path)
+
+def list_watches() -> List[Dict]:
+    """저장된 watch 요약 목록 (이름, 키워드, 기준 날짜, 결과 수)"""
+    if not os.path.isdir(WATCH_DIR):
+        return []
+    watches = []
+    for filename in sorted(os.listdir(WATCH_DIR)):
+        if not filename.endswith(".json"):
+            continue
+        with open(os.path.join(WATCH_DIR, filename), encoding="utf-8") as f:
+            watch = json.load(f)
+        watches.append({
+            "name": watch["name"],
+            "keywords": watch["keywords"],
+            "high_water": watch["high_water"],
+            "results": len(watch["results"]),
+            "updated_at": watch["updated_at"],
+        })
+    return watches
+
+def delete_watch(name: str):
+    path = _watch_path(name)
+    if os.path.exists(path):
+        os.remove(path)
+
+def _result_keys(paper: Dict) -> List[str]:
+    keys = []
+    doi = normalize_doi(paper.get("doi", ""))
+    if doi:
+        keys.append("doi:" + doi)
+    if paper.get("id"):
+        keys.append("id:" + str(paper["id"]))
+    title = normalize_title(paper.get("title"))
+    if title:
+        keys.append("title:" + title)
+    return keys
+
+def merge_results(previous: List[Dict], delta: List[Dict]) -> List[Dict]:
+    """증분 결과를 기존 결과에 합침 (DOI/ID/정규화 제목이 같으면 새 레코드로 교체)"""
+    merged = list(previous)
+    positions = {}
+    for i, paper in enumerate(merged):
+        for key in _result_keys(paper):
+            positions.setdefault(key, i)
+    for paper in delta:
+        keys = _result_keys(paper)
+        i = next((positions[key] for key in keys if key in positions), None)
+        if i is None:
+            i = len(merged)
+            merged.append(paper)
+        else:
+            merged[i] = paper
+        for key in keys:
+            positions.setdefault(key, i)
+    return merged
+
+def fetch_citations(results: List[Dict]) -> Dict[str, int]:
+    """결과 논문들의 현재 인용수를 소스별 일괄 조회 (ID -> 인용수)"""
+    ss_ids = [r["id"] for r in results if r.get("source") == "Semantic Scholar" and r.get("id")]
+    oa_ids = [r["id"] for r in results if r.get("source") == "OpenAlex" and r.get("id")]
+    citations = {}
+    if ss_ids:
+        citations.update(fetch_semantic_scholar_citations(ss_ids))
+    if oa_ids:
+        citations.update(fetch_openalex_citations(oa_ids))
+    return citations
+
+def apply_citations(results: List[Dict], citations: Dict[str, int]) -> int:
+    """
+    조회한 인용수를 결과에 반영하고, 바뀐 논문 수를 반환
+    
+    병합된 논문의 인용수는 소스별 값 중 최댓값이고 조회는 대표 ID의 소스 한 곳만 하므로,
+    기존 값보다 클 때만 바꿈
+    """
+    changed = 0
+    for r in results:
+        count = citations.get(r.get("id"))
+        if count is not None and count > (r.get("citations") or 0):
+            r["citations"] = count
+            changed += 1
+    return changed
+
+def refresh_citations(results: List[Dict]) -> int:
+    """결과의 인용수를 소스별 일괄 조회로 갱신하고, 바뀐 논문 수를 반환"""
+    return apply_citations(results, fetch_citations(results))
+
+def run_watch(name: str, keywords: List[str], target_journals: List[str], **search_kwargs) -> Dict:
+    """
+    저장된 검색 실행
+    
+    처음이거나 검색 조건이 바뀌었으면 전체 검색, 아니면 소스별 기준 날짜 이후 논문만 받아
+    기존 결과에 합치고 기존 논문의 인용수를 일괄 갱신함
+    
+    반환: watch 레코드 + run 정보(mode, new, citations_updated, requests)
+    """
+    search_kwargs.pop("year_end", None)  # watch는 항상 올해까지
+    params = {key: search_kwargs.get(key) for key in WATCH_PARAMS}
+    params["target_journals"] = list(target_journals)
+    search_source = search_kwargs.get("search_source") or "both"
+    sources = ["semantic", "openalex"] if search_source == "both" else [search_source]
+    
+    lock = _watch_lock(name)
+    requests_before = get_http_stats()["total"]["requests"]
+    today = date.today()
+    
+    with lock:
+        watch = load_watch(name)
+    incremental = (
+        watch is not None
+        and watch["keywords"] == list(keywords)
+        and watch["params"] == params
+        and all(watch["high_water"].get(source) for source in sources)
+    )
+    
+    # 네트워크 요청은 잠금 밖에서 (같은 watch를 동시에 실행해도 서로 기다리지 않음)
+    if incremental:
+        since = {
+            source: (date.fromisoformat(watch["high_water"][source]) - timedelta(days=WATCH_OVERLAP_DAYS)).isoformat()
+            for source in sources
+        }
+        delta_set = search_and_filter(keywords, target_journals, since=since, use_corpus=False, **search_kwargs)
+        missing = delta_set.meta.get("missing", [])
+        delta = delta_set.to_dicts()
+        citations = fetch_citations(watch["results"])
+    else:
+        result_set = search_and_filter(keywords, target_journals, **search_kwargs)
+        missing = result_set.meta.get("missing", [])
+        results = result_set.to_dicts()
+    
+    with lock:
+        # 그 사이 다른 실행이 저장했으면 그 결과에 합침
+        current = load_watch(name)
+        if incremental and current is not None and current["params"] == params and current["keywords"] == list(keywords):
+            watch = current
+        if incremental:
+            previous = watch["results"]
+            known_keys = {key for paper in previous for key in _result_keys(paper)}
+            new_count = sum(1 for paper in delta if not any(key in known_keys for key in _result_keys(paper)))
+            citations_updated = apply_citations(previous, citations)
+            results = merge_results(previous, delta)
+        else:
+            new_count = len(results)
+            citations_updated = 0
+            watch = {"name": name, "created_at": today.isoformat()}
+        
+        results.sort(key=lambda x: (PRIORITY_ORDER.get(x.get("priority"), 3), -(x.get("citations") or 0)))
+        # 일부 페이지를 받지 못한 소스는 기준 날짜를 옮기지 않아 다음 실행에서 다시 받음
+        missing_sources = {entry["source"] for entry in missing}
+        previous_high_water = watch.get("high_water", {})
+        watch.update({
+            "keywords": list(keywords),
+            "params": params,
+            "high_water": {
+                source: previous_high_water.get(source) if source in missing_sources else today.isoformat()
+                for source in sources
+            },
+            "results": results,
+            "updated_at": today.isoformat(),
+        })
+        save_watch(watch)
+    
+    watch["run"] = {
+        "mode": "incremental" if incremental else "full",
+        "new": new_count,
+        "citations_updated": citations_updated,
+        "missing": missing,
+        "requests": get_http_stats()["total"]["requests"] - requests_before,
+    }
+    return watch